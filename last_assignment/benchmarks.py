@@ -0,0 +1,464 @@
+"""Microbenchmarks for the SWAPI/Wookieepedia conversion pipeline. Each benchmark times one
+or more implementations against the local data files (no remote requests are issued) and
+reports the best per-call time in microseconds.
+
+Usage:
+    python3 benchmarks.py
+    python3 benchmarks.py converters --number 200 --repeat 7
+"""
+
+import argparse
+import collections
+import five_oh_six as utl
+import last_assignment as la
+import os
+import shutil
+import tempfile
+import timeit
+
+
+# Constants
+NUMBER = 100
+REPEAT = 5
+
+
+def benchmark_scalars(number=NUMBER, repeat=REPEAT):
+    """Compares each scalar converter in < five_oh_six > with the reference (try/except only)
+    implementation it replaced, over a mix of numeric, non-numeric, and < None > inputs
+    typical of the SWAPI and Wookieepedia data.
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+
+    Returns:
+        list: result rows
+    """
+
+    numbers = ['10465', '5,000,000', '304', '0.98', 'unknown', 'N/A', 'none', '', None, 12120, 2.5]
+    cases = [
+        ("to_float", utl.to_float, reference_to_float, [(value,) for value in numbers]),
+        ("to_int", utl.to_int, reference_to_int, [(value,) for value in numbers]),
+        ("to_gravity_value", utl.to_gravity_value, reference_to_gravity_value, [(value,) for value in ['1 standard', '0.98', 'N/A', 'unknown', None]]),
+        ("to_list", utl.to_list, reference_to_list, [(value, ', ') for value in ['arid, hot', 'desert', None, 'unknown']]),
+        ("to_none", utl.to_none, reference_to_none, [(value, la.NONE_VALUES) for value in ['unknown', 'Tatooine', 'n/a', '10465', None, 5]]),
+        ("to_year_era", utl.to_year_era, reference_to_year_era, [(value,) for value in ['19BBY', '896BBY', 'unknown', None]])
+    ]
+
+    rows = []
+    for name, function, reference, args in cases:
+        rows.append(time_call(f"{name} (reference)", lambda: [reference(*arg) for arg in args], len(args), number * 10, repeat))
+        rows.append(time_call(f"{name}", lambda: [function(*arg) for arg in args], len(args), number * 10, repeat))
+    return rows
+
+
+def benchmark_converters(number=NUMBER, repeat=REPEAT):
+    """Compares the compiled converters returned by < create_converter() > with
+    < reference_convert() >, which interprets the same < ENTITY_TYPES > mappings key by key
+    with the same < utl.to_*() > scalar converters. Each implementation converts every Wookieepedia
+    droid, planet, and starship record, and both must return the same records.
+
+    The hand-written < create_*() > builders are not timed because they do different work and
+    their output differs from the fixtures: < create_droid() > splits lists on a fullwidth
+    "｜" (the data uses "|"), < create_starship() > returns after its first key, and
+    < create_planet() > converts < none_values > after splitting lists (an empty climate
+    becomes [''] rather than None).
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+
+    Returns:
+        list: result rows
+    """
+
+    datasets = {
+        "droid": utl.read_json('./data-wookieepedia_droids.json'),
+        "planet": utl.read_csv_to_dicts('./data-wookieepedia_planets.csv'),
+        "starship": utl.read_csv_to_dicts('./data-wookieepedia_starships.csv')
+    }
+
+    rows = []
+    for entity, records in datasets.items():
+        convert = la.create_converter(la.KEYS, entity)
+        if [convert(record) for record in records] != [reference_convert(entity, record) for record in records]:
+            raise AssertionError(f"{entity} converters disagree")
+        rows.append(time_call(f"{entity} reference", lambda: [reference_convert(entity, record) for record in records], len(records), number, repeat))
+        rows.append(time_call(f"{entity} compiled", lambda: [convert(record) for record in records], len(records), number, repeat))
+    return rows
+
+
+def benchmark_csv(number=NUMBER, repeat=REPEAT, scale=200):
+    """Compares reading the Clone Wars episodes file with < utl.read_csv_to_dicts() > against
+    streaming it with < utl.iter_csv_to_dicts() > (all columns, and two projected columns with
+    a converter). The file is replicated < scale > times into a temporary file.
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+        scale (int): dataset replication factor
+
+    Returns:
+        list: result rows
+    """
+
+    with open('./data-clone_wars_episodes.csv', encoding='utf-8', newline='') as file_obj:
+        header, *lines = file_obj.readlines()
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='', suffix='.csv', delete=False) as file_obj:
+        file_obj.write(header + ''.join(lines * scale))
+    filepath = file_obj.name
+    items = len(lines) * scale
+    number = max(number // 100, 1)
+    projection = {'columns': ['episode_title', 'episode_us_viewers_mm'], 'converters': {'episode_us_viewers_mm': utl.to_float}}
+    try:
+        return [
+            time_call("csv read (list of dicts)", lambda: utl.read_csv_to_dicts(filepath), items, number, repeat),
+            time_call("csv stream (all columns)", lambda: collections.deque(utl.iter_csv_to_dicts(filepath), maxlen=0), items, number, repeat),
+            time_call("csv stream (projected)", lambda: collections.deque(utl.iter_csv_to_dicts(filepath, **projection), maxlen=0), items, number, repeat),
+            time_call("csv stream (projected chunks)", lambda: collections.deque(utl.iter_csv_to_dicts(filepath, chunk_size=1000, **projection), maxlen=0), items, number, repeat)
+        ]
+    finally:
+        os.remove(filepath)
+
+
+def benchmark_episodes(number=NUMBER, repeat=REPEAT, scale=100):
+    """Compares converting the Clone Wars episodes row by row with < convert_episode_values() >
+    and finding the most viewed episode against the column-oriented
+    < convert_episode_columns() > (with and without NumPy). The dataset is replicated < scale >
+    times.
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+        scale (int): dataset replication factor
+
+    Returns:
+        list: result rows
+    """
+
+    columns = {key: column * scale for key, column in utl.read_csv_to_columns('./data-clone_wars_episodes.csv').items()}
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    number = max(number // 100, 1)
+    return [
+        time_call("episodes rows", lambda: la.get_most_viewed_episode(la.convert_episode_values([dict(row) for row in rows], la.NONE_VALUES)), len(rows), number, repeat),
+        time_call("episodes columns (lists)", lambda: la.get_most_viewed_episode(la.convert_episode_columns(columns, use_numpy=False)), len(rows), number, repeat),
+        time_call("episodes columns (numpy)", lambda: la.get_most_viewed_episode(la.convert_episode_columns(columns, use_numpy=True)), len(rows), number, repeat)
+    ]
+
+
+def benchmark_json_codec(number=NUMBER, repeat=REPEAT):
+    """Compares encoding and decoding the NYT articles and the cache with each available JSON
+    codec (the standard library codec and, if installed, orjson). The cache snapshot is padded
+    with the Wookieepedia people keyed by SWAPI URL so it resembles a warm cache.
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+
+    Returns:
+        list: result rows
+    """
+
+    articles = utl.read_json('./data-nyt_star_wars_articles.json')
+    cache = utl.read_json(la.CACHE_FILEPATH)
+    for i, person in enumerate(utl.read_json('./data-wookieepedia_people.json'), 1):
+        cache[utl.create_cache_key(f"{la.SWAPI_PEOPLE}{i}/")] = person
+    number = max(number // 10, 1)
+    rows = []
+    for name in ('json', 'orjson'):
+        if name == 'orjson' and utl.orjson is None:
+            continue
+        codec = utl.JSON_CODECS[name]()
+        for label, data, kwargs in (
+            ("articles", articles, {'indent': 2}),
+            ("cache", cache, {'compact': True})
+        ):
+            text = codec.dumps(data, **kwargs).encode('utf-8') # as read by read_json()
+            rows.extend([
+                time_call(f"{label} dumps ({name})", lambda: codec.dumps(data, **kwargs), len(data), number, repeat),
+                time_call(f"{label} loads ({name})", lambda: codec.loads(text), len(data), number, repeat)
+            ])
+    return rows
+
+
+def benchmark_json_stream(number=NUMBER, repeat=REPEAT):
+    """Compares decoding the NYT articles with < utl.read_json() > against streaming them with
+    < utl.iter_json_array() > (whole articles, and projected to < la.NYT_ARTICLE_PATHS >).
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+
+    Returns:
+        list: result rows
+    """
+
+    filepath = './data-nyt_star_wars_articles.json'
+    items = len(utl.read_json(filepath))
+    number = max(number // 10, 1)
+    return [
+        time_call("articles read_json", lambda: utl.read_json(filepath), items, number, repeat),
+        time_call("articles stream", lambda: collections.deque(utl.iter_json_array(filepath), maxlen=0), items, number, repeat),
+        time_call("articles stream (projected)", lambda: collections.deque(utl.iter_json_array(filepath, la.NYT_ARTICLE_PATHS), maxlen=0), items, number, repeat)
+    ]
+
+
+def benchmark_join(number=NUMBER, repeat=REPEAT, size=1000):
+    """Compares enriching every Wookieepedia person record-at-a-time with
+    < utl.get_nested_dict() > against a single < utl.HashJoin > pass. The people stand in for
+    the SWAPI catalog so that no remote requests are issued; < size > synthetic people are
+    added to both sides.
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+        size (int): synthetic records added
+
+    Returns:
+        list: result rows
+    """
+
+    people = utl.read_json('./data-wookieepedia_people.json') + [{"name": f"Clone trooper CT-{i}"} for i in range(size)]
+    catalog = [{"name": person["name"].upper()} for person in people]
+    number = max(number // 100, 1)
+    return [
+        time_call("people enrich (scan)", lambda: [(record, utl.get_nested_dict(people, "name", record["name"])) for record in catalog], len(catalog), number, repeat),
+        time_call("people enrich (hash join)", lambda: list(utl.HashJoin(catalog, people, "name")), len(catalog), number, repeat)
+    ]
+
+
+def benchmark_lookups(number=NUMBER, repeat=REPEAT):
+    """Compares looking up every Wookieepedia planet by name with a linear
+    < utl.get_nested_dict() > scan of the list against a lookup in a < utl.DictIndex >, and
+    a diameter range query by scan against a < utl.RangeIndex >.
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+
+    Returns:
+        list: result rows
+    """
+
+    planets = utl.read_csv_to_dicts('./data-wookieepedia_planets.csv')
+    index = utl.DictIndex(planets, "name")
+    names = [planet["name"].upper() for planet in planets]
+    converted = la.create_planets(la.KEYS, planets).to_dicts()
+    diameters = utl.RangeIndex(converted, "diameter_km")
+    return [
+        time_call("name lookup (scan)", lambda: [utl.get_nested_dict(planets, "name", name) for name in names], len(names), number, repeat),
+        time_call("name lookup (index)", lambda: [utl.get_nested_dict(index, "name", name) for name in names], len(names), number, repeat),
+        time_call("diameter range (scan)", lambda: [planet for planet in converted if planet["diameter_km"] is not None and 10000 <= planet["diameter_km"] <= 12500], 1, number, repeat),
+        time_call("diameter range (index)", lambda: diameters.range(10000, 12500), 1, number, repeat)
+    ]
+
+
+def benchmark_ndjson(number=NUMBER, repeat=REPEAT):
+    """Compares writing (and reading back) the NYT articles with < utl.write_json() > and
+    < utl.read_json() > against < utl.write_ndjson() > and < utl.iter_ndjson() >.
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+
+    Returns:
+        list: result rows
+    """
+
+    articles = utl.read_json('./data-nyt_star_wars_articles.json')
+    directory = tempfile.mkdtemp()
+    json_filepath, ndjson_filepath = os.path.join(directory, 'articles.json'), os.path.join(directory, 'articles.ndjson')
+    number = max(number // 10, 1)
+    try:
+        return [
+            time_call("articles write_json", lambda: utl.write_json(json_filepath, articles), len(articles), number, repeat),
+            time_call("articles write_ndjson", lambda: utl.write_ndjson(ndjson_filepath, articles), len(articles), number, repeat),
+            time_call("articles read_json", lambda: utl.read_json(json_filepath), len(articles), number, repeat),
+            time_call("articles iter_ndjson", lambda: collections.deque(utl.iter_ndjson(ndjson_filepath), maxlen=0), len(articles), number, repeat)
+        ]
+    finally:
+        shutil.rmtree(directory)
+
+
+def benchmark_planet_batch(number=NUMBER, repeat=REPEAT, scale=1000):
+    """Compares converting the Wookieepedia planets row by row with the compiled converter
+    against converting them column by column with < create_planets() > (with and without
+    NumPy). The dataset is replicated < scale > times.
+
+    Parameters:
+        number (int): calls per timing run
+        repeat (int): timing runs
+        scale (int): dataset replication factor
+
+    Returns:
+        list: result rows
+    """
+
+    rows = utl.read_csv_to_dicts('./data-wookieepedia_planets.csv') * scale
+    columns = utl.to_columns(rows)
+    convert = la.create_converter(la.KEYS, "planet")
+    number = max(number // 100, 1)
+    return [
+        time_call("planet compiled rows", lambda: [convert(row) for row in rows], len(rows), number, repeat),
+        time_call("planet batch (lists)", lambda: la.create_planets(la.KEYS, columns, use_numpy=False), len(rows), number, repeat),
+        time_call("planet batch (numpy)", lambda: la.create_planets(la.KEYS, columns, use_numpy=True), len(rows), number, repeat)
+    ]
+
+
+def print_rows(name, rows):
+    """Prints benchmark result rows as an aligned table.
+
+    Parameters:
+        name (str): benchmark name
+        rows (list): result rows
+
+    Returns:
+        None
+    """
+
+    print(f"\n{name}")
+    for label, per_call, per_item in rows:
+        print(f"  {label:<32} {per_call:>12.2f} us/call {per_item:>10.3f} us/item")
+
+
+# Reference implementation of the compiled entity converters (one dispatch per key)
+
+def reference_convert(entity, record, none_values=la.NONE_VALUES):
+    converted = {}
+    for key, new_key in la.KEYS[entity].items():
+        type_name, arg = la.ENTITY_TYPES[entity][key], None
+        if isinstance(type_name, tuple):
+            type_name, arg = type_name
+        value = record.get(key)
+        if type_name == 'raw':
+            converted[new_key] = value
+        elif type_name == 'str':
+            converted[new_key] = utl.to_none(value, none_values)
+        elif type_name == 'int':
+            converted[new_key] = utl.to_int(utl.to_none(value, none_values))
+        elif type_name == 'float':
+            converted[new_key] = utl.to_float(utl.to_none(value, none_values))
+        elif type_name == 'gravity':
+            converted[new_key] = utl.to_gravity_value(utl.to_none(value, none_values))
+        elif type_name == 'list':
+            converted[new_key] = utl.to_list(utl.to_none(value, none_values), arg)
+        elif type_name == 'year_era':
+            converted[new_key] = utl.to_year_era(utl.to_none(value, none_values))
+        else:
+            raise ValueError(f"Unexpected converter type: {type_name}")
+    return converted
+
+
+# Reference implementations (try/except only) of the < five_oh_six > scalar converters
+
+def reference_to_float(value):
+    try:
+        return float(value.replace(',', ''))
+    except:
+        return value
+
+
+def reference_to_gravity_value(value):
+    try:
+        if "standard" in value.lower():
+            return reference_to_float(value[:value.lower().index('standard')].strip())
+        return reference_to_float(value)
+    except:
+        return value
+
+
+def reference_to_int(value):
+    try:
+        return int(reference_to_float(value))
+    except:
+        return value
+
+
+def reference_to_list(value, delimiter=None):
+    try:
+        if delimiter:
+            return value.strip().split(delimiter)
+        else:
+            return value.strip().split()
+    except:
+        return value
+
+
+def reference_to_none(value, none_values):
+    try:
+        if value.strip().lower() in [value.lower() for value in none_values]:
+            return None
+        return value
+    except:
+        return value
+
+
+def reference_to_year_era(value):
+    try:
+        if value[:-3].isdigit():
+            year = int(value[:-3])
+            era = value[-3:]
+            return {'year': year, 'era': era}
+        else:
+            return value
+    except:
+        return value
+
+
+def time_call(label, func, items=1, number=NUMBER, repeat=REPEAT):
+    """Times the passed in < func > and returns the best run as a result row.
+
+    Parameters:
+        label (str): implementation label
+        func (function): zero-argument callable to time
+        items (int): items processed per call
+        number (int): calls per timing run
+        repeat (int): timing runs
+
+    Returns:
+        tuple: label, microseconds per call, microseconds per item
+    """
+
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+    return label, best, best / max(items, 1)
+
+
+BENCHMARKS = {
+    "converters": benchmark_converters,
+    "csv": benchmark_csv,
+    "episodes": benchmark_episodes,
+    "join": benchmark_join,
+    "json_codec": benchmark_json_codec,
+    "json_stream": benchmark_json_stream,
+    "lookups": benchmark_lookups,
+    "ndjson": benchmark_ndjson,
+    "planet_batch": benchmark_planet_batch,
+    "scalars": benchmark_scalars
+}
+
+
+def main():
+    """Runs the selected benchmarks (all by default).
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('names', nargs='*', help=f"benchmarks to run: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--number', type=int, default=NUMBER)
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    args = parser.parse_args()
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"Unexpected benchmark: {name}")
+
+    for name in args.names or BENCHMARKS:
+        print_rows(name, BENCHMARKS[name](args.number, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
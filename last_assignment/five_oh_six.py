@@ -1,52 +1,2103 @@
+import asyncio
+import bisect
+import codecs
 import csv
+import hashlib
+import itertools
 import json
+import math
+import operator
+import os
+import random
 import requests
+import sqlite3
+import threading
+import time
+
+from collections import ChainMap, OrderedDict
+from collections.abc import MutableMapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib.parse import quote, urlencode, urljoin, urlsplit
+
+try:
+    import numpy as np
+except ImportError: # optional; columnar batches fall back to lists
+    np = None
+
+try:
+    import orjson
+except ImportError: # optional; JSON falls back to the standard library codec
+    orjson = None
+
+
+# JSON codec
+
+class JSONCodec:
+    """JSON codec backed by the standard library < json > module. Used for all JSON read and
+    written by this module (see < json_codec >). < dumps() > returns a string formatted like
+    json.dumps(); if < compact > is True no whitespace is emitted (used for machine-only files
+    such as the cache snapshot, journal, and NDJSON files).
+    """
+
+    name = 'json'
+
+    def __init__(self):
+        self.compact_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    def dumps(self, value, indent=None, ensure_ascii=False, compact=False):
+        """Encodes < value > as a JSON string."""
+
+        if compact:
+            if not ensure_ascii:
+                return self.compact_encoder.encode(value)
+            return json.dumps(value, separators=(',', ':'))
+        return json.dumps(value, ensure_ascii=ensure_ascii, indent=indent)
+
+    def loads(self, text):
+        """Decodes a JSON string (or UTF-8 bytes)."""
+
+        return json.loads(text)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by the optional < orjson > package. Produces documents that decode to
+    the same values as < JSONCodec > (whitespace and float notation may differ, e.g., "1e16"
+    rather than "1e+16"). Anything orjson would handle differently is handed to < JSONCodec >:
+    options orjson does not support (< ensure_ascii >, indents other than 2), NaN and Infinity
+    (which orjson would write as null), integers wider than 64 bits (which orjson would decode
+    as floats), and NaN literals when decoding.
+    """
+
+    name = 'orjson'
+    digits = bytes.maketrans(b'123456789', b'000000000') # maps every digit to 0
+    wide_digits = b'0' * 19 # 19+ digit runs may exceed 64 bits
+
+    def dumps(self, value, indent=None, ensure_ascii=False, compact=False):
+        if not ensure_ascii and (compact or indent in (None, 2)):
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent and not compact else 0)
+            try:
+                content = orjson.dumps(value, option=option)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                if b'null' not in content or self.is_finite(value):
+                    return content.decode('utf-8')
+        return super().dumps(value, indent, ensure_ascii, compact)
+
+    @staticmethod
+    def is_finite(value):
+        """Returns True if < value > contains no NaN or Infinity floats."""
+
+        stack = [value]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, dict):
+                value = value.values()
+            elif isinstance(value, float):
+                if not math.isfinite(value):
+                    return False
+                continue
+            elif not isinstance(value, (list, tuple)):
+                continue
+            for item in value:
+                kind = type(item)
+                if kind is float:
+                    if not math.isfinite(item):
+                        return False
+                elif kind is not str and kind is not int and item is not None: # skip common scalars
+                    stack.append(item)
+        return True
+
+    def loads(self, text):
+        content = text.encode('utf-8') if isinstance(text, str) else text
+        if self.wide_digits in content.translate(self.digits):
+            return super().loads(text)
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().loads(text)
+
+
+JSON_CODECS = {'json': JSONCodec, 'orjson': OrjsonCodec}
+json_codec = OrjsonCodec() if orjson is not None else JSONCodec() # see configure_json_codec()
+
+
+# Journaled cache
+CACHE_JOURNAL_SUFFIX = '.journal'
+CACHE_JOURNAL_MIN_BYTES = 1024 * 1024 # compaction floor
+CACHE_META_PREFIX = 'meta:'
+CACHE_WRITE_LOCK = threading.RLock() # serializes cache writes across threads
+
+# HTTP session
+SESSION_POOL_CONNECTIONS = 10 # number of hosts whose connection pools are retained
+SESSION_POOL_MAXSIZE = 10 # keep-alive connections retained per host
+session = None # shared requests.Session; created on first use by get_session()
+session_lock = threading.Lock()
+session_pid = None
+
+# Read-only resources
+
+class FrozenDict(dict):
+    """Read-only dictionary. Any attempt to add, replace, or remove a key-value pair raises a
+    < TypeError >. Because the contents cannot change, copying (shallow or deep) returns the
+    same object. Remains a < dict > so it can be serialized as JSON without conversion.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list. Any attempt to add, replace, reorder, or remove an element raises a
+    < TypeError >. Because the contents cannot change, copying (shallow or deep) returns the
+    same object. Remains a < list > so it can be serialized as JSON without conversion.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+class RecordView(ChainMap):
+    """Read-only, layered view of one or more record dictionaries (e.g., a Wookieepedia record
+    layered over a SWAPI record). Each key is resolved from the first layer that contains it;
+    < None > layers are skipped. The layers are referenced, not copied, and any attempt to
+    add, replace, or remove a key-value pair through the view raises a < TypeError >.
+
+    A view may itself be used as a layer of another view.
+    """
+
+    def __init__(self, *layers):
+        super().__init__(*[layer for layer in layers if layer is not None])
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __getitem__(self, key):
+        for layer in self.maps:
+            if key in layer:
+                return layer[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        for layer in self.maps:
+            if key in layer:
+                return layer[key]
+        return default
+
+
+# In-memory LRU tier
+
+class LRUCache(MutableMapping):
+    """Size-bounded, least recently used (LRU) in-memory tier placed in front of a persistent
+    cache < backend > (e.g., a < SQLiteCache >). Entries read from or written to the backend are
+    retained in memory until either < max_entries > or < max_bytes > is exceeded, at which point
+    the least recently used entries are evicted from memory. Evicted entries remain available
+    in the backend.
+
+    The approximate size of an entry is the length of its compact JSON encoding. Hits, misses,
+    and evictions are counted; call < stats() > to retrieve the counts.
+
+    WARN: The tier only bounds memory if the backend reads entries from disk on demand. A plain
+    dictionary (the JSON cache) already holds every entry in memory, so < create_cache() >
+    rejects limits for it.
+
+    Parameters:
+        backend (MutableMapping): persistent cache that holds every entry
+        max_entries (int): maximum number of entries held in memory; None for no limit
+        max_bytes (int): approximate maximum size of entries held in memory; None for no limit
+    """
+
+    def __init__(self, backend, max_entries=None, max_bytes=None):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+
+    def _admit(self, key, value):
+        """Adds an entry to the in-memory tier and evicts least recently used entries until the
+        tier is within its limits. The most recently admitted entry is never evicted.
+
+        Parameters:
+            key (str): cache key
+            value (dict|list): cached resource
+
+        Returns:
+            None
+        """
+
+        size = len(json_codec.dumps(value, compact=True)) if self.max_bytes is not None else 0
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.bytes += size
+            while len(self._entries) > 1 and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+                ):
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _discard(self, key):
+        if key in self._entries:
+            del self._entries[key]
+            self.bytes -= self._sizes.pop(key)
+
+    def __contains__(self, key):
+        return key in self._entries or key in self.backend
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._discard(key)
+        del self.backend[key]
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = self.backend[key]
+        self._admit(key, value)
+        return value
+
+    def __iter__(self):
+        return iter(self.backend)
+
+    def __len__(self):
+        return len(self.backend)
+
+    def __setitem__(self, key, value):
+        self.backend[key] = value
+        self._admit(key, value)
+
+    def stats(self):
+        """Returns the in-memory tier's hit, miss, and eviction counts along with its current
+        size.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: counts structured as {'hits': < int >, 'misses': < int >, 'evictions': < int >,
+                  'entries': < int >, 'bytes': < int >}
+        """
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.bytes
+            }
+
+
+# Request coalescing
+
+class SingleFlight:
+    """Coalesces concurrent calls that share the same key (e.g., a key minted by
+    < create_cache_key() >) so that only one call does the work. The first caller (the
+    "leader") invokes the function; callers that arrive with the same key while the leader's
+    call is in flight wait for and receive the leader's result (or exception) instead of
+    invoking the function themselves.
+
+    Threads call < do() > and asyncio coroutines await < do_async() >. Both share the same
+    in-flight table, so a coroutine and a thread requesting the same key are also coalesced.
+    The number of calls that were served by another caller's result is kept in < shared >; the
+    number of callers currently waiting on an in-flight call is returned by < waiters() >.
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._calls = {}
+        self._waiters = {}
+        self._lock = threading.Lock()
+
+    def _join(self, key):
+        """Returns the in-flight future for < key > and whether the caller is the leader. A new
+        future is registered if no call is in flight.
+
+        Parameters:
+            key (str): call key
+
+        Returns:
+            tuple: (< future >, < is_leader >)
+        """
+
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                return future, True
+            self.shared += 1
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+            return future, False
+
+    def _settle(self, key, future, result=None, exception=None):
+        with self._lock:
+            del self._calls[key]
+            self._waiters.pop(key, None)
+        if exception is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exception)
+
+    def do(self, key, func, *args, **kwargs):
+        """Calls < func > with the passed in arguments unless a call keyed by < key > is already in
+        flight, in which case the calling thread blocks until that call completes.
+
+        Parameters:
+            key (str): call key
+            func (function): function to be called by the leader
+            args (tuple): positional arguments passed to < func >
+            kwargs (dict): keyword arguments passed to < func >
+
+        Returns:
+            any: value returned by the leader's call to < func >
+        """
+
+        future, is_leader = self._join(key)
+        if not is_leader:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exception:
+            self._settle(key, future, exception=exception)
+            raise
+        self._settle(key, future, result)
+        return result
+
+    async def do_async(self, key, func, *args, **kwargs):
+        """Awaits the coroutine function < func > with the passed in arguments unless a call keyed
+        by < key > is already in flight, in which case the calling coroutine awaits the result of
+        that call without blocking the event loop.
+
+        Parameters:
+            key (str): call key
+            func (coroutine function): coroutine function awaited by the leader
+            args (tuple): positional arguments passed to < func >
+            kwargs (dict): keyword arguments passed to < func >
+
+        Returns:
+            any: value returned by the leader's call to < func >
+        """
+
+        future, is_leader = self._join(key)
+        if not is_leader:
+            return await asyncio.wrap_future(future)
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as exception:
+            self._settle(key, future, exception=exception)
+            raise
+        self._settle(key, future, result)
+        return result
+
+    def waiters(self, key):
+        """Returns the number of callers waiting on the in-flight call keyed by < key > (excluding
+        the leader). Returns 0 if no call is in flight.
+
+        Parameters:
+            key (str): call key
+
+        Returns:
+            int: number of waiting callers
+        """
+
+        with self._lock:
+            return self._waiters.get(key, 0)
+
+
+# Resilience
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected without being sent because the circuit breaker for
+    the request's host is open.
+    """
+
+
+class CircuitBreaker:
+    """Fails fast when a remote host is unhealthy. The breaker starts "closed" and lets every
+    request through. After < failure_threshold > consecutive failures it "opens" and rejects
+    requests by raising a < CircuitOpenError > until < reset_timeout > seconds have elapsed.
+    It then turns "half_open" and lets a single trial request through: if the trial succeeds
+    the breaker closes; if it fails the breaker opens again. Callers must call < release() >
+    once a request ends (e.g., in a finally block) so that a trial that ended without a
+    recorded success or failure does not block every later request.
+
+    Successes, failures, rejections, and trips (closed/half_open -> open) are counted; call
+    < stats() > to retrieve the counts.
+
+    Parameters:
+        failure_threshold (int): consecutive failures that open the breaker
+        reset_timeout (float): seconds the breaker remains open before a trial request
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.successes = 0
+        self.failures = 0
+        self.rejections = 0
+        self.trips = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Checks whether a request may be sent. Raises a < CircuitOpenError > if the breaker is
+        open or if a half-open trial request is already in flight.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if self.state == 'open' and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                self._trial_in_flight = False
+            if self.state == 'open' or (self.state == 'half_open' and self._trial_in_flight):
+                self.rejections += 1
+                raise CircuitOpenError(f"Circuit open; retry after {self.reset_timeout}s")
+            if self.state == 'half_open':
+                self._trial_in_flight = True
+
+    def release(self):
+        """Ends the half-open trial request, if any, admitted by < before_call() >. Safe to
+        call after < record_failure() > or < record_success() >.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Records a failed request and opens the breaker if the failure threshold is reached or
+        if the failed request was a half-open trial.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.state == 'half_open' or (
+                self.state == 'closed' and self.consecutive_failures >= self.failure_threshold
+                ):
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+                self.trips += 1
+
+    def record_success(self):
+        """Records a successful request and closes the breaker.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            self.state = 'closed'
+
+    def stats(self):
+        """Returns the breaker's state along with its success, failure, rejection, and trip
+        counts.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: state and counts
+        """
+
+        return {
+            'state': self.state,
+            'successes': self.successes,
+            'failures': self.failures,
+            'rejections': self.rejections,
+            'trips': self.trips
+            }
+
+
+class RetryPolicy:
+    """Describes how failed requests are retried. A request is retried if it raises one of
+    < retry_exceptions > (by default connection errors and timeouts) or if the response status
+    code is one of < retry_statuses >, up to < max_attempts > attempts in total. Other
+    exceptions (e.g., < requests.exceptions.MissingSchema >, < requests.exceptions.InvalidURL >)
+    are permanent and are raised immediately.
+
+    Retries are delayed using exponential backoff with "full jitter": the delay before retry n
+    is a random number of seconds between 0 and min(< max_backoff >, < backoff > * 2 ** (n - 1)).
+    A numeric "Retry-After" response header takes precedence over the computed delay.
+
+    Attempts, retries, and give-ups (requests that failed on their final attempt) are counted;
+    call < stats() > to retrieve the counts.
+
+    Parameters:
+        max_attempts (int): maximum number of attempts per request (1 disables retries)
+        backoff (float): base delay in seconds
+        max_backoff (float): maximum delay in seconds
+        retry_statuses (tuple): response status codes that trigger a retry
+        retry_exceptions (tuple): exception types that trigger a retry
+    """
+
+    def __init__(self, max_attempts=3, backoff=0.5, max_backoff=10.0,
+                 retry_statuses=(429, 500, 502, 503, 504),
+                 retry_exceptions=(requests.ConnectionError, requests.Timeout)):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.retry_exceptions = retry_exceptions
+        self.attempts = 0
+        self.retries = 0
+        self.give_ups = 0
+        self._lock = threading.Lock()
+
+    def get_delay(self, retry, retry_after=None):
+        """Returns the number of seconds to wait before the passed in < retry > (1, 2, ...).
+
+        Parameters:
+            retry (int): retry number
+            retry_after (str): optional "Retry-After" response header value
+
+        Returns:
+            float: delay in seconds
+        """
+
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (retry - 1)))
+
+    def count(self, name):
+        """Increments the named counter (i.e., 'attempts', 'retries', or 'give_ups').
+
+        Parameters:
+            name (str): counter name
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self):
+        """Returns the policy's attempt, retry, and give-up counts.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: counts
+        """
+
+        return {'attempts': self.attempts, 'retries': self.retries, 'give_ups': self.give_ups}
+
+
+class TokenBucket:
+    """Token-bucket rate limiter. Tokens are added at < rate > tokens per second up to
+    < capacity >; each request consumes one token. If no token is available the caller
+    sleeps until one is, so requests are spread out at < rate > per second while short
+    bursts of up to < capacity > requests are sent without delay.
+
+    Acquisitions, waits, and the total time spent waiting are counted; call < stats() > to
+    retrieve the counts.
+
+    A < rate > that is not positive or a < capacity > below one token (neither could ever
+    grant a request) raises a ValueError.
+
+    Parameters:
+        rate (float): tokens added per second
+        capacity (float): maximum number of tokens; defaults to max(1, < rate >)
+    """
+
+    def __init__(self, rate, capacity=None):
+        if not rate > 0:
+            raise ValueError(f"Invalid rate: {rate} (must be > 0 tokens per second)")
+        if capacity is not None and not capacity >= 1:
+            raise ValueError(f"Invalid capacity: {capacity} (must be >= 1 token)")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.acquired = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Consumes one token, sleeping until a token is available if necessary.
+
+        Parameters:
+            None
+
+        Returns:
+            float: seconds spent waiting
+        """
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.acquired += 1
+                    if waited:
+                        self.waits += 1
+                        self.wait_time += waited
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def stats(self):
+        """Returns the bucket's acquisition and wait counts.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: counts
+        """
+
+        return {
+            'acquired': self.acquired,
+            'waits': self.waits,
+            'wait_time': round(self.wait_time, 3),
+            'tokens': round(self.tokens, 3)
+            }
+
+
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30 # seconds
+REMOTE_ERRORS = (CircuitOpenError, requests.RequestException) # upstream unavailable
+active_failure_threshold = CIRCUIT_FAILURE_THRESHOLD # set by configure_resilience()
+active_reset_timeout = CIRCUIT_RESET_TIMEOUT
+active_rate_limits = {} # host -> requests per second or (requests per second, burst capacity); '*' = any host
+active_retry_policy = RetryPolicy()
+circuit_breakers = {} # host -> CircuitBreaker
+rate_limiters = {} # host -> TokenBucket
+resilience_lock = threading.Lock()
+
+
+# Record/replay
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request has no recorded exchange in the cassette."""
+
+
+class Cassette:
+    """Records HTTP exchanges sent by < send_request() > to a cassette file or replays them from
+    it. The cassette is a compact newline-delimited JSON file holding one exchange per line:
+
+    {"key": < str >, "status": < int >, "headers": {...}, "body": < str >}
+
+    The key is the cache key minted by < create_cache_key() > followed by any "If-None-Match"
+    and "If-Modified-Since" validators sent with the request. Only the response headers used by
+    this module (e.g., "ETag", "Last-Modified") are recorded.
+
+    In "record" mode every response returned by < send_request() > is appended to the cassette
+    as soon as it is received. In "replay" mode responses are served from the cassette and no
+    network I/O occurs; a request without a recorded exchange raises a < CassetteMissError >.
+
+    Parameters:
+        filepath (str): path to the cassette file
+        mode (str): 'record' or 'replay'
+    """
+
+    HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Retry-After')
+
+    def __init__(self, filepath, mode):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Invalid cassette mode: {mode}")
+        self.filepath = filepath
+        self.mode = mode
+        self.exchanges = {}
+        self._lock = threading.Lock()
+        try:
+            with open(filepath, 'r', encoding='utf-8') as file_obj:
+                for line in file_obj:
+                    if line.strip():
+                        exchange = json_codec.loads(line)
+                        self.exchanges[exchange['key']] = exchange
+        except FileNotFoundError:
+            if mode == 'replay':
+                raise
+
+    def create_key(self, url, params=None, headers=None):
+        """Returns the key that identifies an exchange.
+
+        Parameters:
+            url (str): a uniform resource locator that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+            headers (dict): optional request headers
+
+        Returns:
+            str: exchange key
+        """
+
+        headers = headers or {}
+        validators = [headers.get(name) for name in ('If-None-Match', 'If-Modified-Since')]
+        if any(validators):
+            return ' '.join([create_cache_key(url, params)] + [validator or '' for validator in validators])
+        return create_cache_key(url, params)
+
+    def record(self, url, params, headers, response):
+        """Appends the exchange to the cassette file.
+
+        Parameters:
+            url (str): a uniform resource locator that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+            headers (dict): request headers
+            response (requests.Response): response to be recorded
+
+        Returns:
+            None
+        """
+
+        exchange = {
+            'key': self.create_key(url, params, headers),
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in self.HEADERS if name in response.headers},
+            'body': response.text
+            }
+        with self._lock:
+            self.exchanges[exchange['key']] = exchange
+            with open(self.filepath, 'a', encoding='utf-8') as file_obj:
+                file_obj.write(f"{json_codec.dumps(exchange, compact=True)}\n")
+
+    def replay(self, url, params=None, headers=None):
+        """Returns the recorded response for the request. A conditional request for which only
+        the unconditional exchange was recorded is answered with that exchange.
+
+        Parameters:
+            url (str): a uniform resource locator that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+            headers (dict): optional request headers
+
+        Returns:
+            requests.Response: recorded response
+        """
+
+        exchange = self.exchanges.get(self.create_key(url, params, headers))
+        if exchange is None:
+            exchange = self.exchanges.get(create_cache_key(url, params))
+        if exchange is None:
+            raise CassetteMissError(f"No recorded exchange for {create_cache_key(url, params)} in {self.filepath}")
+
+        response = requests.Response()
+        response.status_code = exchange['status']
+        response.headers = CaseInsensitiveDict(exchange['headers'])
+        response.encoding = 'utf-8'
+        response.url = url
+        response._content = exchange['body'].encode('utf-8')
+        return response
+
+
+cassette = None # Cassette; set by configure_cassette()
+
+
+# Streaming JSON
+JSON_BUFFER_SIZE = 64 * 1024 # characters read per refill; doubled while an element is incomplete
+JSON_WHITESPACE = ' \t\n\r'
+JSON_DELIMITERS = frozenset(',:[]{}' + JSON_WHITESPACE) # characters that end a number or literal
+
+
+# Compiled converters
+CONVERTER_TYPES = {
+    'raw': '{value}',
+    'str': 'to_none({value}, none_values)',
+    'int': 'to_int(to_none({value}, none_values))',
+    'float': 'to_float(to_none({value}, none_values))',
+    'gravity': 'to_gravity_value(to_none({value}, none_values))',
+    'list': 'to_list(to_none({value}, none_values), {arg!r})',
+    'year_era': 'to_year_era(to_none({value}, none_values))'
+    }
+
+
+# Scalar converters
+FLOAT_WORDS = frozenset(('inf', 'infinity', 'nan')) # non-numeric strings accepted by float()
+NONE_VALUE_SETS = {} # none_values tuple -> lower cased set
+SCALAR_TYPES = (bool, float, int, type(None))
+
+
+# Columnar batches
+
+class RecordBatch(Sequence):
+    """Read-only sequence of converted records stored column-wise. Each column is either a list
+    or, for numeric columns converted with NumPy, a masked array (masked entries represent
+    < None >). Row dictionaries are only built when a row is accessed; NumPy columns are
+    converted back to lists of Python values (once) the first time a row is requested, so
+    materialized rows are identical to those returned by the single-record converters.
+
+    Attributes:
+        columns (dict): new key to column mappings (the key order is the row key order)
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.length = len(next(iter(columns.values()))) if columns else 0
+        self.values = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('RecordBatch index out of range')
+        if self.values is None:
+            self.values = [column.tolist() if np is not None and isinstance(column, np.ndarray) else column for column in self.columns.values()]
+        return dict(zip(self.columns, (column[index] for column in self.values)))
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return f"RecordBatch({len(self)} rows, columns={list(self.columns)})"
+
+    def column(self, key):
+        """Returns the column mapped to < key > as stored (list or masked array)."""
+
+        return self.columns[key]
+
+    def to_dicts(self):
+        """Returns every row as a new list of dictionaries."""
+
+        return self[:]
+
+
+# Indexes
+
+class DictIndex(Sequence):
+    """Hash index over a list of nested dictionaries that answers the case insensitive exact
+    match lookups performed by < get_nested_dict() > in constant time. The index is built once
+    per list and < key > and may be passed to < get_nested_dict() > (or any caller that accepts
+    the list) in place of the list; it iterates, indexes, and reports its length like the
+    wrapped list.
+
+    As with < get_nested_dict() > the first dictionary whose value matches is returned.
+    Dictionaries appended with < append() > are indexed incrementally.
+
+    Attributes:
+        data (list): indexed dictionaries
+        key (str): key that identifies the indexed value
+        index (dict): normalized value to first matching dictionary mappings
+    """
+
+    def __init__(self, data, key):
+        self.data = data
+        self.key = key
+        self.index = {}
+        for item in data:
+            self.add(item)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"DictIndex({len(self)} items, key={self.key!r})"
+
+    def add(self, item):
+        """Indexes < item > unless an earlier dictionary has the same normalized value."""
+
+        value = item.get(self.key, '')
+        if value is not None:
+            self.index.setdefault(str(value).lower(), item)
+
+    def append(self, item):
+        """Appends < item > to the wrapped list and indexes it. If the list is an
+        < IndexedList > that maintains this index the list indexes the item itself."""
+
+        self.data.append(item)
+        if not any(index is self for index in getattr(self.data, 'indexes', ())):
+            self.add(item)
+
+    def get(self, filter):
+        """Returns the first dictionary whose value matches < filter > (case insensitive);
+        otherwise None."""
+
+        return self.index.get(str(filter).lower())
+
+
+class CompositeIndex(DictIndex):
+    """Hash index over a list of nested dictionaries keyed on the values of several < keys >
+    (e.g., ('region', 'sector')). String values are compared case insensitively; other values
+    are compared as is. Unlike < DictIndex > every matching dictionary is retained; < find() >
+    returns all of them (in list order) and < get() > the first.
+
+    Attributes:
+        data (list): indexed dictionaries
+        keys (tuple): keys that identify the indexed values
+        index (dict): normalized value tuple to matching dictionaries mappings
+    """
+
+    def __init__(self, data, keys):
+        self.keys = tuple(keys)
+        super().__init__(data, self.keys)
+
+    def __repr__(self):
+        return f"CompositeIndex({len(self)} items, keys={self.keys!r})"
+
+    def add(self, item):
+        """Indexes < item >."""
+
+        self.index.setdefault(self.create_key(item.get(key) for key in self.keys), []).append(item)
+
+    def create_key(self, values):
+        """Returns the normalized index key for the passed in < values >."""
+
+        return tuple(value.lower() if isinstance(value, str) else value for value in values)
+
+    def find(self, *values):
+        """Returns every dictionary whose values match < values > (one per key)."""
+
+        return list(self.index.get(self.create_key(values), ()))
+
+    def get(self, *values):
+        """Returns the first dictionary whose values match < values >; otherwise None."""
+
+        items = self.index.get(self.create_key(values))
+        return items[0] if items else None
+
+
+class RangeIndex(DictIndex):
+    """Sorted index over the numeric values mapped to < key > in a list of nested dictionaries.
+    Answers equality, range, and nearest value queries by bisecting the sorted values.
+    Dictionaries whose value is not a number (e.g., < None >) are not indexed. Dictionaries
+    that share a value are returned in list order.
+
+    Attributes:
+        data (list): indexed dictionaries
+        key (str): key that identifies the indexed value
+        values (list): sorted values
+        items (list): dictionaries ordered by value
+    """
+
+    def __init__(self, data, key):
+        self.data = data
+        self.key = key
+        pairs = sorted(((item.get(key), item) for item in data if self.is_number(item.get(key))), key=lambda pair: pair[0])
+        self.values = [value for value, item in pairs]
+        self.items = [item for value, item in pairs]
+
+    def __repr__(self):
+        return f"RangeIndex({len(self.values)} of {len(self)} items, key={self.key!r})"
+
+    def add(self, item):
+        """Indexes < item > if its value is a number."""
+
+        value = item.get(self.key)
+        if self.is_number(value):
+            position = bisect.bisect_right(self.values, value)
+            self.values.insert(position, value)
+            self.items.insert(position, item)
+
+    def find(self, value):
+        """Returns every dictionary whose value equals < value >."""
+
+        return self.items[bisect.bisect_left(self.values, value):bisect.bisect_right(self.values, value)]
+
+    def get(self, value):
+        """Returns the first dictionary whose value equals < value >; otherwise None."""
+
+        position = bisect.bisect_left(self.values, value)
+        if position < len(self.values) and self.values[position] == value:
+            return self.items[position]
+        return None
+
+    def is_number(self, value):
+        """Returns True if < value > is an int or float (but not a bool or NaN)."""
+
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and value == value
+
+    def nearest(self, value):
+        """Returns the dictionary whose value is closest to < value > (the lower value wins a
+        tie); otherwise None if no dictionaries are indexed."""
+
+        if not self.values:
+            return None
+        position = bisect.bisect_left(self.values, value)
+        if position == len(self.values) or (position > 0 and value - self.values[position - 1] <= self.values[position] - value):
+            position = bisect.bisect_left(self.values, self.values[position - 1])
+        return self.items[position]
+
+    def range(self, low=None, high=None):
+        """Returns the dictionaries whose values fall between < low > and < high > (inclusive)
+        ordered by value. Either bound may be None (unbounded)."""
+
+        start = 0 if low is None else bisect.bisect_left(self.values, low)
+        stop = len(self.values) if high is None else bisect.bisect_right(self.values, high)
+        return self.items[start:stop]
+
+
+class IndexedList(list):
+    """List of nested dictionaries that keeps its indexes (e.g., < DictIndex >,
+    < CompositeIndex >, < RangeIndex >) up to date as dictionaries are appended. Indexes are
+    created on the list itself with < add_index() >. Dictionaries may be appended to the list
+    or to any of its indexes; either way each index adds them exactly once.
+
+    Attributes:
+        indexes (list): indexes maintained by the list
+    """
+
+    def __init__(self, data=()):
+        super().__init__(data)
+        self.indexes = []
+
+    def add_index(self, index_type, *args):
+        """Creates an index of < index_type > over the list (e.g.,
+        < add_index(RangeIndex, 'diameter_km') >) and returns it."""
+
+        index = index_type(self, *args)
+        self.indexes.append(index)
+        return index
+
+    def append(self, item):
+        super().append(item)
+        for index in self.indexes:
+            index.add(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+
+# Joins
+
+class HashJoin:
+    """Streaming hash join of two record sources on a normalized key (see
+    < create_join_key() >). The < right > records (e.g., the Wookieepedia planets) are
+    hashed once into a table that keeps the first record per key, mirroring
+    < get_nested_dict() >. The < left > records (e.g., a SWAPI catalog streamed by
+    < iter_swapi_resources() >) are then probed one at a time as the join is iterated, so
+    the left side is never materialized:
+
+        join = HashJoin(left, right, "name")
+        for swapi_data, wookiee_data in join:
+            ...
+
+    With < how > "left" every left record is yielded, paired with its match or None. With
+    "inner" only matched pairs are yielded and the unmatched left records are collected in
+    < unmatched_left >. Once iteration completes < unmatched_right() > returns the right
+    records that matched no left record.
+
+    Attributes:
+        left (iterable): probe side records
+        left_key (str|function): probe side key name or function returning the key value
+        right_key (str|function): build side key name or function returning the key value
+        how (str): "left" or "inner"
+        table (dict): normalized key to first right record mappings
+        duplicates (int): right records ignored because an earlier record shares their key
+        matched (set): normalized keys matched by at least one left record
+        unmatched_left (list): left records without a match ("inner" joins only)
+        unmatched_count (int): left records without a match
+        left_count (int): left records probed
+    """
+
+    def __init__(self, left, right, right_key, left_key=None, how='left'):
+        if how not in ('left', 'inner'):
+            raise ValueError(f"Unexpected join type: {how}")
+        self.left = left
+        self.left_key = left_key or right_key
+        self.right_key = right_key
+        self.how = how
+        self.table = {}
+        self.duplicates = 0
+        self.matched = set()
+        self.unmatched_left = []
+        self.unmatched_count = 0
+        self.left_count = 0
+        for record in right:
+            key = self.create_key(record, self.right_key)
+            if key is None:
+                continue
+            if key in self.table:
+                self.duplicates += 1
+            else:
+                self.table[key] = record
+
+    def __iter__(self):
+        table = self.table
+        for record in self.left:
+            self.left_count += 1
+            key = self.create_key(record, self.left_key)
+            match = table.get(key)
+            if match is not None:
+                self.matched.add(key)
+                yield record, match
+            else:
+                self.unmatched_count += 1
+                if self.how == 'left':
+                    yield record, None
+                else:
+                    self.unmatched_left.append(record)
+
+    def create_key(self, record, key):
+        """Returns the normalized join key of < record >."""
+
+        return create_join_key(key(record) if callable(key) else record.get(key))
+
+    def stats(self):
+        """Returns a dictionary of join counters."""
+
+        return {
+            'left': self.left_count,
+            'right': len(self.table) + self.duplicates,
+            'matched': self.left_count - self.unmatched_count,
+            'unmatched_left': self.unmatched_count,
+            'unmatched_right': len(self.table) - len(self.matched),
+            'duplicates': self.duplicates
+            }
+
+    def unmatched_right(self):
+        """Returns the right records that matched no left record (in build order)."""
+
+        return [record for key, record in self.table.items() if key not in self.matched]
+
+
+# Output files
+OUTPUT_CHUNK_SIZE = 64 * 1024 # bytes read per chunk when hashing a file on disk
+OUTPUT_MAX_WORKERS = 8 # threads used by OutputWriter.flush()
+
+
+class OutputWriter:
+    """Buffers JSON outputs and writes them in a single batch. < write_json() > encodes the
+    data immediately (later changes to the data are not written) but defers the write until
+    < flush() > is called, at which point the files are written concurrently on a thread pool
+    with < write_file_atomic() >. If the same filepath is written more than once before a
+    flush the last content wins.
+
+    Can be used as a context manager; buffered outputs are flushed on exit, including when an
+    error is raised (each buffered output is already a complete document). If the flush fails
+    while another error is propagating, the original error is raised and the flush error is
+    attached to it as a note.
+    """
+
+    def __init__(self, max_workers=OUTPUT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self.pending = {} # filepath -> (content, encoding)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+            return
+        try:
+            self.flush()
+        except Exception as error:
+            if hasattr(exc_value, 'add_note'): # Python 3.11+
+                exc_value.add_note(f"Buffered outputs could not be written: {error!r}")
+
+    def __len__(self):
+        return len(self.pending)
+
+    def flush(self):
+        """Writes the buffered outputs and empties the buffer. Raises the first error
+        encountered once every write has completed.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: filepath -> True if the file was written; False if its content was unchanged
+        """
+
+        pending, self.pending = self.pending, {}
+        if not pending:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+            futures = {
+                filepath: executor.submit(write_file_atomic, filepath, content, encoding)
+                for filepath, (content, encoding) in pending.items()
+                }
+        return {filepath: future.result() for filepath, future in futures.items()}
+
+    def write_json(self, filepath, data, encoding='utf-8', ensure_ascii=False, indent=2, compact=False):
+        """Encodes < data > as JSON (see < write_json() >) and buffers the content for the next
+        < flush() >.
+
+        Parameters:
+            filepath (str): the path to the file
+            data (dict)/(list): the data to be encoded as JSON
+            encoding (str): name of encoding used to encode the file
+            ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                                non-ASCII characters are escaped.
+            indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+            compact (bool): if True whitespace is omitted and < indent > is ignored
+
+        Returns:
+            None
+        """
+
+        content = json_codec.dumps(data, indent=indent, ensure_ascii=ensure_ascii, compact=compact)
+        self.pending[filepath] = (content, encoding)
+
+
+# SQLite cache
+SQLITE_CACHE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+class SQLiteCache(MutableMapping):
+    """Dictionary-like cache that stores each entry as a row in a local SQLite file rather than
+    holding the entire cache in memory. Keys are the strings minted by < create_cache_key() >
+    and serve as the table's primary key, so each lookup is resolved through the primary key
+    index. Values are stored as compact JSON text and decoded only when an entry is read.
+
+    Writes are committed immediately. The database is opened in WAL (write-ahead logging)
+    mode with a busy timeout so that many worker processes can read and write the same cache
+    file concurrently. A connection is never shared across processes; if the cache is used in
+    a forked child process a new connection is opened.
+
+    Parameters:
+        filepath (str): path to the SQLite cache file
+        timeout (int): seconds to wait for a lock held by another process
+        frozen (bool): if True decoded entries are returned as read-only objects
+    """
+
+    def __init__(self, filepath, timeout=30, frozen=False):
+        self.filepath = filepath
+        self.timeout = timeout
+        self.frozen = frozen
+        self._lock = threading.Lock()
+        self._pid = None
+        self._conn = None
+        self._connect()
+
+    def _connect(self):
+        """Opens a connection to the cache file for the current process and creates the cache
+        table if it does not exist.
+
+        Parameters:
+            None
+
+        Returns:
+            sqlite3.Connection: connection owned by the current process
+        """
+
+        if self._pid != os.getpid():
+            self._conn = sqlite3.connect(
+                self.filepath, timeout=self.timeout, isolation_level=None, check_same_thread=False
+                )
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID'
+                )
+            self._pid = os.getpid()
+        return self._conn
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def __contains__(self, key):
+        return bool(self._execute('SELECT 1 FROM cache WHERE key = ?', (key,)))
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def __getitem__(self, key):
+        rows = self._execute('SELECT value FROM cache WHERE key = ?', (key,))
+        if not rows:
+            raise KeyError(key)
+        value = json_codec.loads(rows[0][0])
+        return freeze(value) if self.frozen else value
+
+    def __iter__(self):
+        return iter([row[0] for row in self._execute('SELECT key FROM cache')])
+
+    def __len__(self):
+        return self._execute('SELECT COUNT(*) FROM cache')[0][0]
+
+    def __setitem__(self, key, value):
+        self._execute(
+            'INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)',
+            (key, json_codec.dumps(value, compact=True))
+            )
+
+    def close(self):
+        """Closes the connection held by the current process.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._pid = None
+
+
+def append_cache_entries(filepath, entries, encoding='utf-8'):
+    """Appends the passed in cache < entries > to the journal that accompanies the cache
+    snapshot located at < filepath >. Each entry is encoded as one compact JSON record per
+    line structured as follows:
+
+    {"key": < key >, "value": < value >}
+
+    The journal is flushed and synced to disk once, after every entry has been written, so that
+    the entries survive a crash of the running script. Appending avoids re-serializing the
+    entire cache each time new resources are added.
+
+    Parameters:
+        filepath (str): path to the cache snapshot file
+        entries (dict): cache keys minted by < create_cache_key() > mapped to resources
+        encoding (str): name of encoding used to encode the file
+
+    Returns:
+        int: size of the journal in bytes after the entries are appended
+    """
+
+    with open(f"{filepath}{CACHE_JOURNAL_SUFFIX}", 'a', encoding=encoding) as file_obj:
+        for key, value in entries.items():
+            record = json_codec.dumps({'key': key, 'value': value}, compact=True)
+            file_obj.write(f"{record}\n")
+        file_obj.flush()
+        os.fsync(file_obj.fileno())
+        return file_obj.tell()
+
+
+def append_cache_entry(filepath, key, value, encoding='utf-8'):
+    """Appends a single cache entry to the journal that accompanies the cache snapshot
+    located at < filepath >. Delegates to the function < append_cache_entries() > the task
+    of writing the journal record.
+
+    Parameters:
+        filepath (str): path to the cache snapshot file
+        key (str): cache key minted by < create_cache_key() >
+        value (dict|list): resource to be cached
+        encoding (str): name of encoding used to encode the file
+
+    Returns:
+        int: size of the journal in bytes after the entry is appended
+    """
+
+    return append_cache_entries(filepath, {key: value}, encoding)
+
+
+def compact_cache(filepath, cache, encoding='utf-8'):
+    """Folds the journal into a new cache snapshot. The passed in < cache > is written with
+    < write_json() >, which replaces the snapshot located at < filepath > in a single atomic
+    rename (a crash mid-write leaves the previous snapshot intact). The journal is truncated
+    only after the new snapshot is in place.
+
+    WARN: If the script crashes after the rename but before the journal is truncated, the
+    journal entries are simply replayed again by < create_cache() >. Replaying an entry that
+    already exists in the snapshot is harmless.
+
+    Parameters:
+        filepath (str): path to the cache snapshot file
+        cache (dict): cache contents to be written to the snapshot
+        encoding (str): name of encoding used to encode the file
+
+    Returns:
+        None
+    """
+
+    write_json(filepath, cache, encoding, compact=True)
+    open(f"{filepath}{CACHE_JOURNAL_SUFFIX}", 'w', encoding=encoding).close()
+
+
+def configure_session(pool_connections=SESSION_POOL_CONNECTIONS, pool_maxsize=SESSION_POOL_MAXSIZE,
+                      host_pool_sizes=None):
+    """Creates the shared < requests.Session > used by < get_resource() > and related functions
+    and replaces any previously configured session. Delegates to the function
+    < create_session() > the task of creating the session.
+
+    Parameters:
+        pool_connections (int): number of hosts whose connection pools are retained
+        pool_maxsize (int): connections retained per host
+        host_pool_sizes (dict): optional per-host connection pool sizes
+
+    Returns:
+        requests.Session: the new shared session
+    """
+
+    global session, session_pid
+
+    new_session = create_session(pool_connections, pool_maxsize, host_pool_sizes)
+    with session_lock:
+        old_session = session if session_pid == os.getpid() else None
+        session, session_pid = new_session, os.getpid()
+    if old_session is not None:
+        old_session.close()
+    return new_session
+
+
+def compile_converter(key_map, type_spec, none_values, converters=None):
+    """Compiles a specialized function that converts a source dictionary (e.g., a SWAPI
+    resource) into a new "thinned" dictionary. The < key_map > (e.g., keys['planet']) specifies
+    the source keys to be mapped, the order in which they are mapped, and their new key names.
+    The declarative < type_spec > maps each source key to one of the < CONVERTER_TYPES >:
+
+        'raw': value copied unchanged
+        'str': < to_none() >
+        'int': < to_none() > then < to_int() >
+        'float': < to_none() > then < to_float() >
+        'gravity': < to_none() > then < to_gravity_value() >
+        ('list', < delimiter >): < to_none() > then < to_list() >
+        'year_era': < to_none() > then < to_year_era() >
+
+    A type may also name one of the passed in < converters > (e.g., {'homeworld': < function >});
+    the custom function is called with the source value and its return value is passed to
+    < to_none() >.
+
+    The source of a single function that builds the new dictionary with one dictionary literal
+    is generated and compiled once; no per-key branching or list membership tests occur when
+    the function is called. The generated source is available as the function's < source >
+    attribute. The compiled function is called as follows:
+
+        convert(< data >, < wookiee_data >=None)
+
+    If < wookiee_data > is provided each key is resolved from < wookiee_data > first and
+    < data > second (as a < RecordView > would, but without creating one); neither dictionary
+    is copied or mutated. < data > may itself be a < RecordView >.
+
+    Parameters:
+        key_map (dict): old key to new key mappings
+        type_spec (dict): old key to converter type mappings
+        none_values (tuple): strings to convert to None
+        converters (dict): optional custom converter functions referenced by < type_spec >
+
+    Returns:
+        function: compiled conversion function
+    """
+
+    converters = converters or {}
+    namespace = {
+        'none_values': none_values,
+        'to_float': to_float,
+        'to_gravity_value': to_gravity_value,
+        'to_int': to_int,
+        'to_list': to_list,
+        'to_none': to_none,
+        'to_year_era': to_year_era
+        }
+
+    lines, layered_lines = [], []
+    for key, new_key in key_map.items():
+        if key not in type_spec:
+            raise ValueError(f"Unexpected key: {key}")
+        type_name, arg = type_spec[key] if isinstance(type_spec[key], tuple) else (type_spec[key], None)
+        if type_name in converters:
+            namespace[f"convert_{type_name}"] = converters[type_name]
+            expression = f"to_none(convert_{type_name}({{value}}), none_values)"
+        elif type_name in CONVERTER_TYPES:
+            expression = CONVERTER_TYPES[type_name].replace('{arg!r}', repr(arg))
+        else:
+            raise ValueError(f"Unexpected converter type: {type_name}")
+        lines.append(f"            {new_key!r}: {expression.format(value=f'get({key!r})')},")
+        layered_lines.append(f"        {new_key!r}: {expression.format(value=f'(layer[{key!r}] if {key!r} in layer else get({key!r}))')},")
+
+    source = '\n'.join([
+        'def convert(data, wookiee_data=None):',
+        '    get = data.get',
+        '    if not wookiee_data:',
+        '        return {',
+        *lines,
+        '        }',
+        '    layer = wookiee_data',
+        '    return {',
+        *layered_lines,
+        '    }'
+        ])
+    exec(compile(source, '<compile_converter>', 'exec'), namespace)
+    convert = namespace['convert']
+    convert.source = source
+    return convert
+
+
+def configure_cassette(filepath=None, mode=None):
+    """Switches < send_request() > into "record" or "replay" mode using the cassette file
+    located at < filepath > (see < Cassette >). Pass no arguments (or mode None) to resume
+    sending requests to the network without recording.
+
+    Parameters:
+        filepath (str): path to the cassette file
+        mode (str): 'record', 'replay', or None
+
+    Returns:
+        Cassette|None: the active cassette
+    """
+
+    global cassette
+
+    cassette = Cassette(filepath, mode) if mode else None
+    return cassette
+
+
+def configure_json_codec(name=None):
+    """Selects the codec used to read and write JSON (see < JSONCodec >). Pass 'json' to force
+    the standard library codec or 'orjson' to require the optional orjson backend. Pass no
+    arguments to use the fastest codec installed.
+
+    Parameters:
+        name (str): 'json', 'orjson', or None
+
+    Returns:
+        JSONCodec: the active codec
+    """
+
+    global json_codec
+
+    if name is None:
+        name = 'orjson' if orjson is not None else 'json'
+    if name not in JSON_CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected one of {sorted(JSON_CODECS)}")
+    if name == 'orjson' and orjson is None:
+        raise ValueError("JSON codec 'orjson' requires the orjson package")
+    json_codec = JSON_CODECS[name]()
+    return json_codec
+
+
+def configure_resilience(retry_policy=None, rate_limits=None, failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+                         reset_timeout=CIRCUIT_RESET_TIMEOUT):
+    """Configures the retry policy, per-host rate limits, and circuit breakers applied by
+    < send_request() > and discards the breakers and rate limiters (and their metrics) created
+    under the previous configuration. < rate_limits > is a dictionary structured as follows:
+
+    {< host >: (< requests per second >, < burst capacity >), ...}
+
+    A bare number may be given in place of the tuple, in which case the burst capacity defaults
+    to the rate.
+
+    A '*' host applies to every host not listed. Hosts without a rate limit are not throttled.
+
+    Parameters:
+        retry_policy (RetryPolicy): retry policy; defaults to a new < RetryPolicy() >
+        rate_limits (dict): optional per-host rate limits
+        failure_threshold (int): consecutive failures that open a host's circuit breaker
+        reset_timeout (float): seconds a host's circuit breaker remains open
+
+    Returns:
+        None
+    """
+
+    global active_retry_policy, active_rate_limits, active_failure_threshold, active_reset_timeout
+
+    with resilience_lock:
+        active_retry_policy = retry_policy or RetryPolicy()
+        active_rate_limits = dict(rate_limits or {})
+        active_failure_threshold = failure_threshold
+        active_reset_timeout = reset_timeout
+        circuit_breakers.clear()
+        rate_limiters.clear()
+
+
+def convert_column(values, type_name, none_values, arg=None, use_numpy=None):
+    """Converts a whole column of < values > using one of the < CONVERTER_TYPES > (see
+    < compile_converter() >). Each value is first passed to < to_none() > and then to the
+    scalar function that matches < type_name >, producing the same values as the single-record
+    converters without building a dictionary per row.
+
+    Each distinct "int", "float", and "gravity" value is converted only once. If NumPy is
+    installed (and < use_numpy > is not False) these columns are returned as masked arrays
+    (< None > values are masked) provided every value converted successfully; otherwise the
+    column is returned as a list holding the unparseable values unchanged, as the scalar
+    functions do.
+
+    Parameters:
+        values (list): column values
+        type_name (str): converter type
+        none_values (tuple): strings to convert to None
+        arg (str): converter argument (e.g., the < to_list() > delimiter)
+        use_numpy (bool): use NumPy for numeric columns (default: if installed)
+
+    Returns:
+        list|numpy.ma.MaskedArray: converted column
+    """
+
+    if type_name not in CONVERTER_TYPES:
+        raise ValueError(f"Unexpected converter type: {type_name}")
+    if type_name == 'raw':
+        return list(values)
+
+    # Repeated values are common in real datasets; convert each distinct value once
+    try:
+        distinct = set(values)
+    except TypeError: # unhashable values (e.g., lists)
+        distinct = None
+    none_keys = {value.lower() for value in none_values}
+    if distinct is None:
+        values = [to_none(value, none_values) for value in values]
+    else:
+        nones = {value for value in distinct if isinstance(value, str) and value.strip().lower() in none_keys}
+        if nones:
+            values = [None if value in nones else value for value in values]
+            distinct -= nones
+            distinct.add(None)
+
+    if type_name == 'str':
+        return list(values)
+    if type_name == 'list':
+        return [to_list(value, arg) for value in values]
+    if type_name == 'year_era':
+        return [to_year_era(value) for value in values] # dicts must not be shared between rows
+
+    convert = {'float': to_float, 'gravity': to_gravity_value, 'int': to_int}[type_name]
+    if distinct is None:
+        column = [convert(value) for value in values]
+    else:
+        converted = {value: convert(value) for value in distinct}
+        column = [converted[value] for value in values]
+    if np is not None and use_numpy is not False:
+        array = to_numeric_array(column, type_name)
+        if array is not None:
+            return array
+    return column
+
+
+def convert_columns(columns, key_map, type_spec, none_values, use_numpy=None):
+    """Converts the passed in < columns > (see < to_columns() >) column by column and returns a
+    < RecordBatch > whose rows match those produced by a converter compiled from the same
+    < key_map > and < type_spec > by < compile_converter() >. Delegates to the function
+    < convert_column() > the task of converting each column. Columns missing from < columns >
+    are treated as all < None >.
+
+    Parameters:
+        columns (dict): old key to column mappings
+        key_map (dict): old key to new key mappings
+        type_spec (dict): old key to converter type mappings
+        none_values (tuple): strings to convert to None
+        use_numpy (bool): use NumPy for numeric columns (default: if installed)
+
+    Returns:
+        RecordBatch: converted records
+    """
+
+    length = len(next(iter(columns.values()))) if columns else 0
+    batch = {}
+    for key, new_key in key_map.items():
+        if key not in type_spec:
+            raise ValueError(f"Unexpected key: {key}")
+        type_name, arg = type_spec[key] if isinstance(type_spec[key], tuple) else (type_spec[key], None)
+        values = columns.get(key, [None] * length)
+        if len(values) != length:
+            raise ValueError(f"Column length mismatch: {key}")
+        batch[new_key] = convert_column(values, type_name, none_values, arg, use_numpy)
+    return RecordBatch(batch)
+
+
+def create_cache(filepath, max_entries=None, max_bytes=None, frozen=False):
+    """Attempts to retrieve cache contents written to the file system. If successful the
+    cache contents from the previous script run are returned to the caller as the new
+    cache. If unsuccessful an empty cache is returned to the caller.
+
+    Any entries appended to the cache journal since the snapshot was last compacted are
+    replayed on top of the snapshot. Delegates to the function < replay_cache_journal() >
+    the task of reading the journal.
+
+    If < filepath > ends with one of the < SQLITE_CACHE_SUFFIXES > (e.g., "CACHE.db") a
+    < SQLiteCache > is returned instead. Nothing is loaded into memory at startup; entries
+    are read from the SQLite file on demand.
+
+    If < max_entries > or < max_bytes > is provided the cache is wrapped in a bounded
+    < LRUCache > that holds recently used entries in memory. Limits are only accepted for the
+    SQLite cache: the JSON cache is loaded into memory in full, so an LRU tier in front of it
+    would bound nothing and a ValueError is raised.
+
+    If < frozen > is True each cached resource is converted to a read-only object by the
+    function < freeze() > so that it can be shared with callers without copying.
+
+    Parameters:
+        filepath (str): path to the cache file
+        max_entries (int): optional maximum number of entries held in memory
+        max_bytes (int): optional approximate maximum size of entries held in memory
+        frozen (bool): if True cached resources are returned as read-only objects
+
+    Returns:
+        dict|SQLiteCache|LRUCache: cache either empty or populated with resources from the
+                                   previous script run
+    """
+
+    bounded = max_entries is not None or max_bytes is not None
+    if filepath.lower().endswith(SQLITE_CACHE_SUFFIXES):
+        cache = SQLiteCache(filepath, frozen=frozen)
+    elif bounded:
+        raise ValueError(
+            f"max_entries/max_bytes require a SQLite cache ({', '.join(SQLITE_CACHE_SUFFIXES)}); "
+            f"the JSON cache {filepath} is held in memory in full"
+            )
+    else:
+        try:
+            cache = read_json(filepath)
+        except FileNotFoundError:
+            cache = {}
+        cache.update(replay_cache_journal(filepath))
+        if frozen:
+            cache = {key: freeze(value) for key, value in cache.items()}
+
+    if bounded:
+        return LRUCache(cache, max_entries, max_bytes)
+    return cache
+
+
+def create_cache_key(url, params=None):
+    """Returns a lowercase string key comprising the passed in < url >, and, if < params >
+    is not None, the "?" separator, and any URL encoded querystring fields and values.
+    Passes to the function < urllib.parse.urljoin > the optional < quote_via=quote >
+    argument to override the default behavior and encode spaces with '%20' rather
+    than "+".
+
+    Example:
+       url = https://swapi.py4e.com/api/people/
+       params = {'search': 'Anakin Skywalker'}
+       returns 'https://swapi.py4e.com/api/people/?search=anakin%20skywalker'
+
+    Parameters:
+        url (str): string representing a Uniform Resource Locator (URL)
+        params (dict): one or more key-value pairs representing querystring fields and values
+
+    Returns:
+        str: Lowercase "key" comprising the URL and accompanying querystring fields and values
+    """
+
+    if params:
+        return urljoin(url, f"?{urlencode(params, quote_via=quote)}").lower() # space replaced with '%20'
+    else:
+        return url.lower()
+
+
+def create_cache_meta_key(key):
+    """Returns the key under which the metadata (e.g., fetch timestamp, validators) that
+    describes the cache entry identified by < key > is stored. Metadata keys are prefixed with
+    < CACHE_META_PREFIX > and cannot collide with keys minted by < create_cache_key() >.
+
+    Parameters:
+        key (str): cache key minted by < create_cache_key() >
+
+    Returns:
+        str: metadata key
+    """
+
+    return f"{CACHE_META_PREFIX}{key}"
+
+
+def create_join_key(value):
+    """Returns the normalized form of a join key < value >: converted to a string, stripped,
+    internal whitespace collapsed, and lower cased (e.g., " Anakin  SkyWalker" ->
+    "anakin skywalker"). < None > is returned unchanged (and never matches).
+
+    Parameters:
+        value (any): key value
+
+    Returns:
+        str|None: normalized key
+    """
+
+    if value is None:
+        return None
+    return ' '.join(str(value).split()).lower()
+
+
+def create_session(pool_connections=SESSION_POOL_CONNECTIONS, pool_maxsize=SESSION_POOL_MAXSIZE,
+                   host_pool_sizes=None):
+    """Returns a new < requests.Session > with pooled keep-alive connections. The session keeps
+    connections alive between requests so that repeated requests to the same host reuse an
+    open connection (and TLS session) rather than establishing a new one for each request.
+
+    Connections are pooled per host. < pool_maxsize > sets the number of connections retained
+    per host; individual hosts can be assigned a different pool size by passing a
+    < host_pool_sizes > dictionary structured as follows:
+
+    {< host >: < pool_maxsize >, ...} e.g., {'swapi.py4e.com': 20}
+
+    Parameters:
+        pool_connections (int): number of hosts whose connection pools are retained
+        pool_maxsize (int): connections retained per host
+        host_pool_sizes (dict): optional per-host connection pool sizes
+
+    Returns:
+        requests.Session: new session
+    """
+
+    new_session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    new_session.mount('http://', adapter)
+    new_session.mount('https://', adapter)
+    for host, maxsize in (host_pool_sizes or {}).items():
+        host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+        new_session.mount(f"http://{host}/", host_adapter)
+        new_session.mount(f"https://{host}/", host_adapter)
+    return new_session
+
+
+def freeze(value):
+    """Returns a read-only representation of the passed in < value >. Dictionaries are converted
+    to < FrozenDict > objects and lists to < FrozenList > objects, recursively. Other objects
+    (e.g., strings, numbers, None) are immutable and are returned unchanged.
 
-from urllib.parse import quote, urlencode, urljoin
+    A < value > that is already frozen is returned as is without inspecting its contents, so
+    freezing a cached resource a second time costs O(1).
 
+    Parameters:
+        value (obj): decoded JSON object to be frozen
 
-def create_cache(filepath):
-    """Attempts to retrieve cache contents written to the file system. If successful the
-    cache contents from the previous script run are returned to the caller as the new
-    cache. If unsuccessful an empty cache is returned to the caller.
+    Returns:
+        FrozenDict|FrozenList|any: read-only representation of < value >
+    """
+
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(val) for key, val in value.items()})
+    if isinstance(value, list):
+        return FrozenList([freeze(val) for val in value])
+    return value
+
+
+def get_conditional_resource(url, params=None, timeout=10, etag=None, last_modified=None):
+    """Performs a conditional GET request. If an < etag > or < last_modified > validator is
+    provided it is sent in the "If-None-Match" or "If-Modified-Since" request header. If the
+    remote resource is unchanged the server responds with a 304 (Not Modified) status and no
+    body, in which case < None > is returned in place of the resource.
 
     Parameters:
-        filepath (str): path to the cache file
+        url (str): a uniform resource locator that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+        etag (str): validator returned in the "ETag" header of a previous response
+        last_modified (str): validator returned in the "Last-Modified" header of a previous response
 
     Returns:
-        dict: cache either empty or populated with resources from the previous script run
+        tuple: (< resource >, < validators >) where < resource > is the decoded JSON or None if
+               not modified and < validators > is a dictionary structured as follows:
+               {'etag': < str|None >, 'last_modified': < str|None >}
     """
 
-    try:
-        return read_json(filepath)
-    except FileNotFoundError:
-        return {}
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
 
+    response = send_request(url, params, timeout, headers)
+    validators = {
+        'etag': response.headers.get('ETag', etag),
+        'last_modified': response.headers.get('Last-Modified', last_modified)
+        }
+    if response.status_code == 304:
+        return None, validators
+    return response.json(), validators
 
-def create_cache_key(url, params=None):
-    """Returns a lowercase string key comprising the passed in < url >, and, if < params >
-    is not None, the "?" separator, and any URL encoded querystring fields and values.
-    Passes to the function < urllib.parse.urljoin > the optional < quote_via=quote >
-    argument to override the default behavior and encode spaces with '%20' rather
-    than "+".
 
-    Example:
-       url = https://swapi.py4e.com/api/people/
-       params = {'search': 'Anakin Skywalker'}
-       returns 'https://swapi.py4e.com/api/people/?search=anakin%20skywalker'
+def get_circuit_breaker(host):
+    """Returns the < CircuitBreaker > assigned to the passed in < host >, creating it if
+    necessary.
 
     Parameters:
-        url (str): string representing a Uniform Resource Locator (URL)
-        params (dict): one or more key-value pairs representing querystring fields and values
+        host (str): network location (e.g., 'swapi.py4e.com')
 
     Returns:
-        str: Lowercase "key" comprising the URL and accompanying querystring fields and values
+        CircuitBreaker: the host's circuit breaker
     """
 
-    if params:
-        return urljoin(url, f"?{urlencode(params, quote_via=quote)}").lower() # space replaced with '%20'
-    else:
-        return url.lower()
+    with resilience_lock:
+        if host not in circuit_breakers:
+            circuit_breakers[host] = CircuitBreaker(active_failure_threshold, active_reset_timeout)
+        return circuit_breakers[host]
+
+
+def get_rate_limiter(host):
+    """Returns the < TokenBucket > that throttles requests sent to the passed in < host >,
+    creating it from < active_rate_limits > if necessary. Returns None if the host is not rate limited.
+
+    Parameters:
+        host (str): network location (e.g., 'swapi.py4e.com')
+
+    Returns:
+        TokenBucket|None: the host's rate limiter
+    """
+
+    with resilience_lock:
+        if host not in rate_limiters:
+            limit = active_rate_limits.get(host, active_rate_limits.get('*'))
+            if isinstance(limit, (int, float)):
+                limit = (limit,) # requests per second only
+            rate_limiters[host] = TokenBucket(*limit) if limit else None
+        return rate_limiters[host]
+
+
+def get_resilience_stats():
+    """Returns the metrics exposed by the retry policy, rate limiters, and circuit breakers
+    structured as follows:
+
+    {
+        'retry': {...},
+        'rate_limiters': {< host >: {...}, ...},
+        'circuit_breakers': {< host >: {...}, ...}
+    }
+
+    Parameters:
+        None
+
+    Returns:
+        dict: resilience metrics
+    """
+
+    with resilience_lock:
+        return {
+            'retry': active_retry_policy.stats(),
+            'rate_limiters': {host: bucket.stats() for host, bucket in rate_limiters.items() if bucket},
+            'circuit_breakers': {host: breaker.stats() for host, breaker in circuit_breakers.items()}
+            }
+
+
+def get_session():
+    """Returns the shared < requests.Session >, creating it with the default pool sizes (see
+    < create_session() >) if no session has been configured. The session is created while
+    < session_lock > is held so that threads calling the function concurrently share a single
+    session. A session is never shared across processes; if called in a forked child process
+    a new session is created (the parent's session is left open for the parent).
+
+    Parameters:
+        None
+
+    Returns:
+        requests.Session: shared session
+    """
+
+    global session, session_pid
+
+    with session_lock:
+        if session is None or session_pid != os.getpid():
+            session, session_pid = create_session(), os.getpid()
+        return session
+
+
+def get_session_stats():
+    """Returns connection reuse statistics for the shared session's connection pools. For each
+    host the number of requests sent and the number of new connections opened are reported;
+    every request that did not open a new connection reused a kept-alive connection.
+
+    Statistics are structured as follows:
+
+    {
+        'requests': < int >,
+        'connections': < int >,
+        'reused': < int >,
+        'hosts': {< host >: {'requests': < int >, 'connections': < int >, 'reused': < int >}, ...}
+    }
+
+    WARN: Only pools currently retained by the session are counted. Pools discarded because more
+    than < pool_connections > hosts were contacted no longer contribute to the totals.
+
+    Parameters:
+        None
+
+    Returns:
+        dict: connection reuse statistics
+    """
+
+    stats = {'requests': 0, 'connections': 0, 'reused': 0, 'hosts': {}}
+    adapters = {id(adapter): adapter for adapter in get_session().adapters.values()}
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            host = stats['hosts'].setdefault(pool.host, {'requests': 0, 'connections': 0, 'reused': 0})
+            host['requests'] += pool.num_requests
+            host['connections'] += pool.num_connections
+            host['reused'] += max(pool.num_requests - pool.num_connections, 0)
+
+    for host in stats['hosts'].values():
+        for name in ('requests', 'connections', 'reused'):
+            stats[name] += host[name]
+    return stats
+
+
+def get_none_value_set(none_values):
+    """Returns the lower cased < none_values > as a frozen set. Sets are built once per tuple
+    and stored in < NONE_VALUE_SETS >. Returns < None > if < none_values > is not a tuple of
+    strings (callers then fall back to comparing the values one by one).
+
+    Parameters:
+        none_values (tuple): strings to convert to None
+
+    Returns:
+        frozenset|None: lower cased none values
+    """
+
+    if type(none_values) is not tuple:
+        return None
+    try:
+        return NONE_VALUE_SETS[none_values]
+    except (KeyError, TypeError):
+        if not all(type(none_value) is str for none_value in none_values):
+            return None
+    none_set = NONE_VALUE_SETS[none_values] = frozenset(none_value.lower() for none_value in none_values)
+    return none_set
 
 
 def get_nested_dict(data, key, filter):
@@ -56,8 +2107,15 @@ def get_nested_dict(data, key, filter):
     object type can serve as the < filter >. If an exact match is obtained (i.e., test for
     equality) the nested dictionary is returned to the caller; otherwise None is returned.
 
+    Values that are not strings (e.g., the integer "diameter_km" values of converted planets)
+    are compared in their string form, as < DictIndex > does; < None > values never match.
+
+    If a < DictIndex > built for the same < key > is passed in place of the list the match is
+    retrieved from the index in constant time rather than by scanning the list. A
+    < RangeIndex > is used the same way when the < filter > is a number.
+
     Parameters:
-        data (list): List of nested dictionaries
+        data (list|DictIndex|RangeIndex): List of nested dictionaries
         key (str): key that identifies the value that the < filter > must match
         filter (any): object provided for the equality test.
 
@@ -66,30 +2124,365 @@ def get_nested_dict(data, key, filter):
                    obtained; otherwise < None > is returned
     """
 
+    if isinstance(data, DictIndex) and data.key == key:
+        if type(data) is not RangeIndex or data.is_number(filter):
+            return data.get(filter)
+    filter = str(filter).lower()
     for item in data:
-        if item.get(key, '').lower() == str(filter).lower():
+        value = item.get(key, '')
+        if value is not None and str(value).lower() == filter:
             return item
     return None
 
-def get_resource(url, params=None, timeout=10):
+def get_resource(url, params=None, timeout=10, session=None):
     """Returns a response object decoded into a dictionary. If query string < params > are
     provided the response object body is returned in the form on an "envelope" with the data
     payload of one or more entities to be found in ['results'] list; otherwise, response
     object body is returned as a single dictionary representation of the entity.
 
+    Requests are sent through the shared, connection-pooling session returned by
+    < get_session() > unless a < session > is provided by the caller. Delegates to the function
+    < send_request() > the task of applying the retry policy, rate limit, and circuit breaker.
+
     Parameters:
         url (str): a uniform resource locator that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
         timeout (int): timeout value in seconds
+        session (requests.Session): optional session used in place of the shared session
 
     Returns:
         dict: dictionary representation of the decoded JSON.
     """
 
-    if params:
-        return requests.get(url, params, timeout=timeout).json()
-    else:
-        return requests.get(url, timeout=timeout).json()
+    return send_request(url, params, timeout, session=session).json()
+
+
+def replay_cache_journal(filepath, encoding='utf-8', truncate=True):
+    """Reads the journal that accompanies the cache snapshot located at < filepath > and returns
+    the journaled entries in the order in which they were appended. Later entries replace earlier
+    entries that share the same key.
+
+    A record that cannot be decoded (e.g., a partially written line left behind by a crash)
+    marks the end of the usable journal. Unless < truncate > is False the journal is truncated
+    at that point so that subsequent appends are not concatenated onto the damaged record.
+
+    Parameters:
+        filepath (str): path to the cache snapshot file
+        encoding (str): name of encoding used to decode the file
+        truncate (bool): if True a damaged journal is truncated after the last usable record
+
+    Returns:
+        dict: journaled cache entries; empty if no journal exists
+    """
+
+    entries = {}
+    journal_filepath = f"{filepath}{CACHE_JOURNAL_SUFFIX}"
+    try:
+        file_obj = open(journal_filepath, 'rb')
+    except FileNotFoundError:
+        return entries
+
+    with file_obj:
+        offset = 0
+        for line in file_obj:
+            try:
+                if not line.endswith(b'\n'):
+                    raise ValueError('Incomplete journal record')
+                record = json_codec.loads(line.decode(encoding))
+                entries[record['key']] = record['value']
+            except (ValueError, KeyError, TypeError):
+                break
+            offset += len(line)
+        else:
+            return entries
+
+    if not truncate:
+        return entries
+    with open(journal_filepath, 'r+b') as file_obj:
+        file_obj.truncate(offset)
+    return entries
+
+
+def iter_json_array(filepath, paths=None, encoding='utf-8', buffer_size=JSON_BUFFER_SIZE):
+    """Generator that incrementally decodes a JSON document whose top-level value is an array
+    (e.g., "data-nyt_star_wars_articles.json") and yields its elements one at a time. The file
+    is read through a buffer of < buffer_size > characters and each element is decoded with
+    json.JSONDecoder.raw_decode() as soon as it is complete, so peak memory is bounded by the
+    largest element rather than the whole document. If an element spans the end of the buffer
+    the read size is doubled until it fits (a number or literal is accepted only once a
+    delimiter follows it). Invalid input raises as soon as the offending token is complete.
+
+    If dotted < paths > are provided (e.g., ['headline.main', 'byline.original']) each element
+    is passed to < project_paths() > and only the selected values are retained. The memory bound
+    holds only while the caller consumes the elements one at a time; a caller that collects them
+    (e.g., into a list) still holds every element, but only its projection when < paths > are
+    provided.
+
+    Parameters:
+        filepath (str): path to file
+        paths (list): optional dotted paths to project
+        encoding (str): name of encoding used to decode the file
+        buffer_size (int): characters read per refill
+
+    Returns:
+        generator: yields array elements (or their projections)
+    """
+
+    decoder = json.JSONDecoder()
+    with open(filepath, 'r', encoding=encoding) as file_obj:
+        buffer, position, eof, read_size = '', 0, False, buffer_size
+
+        def skip(position):
+            while position < len(buffer) and buffer[position] in JSON_WHITESPACE:
+                position += 1
+            return position
+
+        def is_complete(position):
+            # True if a delimiter follows < position >, i.e., the token there cannot grow
+            return any(char in JSON_DELIMITERS for char in itertools.islice(buffer, position, None))
+
+        # Opening bracket
+        while True:
+            position = skip(position)
+            if position < len(buffer) or eof:
+                break
+            chunk = file_obj.read(read_size)
+            buffer, eof = buffer[position:] + chunk, not chunk
+            position = 0
+        if buffer[position:position + 1] != '[':
+            raise ValueError(f"Expected a JSON array: {filepath}")
+        position += 1
+
+        state = 'first' # 'first' element or ']', a 'value' after a comma, or a 'separator'
+        while True:
+            position = skip(position)
+            if position < len(buffer):
+                char = buffer[position]
+                if state == 'separator' or (state == 'first' and char == ']'):
+                    if char == ']':
+                        return
+                    if char != ',':
+                        raise ValueError(f"Expected ',' or ']' at character {position}: {filepath}")
+                    position, state = position + 1, 'value'
+                    continue
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as error:
+                    # Only an error at a token that runs off the end of the buffer can be
+                    # resolved by reading more
+                    if eof or not (
+                        error.msg.startswith('Unterminated string')
+                        or (error.msg.startswith('Invalid \\uXXXX') and len(buffer) - error.pos < 5)
+                        or not is_complete(error.pos)
+                        ):
+                        raise
+                else:
+                    # Numbers and literals may continue in the next chunk (e.g., "1." + "5")
+                    if eof or char in '{["' or (end < len(buffer) and buffer[end] in JSON_DELIMITERS):
+                        yield project_paths(value, paths) if paths else value
+                        position, state, read_size = end, 'separator', buffer_size
+                        continue
+                    if is_complete(end):
+                        raise ValueError(f"Invalid JSON value at character {position}: {filepath}")
+            elif eof:
+                raise ValueError(f"Unterminated JSON array: {filepath}")
+            else:
+                read_size = buffer_size
+            chunk = file_obj.read(read_size)
+            buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+            read_size *= 2
+
+
+def iter_ndjson(filepath, encoding='utf-8', start=0, end=None):
+    """Generator that lazily reads a newline-delimited JSON (NDJSON) file written by
+    < write_ndjson() > and yields one decoded record per line. Blank lines are skipped. A final
+    line that is incomplete (e.g., left behind by a crashed writer) is ignored.
+
+    A byte range (see < split_ndjson() >) can be read by passing its < start > and < end >
+    offsets: a line belongs to the range in which it starts, so ranges that partition the file
+    yield every record exactly once and can be read by separate processes.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        start (int): byte offset at which to start reading
+        end (int): optional byte offset at which to stop reading
+
+    Returns:
+        generator: yields decoded records
+    """
+
+    with open(filepath, 'rb') as file_obj:
+        if start:
+            file_obj.seek(start - 1)
+            if file_obj.read(1) != b'\n':
+                file_obj.readline() # line started in the previous range
+        position = file_obj.tell()
+        for line in file_obj:
+            if end is not None and position >= end:
+                return
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json_codec.loads(line.decode(encoding))
+            except ValueError:
+                if line.endswith(b'\n'):
+                    raise
+                return # incomplete final line
+            yield record
+
+
+def iter_csv_to_dicts(filepath, encoding='utf-8', newline='', delimiter=',', columns=None,
+                      converters=None, chunk_size=None):
+    """Streaming counterpart of < read_csv_to_dicts() >. Generator that reads the file one row
+    at a time and yields each row as a dictionary, or, if a < chunk_size > is provided, yields
+    lists of up to < chunk_size > row dictionaries. Only the current row (or chunk) is held in
+    memory.
+
+    If < columns > are provided only those columns are projected into each dictionary, in the
+    order given; the other fields are never copied or converted. < converters > maps column
+    names to functions (e.g., {'episode_us_viewers_mm': to_float}) that are applied to the
+    values as the rows are read.
+
+    Rows match those returned by csv.DictReader(): blank lines are skipped, missing trailing
+    fields are set to None (None is not passed to the converters), a column name that appears
+    more than once in the header maps to its last column, and any extra fields are collected
+    in a list stored under the None key. Projected rows omit the extra fields.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        columns (list): optional names of the columns to project
+        converters (dict): optional column name to conversion function mappings
+        chunk_size (int): optional number of rows per yielded list
+
+    Returns:
+        generator: yields row dictionaries (or lists of row dictionaries)
+    """
+
+    with open(filepath, 'r', newline=newline, encoding=encoding) as file_obj:
+        reader = csv.reader(file_obj, delimiter=delimiter)
+        headers = next(reader, None)
+        if headers is None:
+            return
+        positions = {name: index for index, name in enumerate(headers)} # last column wins
+        names = list(positions if columns is None else columns)
+        for name in names:
+            if name not in positions:
+                raise ValueError(f"Unexpected column: {name}")
+        indexes = [positions[name] for name in names]
+        width = max(indexes, default=-1) + 1
+        rest = len(headers) if columns is None else None
+        project = operator.itemgetter(*indexes) if len(indexes) > 1 else lambda row: tuple(row[index] for index in indexes)
+        convert = [(name, converter) for name, converter in (converters or {}).items() if name in names]
+
+        def create_row(row):
+            if len(row) < width:
+                row = row + [None] * (width - len(row))
+            row_dict = dict(zip(names, project(row)))
+            if rest is not None and len(row) > rest:
+                row_dict[None] = row[rest:]
+            for name, converter in convert:
+                value = row_dict[name]
+                if value is not None:
+                    row_dict[name] = converter(value)
+            return row_dict
+
+        rows = (create_row(row) for row in reader if row)
+        if not chunk_size:
+            yield from rows
+            return
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def project_paths(data, paths):
+    """Returns a new nested dictionary holding only the values found at the dotted < paths >
+    in < data > (e.g., ['headline.main', 'news_desk'] ->
+    {'headline': {'main': ...}, 'news_desk': ...}). Paths that cannot be resolved are omitted.
+
+    Parameters:
+        data (dict): nested dictionary
+        paths (list): dotted paths to project
+
+    Returns:
+        dict: projected dictionary
+    """
+
+    projection = {}
+    for path in paths:
+        keys = path.split('.')
+        value = data
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = projection
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+    return projection
+
+
+def read_cache(filepath):
+    """Returns a copy of the cache stored at < filepath > as a dictionary without modifying
+    the cache files, e.g., to seed test data from a production cache. Unlike
+    < create_cache() > a damaged journal is not truncated, and a SQLite cache is opened
+    read-only. A missing cache is returned as an empty dictionary.
+
+    Parameters:
+        filepath (str): path to the cache file
+
+    Returns:
+        dict: cache entries
+    """
+
+    if filepath.lower().endswith(SQLITE_CACHE_SUFFIXES):
+        if not os.path.exists(filepath):
+            return {}
+        conn = sqlite3.connect(f"file:{quote(os.path.abspath(filepath))}?mode=ro", uri=True)
+        try:
+            return {key: json_codec.loads(value) for key, value in conn.execute('SELECT key, value FROM cache')}
+        finally:
+            conn.close()
+
+    try:
+        cache = read_json(filepath)
+    except FileNotFoundError:
+        cache = {}
+    cache.update(replay_cache_journal(filepath, truncate=False))
+    return cache
+
+
+def read_csv_to_columns(filepath, encoding='utf-8', newline='', delimiter=','):
+    """Accepts a file path, creates a file object, and returns a dictionary that maps each
+    header to a list of the column values using the csv.reader(). The columns can be passed
+    to < convert_columns() > without building a dictionary per row.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+
+    Returns:
+        dict: header to column list mappings
+     """
+
+    with open(filepath, 'r', newline=newline, encoding=encoding) as file_obj:
+        reader = csv.reader(file_obj, delimiter=delimiter)
+        headers = next(reader, [])
+        columns = [list(column) for column in zip(*reader)] or [[] for header in headers]
+        return dict(zip(headers, columns))
 
 
 def read_csv_to_dicts(filepath, encoding='utf-8', newline='', delimiter=','): # f_o_s_solution
@@ -116,7 +2509,7 @@ def read_csv_to_dicts(filepath, encoding='utf-8', newline='', delimiter=','): #
 
 def read_json(filepath, encoding='utf-8'):
     """Reads a JSON document, decodes the file content, and returns a list or dictionary if
-    provided with a valid filepath.
+    provided with a valid filepath. Delegates to < json_codec > the task of decoding the content.
 
     Parameters:
         filepath (str): path to file
@@ -126,8 +2519,83 @@ def read_json(filepath, encoding='utf-8'):
         dict/list: dict or list representations of the decoded JSON document
     """
 
-    with open(filepath, 'r', encoding=encoding) as file_obj:
-        return json.load(file_obj)
+    with open(filepath, 'rb') as file_obj:
+        content = file_obj.read()
+    if codecs.lookup(encoding).name != 'utf-8':
+        content = content.decode(encoding)
+    return json_codec.loads(content) # UTF-8 bytes are decoded by the codec
+
+
+def send_request(url, params=None, timeout=10, headers=None, session=None):
+    """Sends a GET request and returns the response. Before each attempt the circuit breaker
+    for the URL's host is consulted (see < get_circuit_breaker() >) and a token is taken from
+    the host's rate limiter, if any (see < get_rate_limiter() >). Failed attempts are retried
+    as described by < active_retry_policy >.
+
+    The policy's < retry_exceptions > (connection errors and timeouts) and responses whose
+    status code is one of its < retry_statuses > count as failures. If the final attempt fails
+    the exception is raised (a < requests.HTTPError > in the case of a retryable status code).
+    Other exceptions (e.g., an invalid URL) are raised immediately without being retried or
+    counted against the circuit breaker. Other responses (including 4xx responses such as 404)
+    are returned to the caller unchanged.
+
+    If a cassette is configured (see < configure_cassette() >) responses are either recorded to
+    it or, in replay mode, served from it without any network I/O.
+
+    Parameters:
+        url (str): a uniform resource locator that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+        headers (dict): optional request headers
+        session (requests.Session): optional session used in place of the shared session
+
+    Returns:
+        requests.Response: response object
+    """
+
+    active_cassette = cassette
+    if active_cassette and active_cassette.mode == 'replay':
+        return active_cassette.replay(url, params, headers)
+
+    host = urlsplit(url).netloc
+    breaker = get_circuit_breaker(host)
+    limiter = get_rate_limiter(host)
+    policy = active_retry_policy
+    session = session or get_session()
+
+    attempt = 0
+    while True:
+        attempt += 1
+        breaker.before_call()
+        try:
+            if limiter:
+                limiter.acquire()
+            policy.count('attempts')
+            error, retry_after = None, None
+            try:
+                response = session.get(url, params=params, headers=headers, timeout=timeout)
+            except policy.retry_exceptions as exception:
+                error = exception
+            else:
+                if response.status_code in policy.retry_statuses:
+                    retry_after = response.headers.get('Retry-After')
+                    error = requests.HTTPError(f"{response.status_code} response from {host}", response=response)
+            if error is None:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        finally:
+            breaker.release()
+
+        if error is None:
+            if active_cassette:
+                active_cassette.record(url, params, headers, response)
+            return response
+        if attempt >= policy.max_attempts:
+            policy.count('give_ups')
+            raise error
+        policy.count('retries')
+        time.sleep(policy.get_delay(attempt, retry_after))
 
 
 def to_gravity_value(value):
@@ -135,7 +2603,9 @@ def to_gravity_value(value):
     unit of measure if it exists in the string (case insensitive comparison). Delegates to the
     function < to_float() > the task of casting the < value > to a float.
 
-    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+    Strings are handled without raising exceptions (see < to_float() >); numbers, booleans, and
+    < None > are returned unchanged. If a runtime exception is encountered converting any other
+    type the < value > is returned unchanged in the except block.
 
     Parameters:
         value (obj): string to be converted
@@ -144,6 +2614,14 @@ def to_gravity_value(value):
         float: if value successfully converted; otherwise returns value unchanged
     """
 
+    if type(value) is str:
+        lower = value.lower()
+        position = lower.find('standard')
+        if position != -1:
+            return to_float(value[:position].strip())
+        return to_float(value)
+    if type(value) in SCALAR_TYPES:
+        return value
     try:
         if "standard" in value.lower():
             return to_float(value[:value.lower().index('standard')].strip())
@@ -157,7 +2635,12 @@ def to_float(value):
     Can also convert numbers masquerading as strings that include one or more thousand separator
     commas (e.g., "5,000,000").
 
-    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+    Strings are screened before conversion: unless the string (less any sign) starts with a
+    digit or a period or is one of the < FLOAT_WORDS > (e.g., "nan") the < value > is returned
+    unchanged without attempting the conversion, so common non-numeric strings (e.g.,
+    "unknown", "N/A") do not raise and catch an exception. Numbers,
+    booleans, and < None > are returned unchanged. If a runtime exception is encountered the
+    < value > is returned unchanged in the except block.
 
     Parameters:
         value (obj): string or number to be converted
@@ -166,6 +2649,12 @@ def to_float(value):
         float|any: float if value successfully converted; otherwise returns value unchanged
     """
 
+    if type(value) is str:
+        number = value.replace(',', '').strip().lstrip('+-')
+        if not (number[:1].isdecimal() or number[:1] == '.' or number.lower() in FLOAT_WORDS):
+            return value
+    elif type(value) in SCALAR_TYPES:
+        return value
     try:
         return float(value.replace(',', ''))
     except:
@@ -178,7 +2667,10 @@ def to_int(value):
     commas (e.g., "5,000,000") or a period that designates a fractional component
     (e.g., "5,000,000.9999").
 
-    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+    Strings, integers, floats, booleans, and < None > are dispatched on their type and handled
+    without raising exceptions (e.g., "unknown", float("nan"), and < None > are returned
+    unchanged). If a runtime exception is encountered converting any other type the < value >
+    is returned unchanged in the except block.
 
     Parameters:
         value (str|int): string or number to be converted
@@ -187,6 +2679,16 @@ def to_int(value):
         int|any: integer if value successfully converted else returns value unchanged
     """
 
+    value_type = type(value)
+    if value_type is int or value is None:
+        return value
+    if value_type is str:
+        number = to_float(value)
+        return int(number) if type(number) is float and math.isfinite(number) else value
+    if value_type is float:
+        return int(value) if math.isfinite(value) else value
+    if value_type is bool:
+        return int(value)
     try:
         return int(to_float(value))
     except:
@@ -197,7 +2699,9 @@ def to_list(value, delimiter=None):
     """Attempts to convert a string < value > to a list in the < try > block using the provided
     < delimiter >. Removes leading/trailing spaces before converting < value > to a list.
 
-    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+    Strings are split directly; numbers, booleans, and < None > are returned unchanged. If a
+    runtime exception is encountered converting any other type the < value > is returned
+    unchanged in the except block.
 
     Parameters:
         value (str): string to be split.
@@ -207,6 +2711,10 @@ def to_list(value, delimiter=None):
          list|any: list if value successfully converted else returns value unchanged
     """
 
+    if type(value) is str and (delimiter is None or type(delimiter) is str):
+        return value.strip().split(delimiter or None)
+    if type(value) in SCALAR_TYPES:
+        return value
     try:
         if delimiter:
             return value.strip().split(delimiter)
@@ -224,6 +2732,11 @@ def to_none(value, none_values):
     is performed between the < value > and the < none_values > items. If a match is obtained
     < None > is returned; otherwise the < value > is returned unchanged.
 
+    Delegates to the function < get_none_value_set() > the task of retrieving the lower cased
+    < none_values > as a set built once per tuple, so each string is checked with a single set
+    lookup. Numbers, booleans,
+    and < None > are returned unchanged.
+
     If a runtime exception is encountered the < value > is returned unchanged in the except
     block.
 
@@ -235,6 +2748,12 @@ def to_none(value, none_values):
         None|any: if value successfully converted; otherwise returns value unchanged
     """
 
+    if type(value) is str:
+        none_set = get_none_value_set(none_values)
+        if none_set is not None:
+            return None if value.strip().lower() in none_set else value
+    elif type(value) in SCALAR_TYPES:
+        return value
     try:
         if value.strip().lower() in [value.lower() for value in none_values]:
             return None
@@ -243,6 +2762,71 @@ def to_none(value, none_values):
         return value
 
 
+def split_ndjson(filepath, parts):
+    """Partitions the NDJSON file located at < filepath > into < parts > byte ranges of
+    (roughly) equal size. Each (< start >, < end >) range can be passed to < iter_ndjson() >,
+    e.g., by a separate worker process; together the ranges yield every record exactly once.
+
+    Parameters:
+        filepath (str): path to file
+        parts (int): number of ranges
+
+    Returns:
+        list: (start, end) byte offset tuples
+    """
+
+    size = os.path.getsize(filepath)
+    return [(size * part // parts, size * (part + 1) // parts) for part in range(parts)]
+
+
+def to_columns(data, keys=None):
+    """Transposes a list of dictionaries (e.g., rows returned by < read_csv_to_dicts() >) into
+    a dictionary of equal length column lists. Dictionaries of columns (e.g., returned by
+    < read_csv_to_columns() >) are returned unchanged.
+
+    Only the passed in < keys > are transposed (default: every key found in the first row);
+    keys missing from a row are represented by < None >.
+
+    Parameters:
+        data (list|dict): rows or columns
+        keys (iterable): optional keys to transpose
+
+    Returns:
+        dict: key to column mappings
+    """
+
+    if isinstance(data, dict):
+        return data
+    if keys is None:
+        keys = data[0].keys() if data else ()
+    return {key: [row.get(key) for row in data] for key in keys}
+
+
+def to_numeric_array(values, type_name):
+    """Packs a column of converted "int", "float", or "gravity" values (see < convert_column() >)
+    into a NumPy masked array; < None > values are masked. Returns < None > if the column
+    holds any other value (e.g., a string that could not be converted) or an integer that
+    does not fit in 64 bits, leaving the column to be stored as a list.
+
+    Parameters:
+        values (list): converted values
+        type_name (str): "int", "float", or "gravity"
+
+    Returns:
+        numpy.ma.MaskedArray|None: packed column if successful; otherwise None
+    """
+
+    kind, dtype = (int, np.int64) if type_name == 'int' else (float, np.float64)
+    if not set(map(type, values)) <= {kind, type(None)}:
+        return None
+    mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    try:
+        data = np.fromiter((0 if value is None else value for value in values), dtype=dtype, count=len(values))
+    except OverflowError:
+        return None
+    return np.ma.masked_array(data, mask=mask)
+
+
 def to_year_era(value):
     """Attempts to separate the Galactic standard calendar "year" and "era" (e.g., 896BBY, 24ABY)
     segments in < value > in the < try > block for storage in a dictionary.
@@ -263,7 +2847,10 @@ def to_year_era(value):
     converting the segment representing the year to an integer. The function is called from within
     the dictionary literal.
 
-    If a runtime exception is encountered the < value > is returned unchanged in the except block.
+    Strings whose "year" segment is made up of decimal digits (the digits < int() > accepts)
+    are converted without raising exceptions; other strings, numbers, booleans, and < None > are
+    returned unchanged. If a runtime exception is encountered converting any other type the
+    < value > is returned unchanged in the except block.
 
     Parameters:
         value (str): Galactic YearEra string to be converted
@@ -272,6 +2859,13 @@ def to_year_era(value):
         dict: comprising year and era key-value pairs
      """
 
+    if type(value) is str:
+        year = value[:-3]
+        if year.isdecimal():
+            return {'year': int(year), 'era': value[-3:]}
+        return value
+    if type(value) in SCALAR_TYPES:
+        return value
     try:
         if value[:-3].isdigit():
             year = int(value[:-3])
@@ -282,8 +2876,155 @@ def to_year_era(value):
     except:
         return value
 
-def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2):
-    """Serializes object as JSON. Writes content to the provided filepath.
+def write_cache_entries(filepath, cache, entries):
+    """Adds the passed in < entries > to the < cache > and persists them. Delegates to the
+    function < append_cache_entries() > the task of appending the entries to the cache journal
+    in a single write.
+
+    Once the journal grows larger than the cache snapshot (or < CACHE_JOURNAL_MIN_BYTES >,
+    whichever is greater) the function < compact_cache() > is called to fold the journal into a
+    new snapshot. Because the snapshot must at least double in size before the next compaction
+    the total number of bytes written remains proportional to the size of the cache.
+
+    Caches that are not plain dictionaries (e.g., < SQLiteCache >) persist their own writes;
+    the entries are simply assigned and no journal is kept. An < LRUCache > writes the entries
+    through to its backend, which is then journaled if it is a plain dictionary.
+
+    Writes are serialized by < CACHE_WRITE_LOCK > so that entries written by background
+    threads are never interleaved.
+
+    Parameters:
+        filepath (str): path to the cache snapshot file
+        cache (dict|SQLiteCache|LRUCache): cache to be updated
+        entries (dict): cache keys minted by < create_cache_key() > mapped to resources
+
+    Returns:
+        None
+    """
+
+    if not entries:
+        return
+    with CACHE_WRITE_LOCK:
+        for key, value in entries.items():
+            cache[key] = value
+        if isinstance(cache, LRUCache):
+            cache = cache.backend
+        if not isinstance(cache, dict):
+            return
+        journal_size = append_cache_entries(filepath, entries)
+        try:
+            snapshot_size = os.path.getsize(filepath)
+        except FileNotFoundError:
+            snapshot_size = 0
+        if journal_size > max(snapshot_size, CACHE_JOURNAL_MIN_BYTES):
+            compact_cache(filepath, cache)
+
+
+def write_cache_entry(filepath, cache, key, value):
+    """Adds the passed in < value > to the < cache > by mapping it to the provided < key > and
+    persists the entry. Delegates to the function < write_cache_entries() > the task of
+    journaling the entry.
+
+    Parameters:
+        filepath (str): path to the cache snapshot file
+        cache (dict|SQLiteCache|LRUCache): cache to be updated
+        key (str): cache key minted by < create_cache_key() >
+        value (dict|list): resource to be cached
+
+    Returns:
+        None
+    """
+
+    write_cache_entries(filepath, cache, {key: value})
+
+
+def write_file_atomic(filepath, content, encoding='utf-8'):
+    """Writes < content > to the provided filepath atomically. The content is written to a
+    temporary file in the same directory, flushed to disk, and then renamed over < filepath >,
+    so readers see either the previous file or the new one, never a partial write. The
+    parent directory is then flushed to disk so that the rename itself survives a crash. An
+    existing file's permissions are carried over to the new file. If the file on disk already
+    holds the same content (compared by SHA-256 hash) it is left untouched.
+
+    Parameters:
+        filepath (str): the path to the file
+        content (str)/(bytes): the content to write; strings are encoded with < encoding >
+        encoding (str): name of encoding used to encode the file
+
+    Returns:
+        bool: True if the file was written; False if its content was unchanged
+    """
+
+    if isinstance(content, str):
+        content = content.encode(encoding)
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        stat = None
+    if stat is not None and stat.st_size == len(content):
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as file_obj:
+            for chunk in iter(lambda: file_obj.read(OUTPUT_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        if digest.digest() == hashlib.sha256(content).digest():
+            return False
+
+    tmp_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp" # unique per writer
+    try:
+        with open(tmp_filepath, 'wb') as file_obj:
+            file_obj.write(content)
+            file_obj.flush()
+            os.fsync(file_obj.fileno())
+        if stat is not None:
+            os.chmod(tmp_filepath, stat.st_mode & 0o7777)
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
+    if hasattr(os, 'O_DIRECTORY'): # directories cannot be opened (or fsynced) on Windows
+        dir_fd = os.open(os.path.dirname(os.path.abspath(filepath)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return True
+
+
+def write_ndjson(filepath, records, encoding='utf-8', ensure_ascii=False, append=False):
+    """Serializes each of the passed in < records > as compact JSON and writes it to the
+    provided filepath as one line (newline-delimited JSON). < records > may be any iterable,
+    including a generator: each record is written as soon as it is produced, so the records
+    are never held in memory together. If < append > is True the records are appended to the
+    file instead of replacing its contents.
+
+    Records are encoded by < json_codec >. The file can be read back lazily (or in byte
+    ranges) with < iter_ndjson() >.
+
+    Parameters:
+        filepath (str): the path to the file
+        records (iterable): JSON serializable records
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        append (bool): append to the file rather than overwrite it
+
+    Returns:
+        int: number of records written
+    """
+
+    count = 0
+    with open(filepath, 'a' if append else 'w', encoding=encoding) as file_obj:
+        for record in records:
+            file_obj.write(f"{json_codec.dumps(record, ensure_ascii=ensure_ascii, compact=True)}\n")
+            count += 1
+    return count
+
+
+def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2, compact=False):
+    """Serializes object as JSON. Writes content to the provided filepath. Delegates to
+    < json_codec > the task of encoding the data and to < write_file_atomic() > the task of
+    writing the file (atomically, skipping the write if the content is unchanged).
 
     Parameters:
         filepath (str): the path to the file
@@ -292,10 +3033,12 @@ def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2):
         ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
                             non-ASCII characters are escaped.
         indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+        compact (bool): if True whitespace is omitted and < indent > is ignored (intended for
+                        machine-only files such as the cache)
 
     Returns:
-        None
+        bool: True if the file was written; False if its content was unchanged
     """
 
-    with open(filepath, 'w', encoding=encoding) as file_obj:
-        json.dump(data, file_obj, ensure_ascii=ensure_ascii, indent=indent)
+    content = json_codec.dumps(data, indent=indent, ensure_ascii=ensure_ascii, compact=compact)
+    return write_file_atomic(filepath, content, encoding)
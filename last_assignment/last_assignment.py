@@ -1,19 +1,186 @@
+import asyncio
 import copy
 import five_oh_six as utl
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 
 # Constants
-CACHE_FILEPATH = './CACHE.json'
+CACHE_FILEPATH = os.environ.get('SWAPI_CACHE', './CACHE-standin.json' if 'SWAPI_ENDPOINT' in os.environ else './CACHE.json') # use a .db suffix (e.g., './CACHE.db') for the SQLite cache; other endpoints (e.g., swapi_standin.py) get their own cache
+CACHE_MAX_ENTRIES = None # in-memory LRU tier limits (SQLite cache only); None for no limit
+CACHE_MAX_BYTES = None
+CACHE_READ_ONLY = True # builders never mutate resources, so cached resources are shared read-only (no deep copy)
+CACHE_STALE_WHILE_REVALIDATE = False # if True expired entries are served while refreshed in background
+CACHE_TTL = {'people': None, 'planets': None, 'species': None, 'starships': None} # seconds; None never expires
+CASSETTE_FILEPATH = os.environ.get('SWAPI_CASSETTE', './CASSETTE.ndjson')
+CASSETTE_MODE = os.environ.get('SWAPI_CASSETTE_MODE') # 'record', 'replay', or None (network)
 NONE_VALUES = ('', 'n/a', 'none', 'unknown')
-SWAPI_ENDPOINT = 'https://swapi.py4e.com/api'
+NYT_ARTICLE_PATHS = ( # article values read by get_news_desks and group_articles_by_news_desk
+    'abstract', 'byline.original', 'document_type', 'headline.main', 'news_desk', 'pub_date',
+    'type_of_material', 'web_url', 'word_count'
+    )
+SWAPI_ENDPOINT = os.environ.get('SWAPI_ENDPOINT', 'https://swapi.py4e.com/api') # e.g., swapi_standin.py
 SWAPI_CATEGORES = f"{SWAPI_ENDPOINT}/"
 SWAPI_PEOPLE = f"{SWAPI_ENDPOINT}/people/"
 SWAPI_PLANETS = f"{SWAPI_ENDPOINT}/planets/"
 SWAPI_SPECIES = f"{SWAPI_ENDPOINT}/species/"
 SWAPI_STARSHIPS = f"{SWAPI_ENDPOINT}/starships/"
+SWAPI_CONCURRENCY = 10 # max concurrent remote requests issued by the bulk fetchers
+
+# Old key to new key mappings
+KEYS = {
+    "droid": {
+        "url": "url",
+        "name": "name",
+        "model": "model",
+        "manufacturer": "manufacturer",
+        "create_year": "create_date",
+        "height": "height_cm",
+        "mass": "mass_kg",
+        "equipment": "equipment",
+        "instructions": "instructions"
+        },
+    "person": {
+        "url": "url",
+        "name": "name",
+        "birth_year": "birth_date",
+        "height": "height_cm",
+        "mass": "mass_kg",
+        "homeworld": "homeworld",
+        "species": "species",
+        "force_sensitive": "force_sensitive"
+        },
+    "planet": {
+        "url": "url",
+        "name": "name",
+        "region": "region",
+        "sector": "sector",
+        "suns": "suns",
+        "moons": "moons",
+        "orbital_period": "orbital_period_days",
+        "diameter": "diameter_km",
+        "gravity": "gravity_std",
+        "climate": "climate",
+        "terrain": "terrain",
+        "population": "population"
+    },
+    "species": {
+        "url": "url",
+        "name": "name",
+        "classification": "classification",
+        "designation": "designation",
+        "average_lifespan": "average_lifespan_yrs",
+        "average_height": "average_height_cm",
+        "language": "language"
+    },
+    "starship": {
+        "url": "url",
+        "name": "name",
+        "model": "model",
+        "starship_class": "starship_class",
+        "manufacturer": "manufacturer",
+        "length": "length_m",
+        "hyperdrive_rating": "hyperdrive_rating",
+        "MGLT": "max_megalight_hr",
+        "max_atmosphering_speed": "max_atmosphering_speed_kph",
+        "crew": "crew_size",
+        "crew_members": "crew_members",
+        "passengers": "max_passengers",
+        "passengers_on_board": "passengers_on_board",
+        "cargo_capacity": "cargo_capacity_kg",
+        "consumables": "consumables",
+        "armament": "armament"
+    }
+}
+
+# Episode column to converter type mappings (see convert_episode_columns)
+EPISODE_TYPES = {
+    "series_season_num": "int",
+    "series_episode_num": "int",
+    "season_episode_num": "int",
+    "episode_prod_code": "float",
+    "episode_us_viewers_mm": "float",
+    "episode_writers": ("list", ", ")
+}
+
+# Old key to converter type mappings (see utl.compile_converter)
+ENTITY_TYPES = {
+    "droid": {
+        "url": "raw",
+        "name": "str",
+        "model": "str",
+        "manufacturer": "str",
+        "create_year": "year_era",
+        "height": "float",
+        "mass": "float",
+        "equipment": ("list", "|"),
+        "instructions": ("list", "|")
+        },
+    "person": {
+        "url": "raw",
+        "name": "str",
+        "birth_year": "year_era",
+        "height": "float",
+        "mass": "float",
+        "homeworld": "homeworld",
+        "species": "species",
+        "force_sensitive": "str"
+        },
+    "planet": {
+        "url": "raw",
+        "name": "str",
+        "region": "str",
+        "sector": "str",
+        "suns": "int",
+        "moons": "int",
+        "orbital_period": "float",
+        "diameter": "int",
+        "gravity": "gravity",
+        "climate": ("list", ", "),
+        "terrain": ("list", ", "),
+        "population": "int"
+    },
+    "species": {
+        "url": "raw",
+        "name": "str",
+        "classification": "str",
+        "designation": "str",
+        "average_lifespan": "int",
+        "average_height": "float",
+        "language": "raw"
+    },
+    "starship": {
+        "url": "raw",
+        "name": "str",
+        "model": "str",
+        "starship_class": "str",
+        "manufacturer": "str",
+        "length": "float",
+        "hyperdrive_rating": "float",
+        "MGLT": "int",
+        "max_atmosphering_speed": "int",
+        "crew": "int",
+        "crew_members": ("list", ", "),
+        "passengers": "int",
+        "passengers_on_board": ("list", ", "),
+        "cargo_capacity": "int",
+        "consumables": "raw",
+        "armament": ("list", ",")
+    }
+}
+
+# Record/replay remote requests
+utl.configure_cassette(CASSETTE_FILEPATH, CASSETTE_MODE)
 
 # Create/retrieve cache
-cache = utl.create_cache(CACHE_FILEPATH)
+cache = utl.create_cache(CACHE_FILEPATH, CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_READ_ONLY)
+inflight = utl.SingleFlight() # coalesces concurrent fetches of the same resource
+revalidating = set() # cache keys being refreshed in the background
+revalidating_lock = threading.Lock()
 
 
 def assign_crew_members(crew_size, crew_positions, personnel):
@@ -99,6 +266,42 @@ def calculate_articles_mean_word_count(articles):
     avg_word_count = word_count / len(articles)
     return round(avg_word_count,2)
 
+def convert_episode_columns(episodes, none_values=NONE_VALUES, use_numpy=None):
+    """Column-oriented counterpart of < convert_episode_values() >. Converts whole episode
+    columns (e.g., returned by < utl.read_csv_to_columns() >) per the < EPISODE_TYPES >
+    conversions and returns a < utl.RecordBatch >; columns not listed in < EPISODE_TYPES > are
+    passed to < utl.to_none() > only. Delegates to < utl.convert_columns() > the task of
+    converting the columns.
+
+    If NumPy is installed (and < use_numpy > is not False) the season and episode number
+    columns are returned as int64 masked arrays and the production code and viewership columns
+    as float64 masked arrays. Values in < none_values > are masked; thousand separator strings
+    such as "5,000,000" are parsed. A column holding a value that cannot be parsed is returned
+    as a list instead. The batch can be passed directly to < get_most_viewed_episode() >:
+
+        episodes = convert_episode_columns(utl.read_csv_to_columns("data-clone_wars_episodes.csv"))
+        viewers = episodes.column("episode_us_viewers_mm") # masked array
+        most_viewed = get_most_viewed_episode(episodes)
+
+    Rows materialized from the batch are equal to the dictionaries returned by
+    < convert_episode_values() >, except that an "episode_writers" value in < none_values >
+    (e.g., "unknown") becomes < None > rather than a one-item list (e.g., ['unknown']).
+
+    Parameters:
+        episodes (dict|list): episode columns or nested episode dictionaries
+        none_values (tuple): strings to convert to None
+        use_numpy (bool): use NumPy for numeric columns (default: if installed)
+
+    Returns:
+        utl.RecordBatch: converted episodes
+    """
+
+    columns = utl.to_columns(episodes)
+    key_map = {key: key for key in columns}
+    type_spec = {key: EPISODE_TYPES.get(key, "str") for key in columns}
+    return utl.convert_columns(columns, key_map, type_spec, none_values, use_numpy)
+
+
 def convert_episode_values(episodes, none_values):
     """Converts select string values to either < int >, < float >, < list >, or < None >
     in the passed in list of nested dictionaries. The function delegates to the
@@ -183,11 +386,61 @@ def count_episodes_by_director(episodes): #week_11_solution
     return director_count  
 
 
+def create_converter(keys, entity, none_values=NONE_VALUES, planets=None, planet_key="name", species=None, species_key="name"):
+    """Returns a compiled conversion function for the passed in < entity > type (i.e., "droid",
+    "person", "planet", "species", or "starship"). Delegates to the function
+    < utl.compile_converter > the task of generating the function from the < keys[entity] >
+    mappings and the < ENTITY_TYPES[entity] > converter types. The function is built once and
+    can then be called for every record of that type:
+
+        convert = create_converter(keys, "planet")
+        planets = [convert(planet) for planet in wookiee_planets]
+
+    The compiled function accepts the same < swapi_data > and optional < wookiee_data >
+    arguments as the < create_*() > builders and reproduces the fixture outputs. Person
+    converters resolve the homeworld and species URLs with < get_swapi_resource > and convert
+    them with compiled planet and species converters. The < planets > and < species > lists
+    (and their search keys) supply the supplementary Wookieepedia data, if any.
+
+    Parameters:
+        keys (dict): Old key to new key mappings
+        entity (str): entity type
+        none_values (tuple): strings to convert to None
+        planets (list|utl.DictIndex): supplementary planet data (person converters only)
+        planet_key (str): key name used in supplemental planet data search
+        species (list|utl.DictIndex): supplementary species data (person converters only)
+        species_key (str): key name used in supplemental species data search
+
+    Returns:
+        function: compiled conversion function
+    """
+
+    converters = {}
+    if entity == "person":
+        convert_planet = create_converter(keys, "planet", none_values)
+        convert_species = create_converter(keys, "species", none_values)
+
+        def convert_homeworld(url):
+            planet = get_swapi_resource(url)
+            wookiee_planet = utl.get_nested_dict(planets, planet_key, planet.get("name")) if planets else None
+            return convert_planet(planet, wookiee_planet)
+
+        def convert_person_species(urls):
+            swapi_species = get_swapi_resource(urls[0])
+            wookiee_species = utl.get_nested_dict(species, species_key, swapi_species.get("name")) if species else None
+            return convert_species(swapi_species, wookiee_species)
+
+        converters = {"homeworld": convert_homeworld, "species": convert_person_species}
+
+    return utl.compile_converter(keys[entity], ENTITY_TYPES[entity], none_values, converters)
+
+
 def create_droid(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
     """Returns a new "thinned" dictionary representation of a droid based on the passed in
-    < swapi_data > dictionary. If an optional < wookiee_data > dictionary is provided by the
-    caller, the < swapi_data > dictionary is updated with the < wookiee_data > key-value
-    pairs prior to creating the new dictionary representation of the droid.
+    < swapi_data > dictionary. If an optional < wookiee_data > dictionary is provided by the caller,
+    the two are layered in a read-only < utl.RecordView > (< wookiee_data > values take precedence)
+    prior to creating the new dictionary representation of the droid. Neither dictionary is copied
+    or mutated; < swapi_data > may itself be a < utl.RecordView >.
 
     The new dictionary is constructed by mapping a subset of the < swapi_data > dictionary's
     key-value pairs to the new dictionary based on the provided < keys > dictionary. The
@@ -220,7 +473,7 @@ def create_droid(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
 
     Parameters:
         keys (dict): Old key to new key mappings
-        swapi_data (dict): source data
+        swapi_data (dict|utl.RecordView): source data
         wookiee_data (dict): additional data to be combined with < swapi_data >
         none_values (tuple): strings to convert to None
 
@@ -228,8 +481,8 @@ def create_droid(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
         dict: new dictionary representation of a droid
     """
     droid_dict = {}
-    if wookiee_data: 
-        swapi_data.update(wookiee_data)
+    if wookiee_data:
+        swapi_data = utl.RecordView(wookiee_data, swapi_data)
     for key, value in keys["droid"].items(): 
         if swapi_data.get(key) in none_values:
             droid_dict[value] = None
@@ -250,8 +503,9 @@ def create_droid(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
 def create_person(keys, swapi_data, wookiee_data=None, planets=None, planet_key="name", species=None, species_key="name", none_values=NONE_VALUES):
     """Returns a new "thinned" dictionary representation of a person based on the passed in
     < swapi_data > dictionary. If an optional < wookiee_data > dictionary is provided by the caller,
-    the < swapi_data > dictionary is updated with the < wookiee_data > key-value pairs prior to creating
-    the new dictionary representation of the person.
+    the two are layered in a read-only < utl.RecordView > (< wookiee_data > values take precedence)
+    prior to creating the new dictionary representation of the person. Neither dictionary is copied
+    or mutated; < swapi_data > may itself be a < utl.RecordView >.
 
     The new dictionary is constructed by mapping a subset of the < swapi_data > dictionary's
     key-value pairs to the new dictionary based on the provided < keys > dictionary. The
@@ -289,11 +543,11 @@ def create_person(keys, swapi_data, wookiee_data=None, planets=None, planet_key=
 
     Parameters:
         keys (dict): Old key to new key mappings
-        swapi_data (dict): source data
+        swapi_data (dict|utl.RecordView): source data
         wookiee_data (dict): additional data to be combined with < swapi_data >
-        planets (tuple): Supplementary planet data
+        planets (list|utl.DictIndex): Supplementary planet data
         planets_key (str): key name used in supplemental species data search
-        species (tuple): Supplemenatry species data
+        species (list|utl.DictIndex): Supplemenatry species data
         species_key (str): key name used in supplemental species data search
         none_values (tuple): strings to convert to None
 
@@ -301,7 +555,8 @@ def create_person(keys, swapi_data, wookiee_data=None, planets=None, planet_key=
         dict: new dictionary representation of a person
     """
     person_dict = {}
-    if wookiee_data: swapi_data.update(wookiee_data)
+    if wookiee_data:
+        swapi_data = utl.RecordView(wookiee_data, swapi_data)
     for key, value in keys["person"].items(): 
         if key == 'url':
             person_dict[value] = swapi_data[key] 
@@ -326,8 +581,9 @@ def create_person(keys, swapi_data, wookiee_data=None, planets=None, planet_key=
 def create_planet(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
     """Returns a new "thinned" dictionary representation of a planet based on the passed in
     < swapi_data > dictionary. If an optional < wookiee_data > dictionary is provided by the caller,
-    the < swapi_data > dictionary is updated with the < wookiee_data > key-value pairs prior to creating
-    the new dictionary representation of the droid.
+    the two are layered in a read-only < utl.RecordView > (< wookiee_data > values take precedence)
+    prior to creating the new dictionary representation of the planet. Neither dictionary is copied
+    or mutated; < swapi_data > may itself be a < utl.RecordView >.
 
     The new dictionary is constructed by mapping a subset of the < swapi_data > dictionary's
     key-value pairs to the new dictionary based on the provided < keys > dictionary. The
@@ -363,7 +619,7 @@ def create_planet(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
 
     Parameters:
         keys (dict): Old key to new key mappings
-        swapi_data (dict): source data
+        swapi_data (dict|utl.RecordView): source data
         wookiee_data (dict): additional data to be combined with < swapi_data >
         none_values (tuple): strings to convert to None
 
@@ -372,7 +628,7 @@ def create_planet(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
     """
     planet_dict = {}
     if wookiee_data:
-        swapi_data.update(wookiee_data)
+        swapi_data = utl.RecordView(wookiee_data, swapi_data)
     for key, value in keys['planet'].items():
             if key == "url" :
                 planet_dict[value] = swapi_data.get(key)
@@ -393,11 +649,46 @@ def create_planet(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
 
 
 
+def create_planets(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES, use_numpy=None):
+    """Batch counterpart of < create_planet() >. Converts a whole dataset of planets column by
+    column and returns a < utl.RecordBatch > whose rows (built only when accessed) match the
+    dictionaries returned by the planet converter compiled by < create_converter() >:
+
+        planets = create_planets(keys, utl.read_csv_to_columns("data-wookieepedia_planets.csv"))
+        diameters = planets.column("diameter_km") # masked array if NumPy is installed
+
+    < swapi_data > and < wookiee_data > may each be a list of dictionaries or a dictionary of
+    columns (see < utl.read_csv_to_columns() >). If < wookiee_data > is provided its rows must
+    align with the < swapi_data > rows; each of its columns replaces the matching
+    < swapi_data > column.
+
+    Delegates to the function < utl.convert_columns() > the task of converting the columns.
+    The numeric columns (suns, moons, orbital period, diameter, gravity, and population) are
+    parsed with NumPy when it is installed unless < use_numpy > is False.
+
+    Parameters:
+        keys (dict): Old key to new key mappings
+        swapi_data (list|dict): source rows or columns
+        wookiee_data (list|dict): additional rows or columns to be combined with < swapi_data >
+        none_values (tuple): strings to convert to None
+        use_numpy (bool): use NumPy for numeric columns (default: if installed)
+
+    Returns:
+        utl.RecordBatch: planets
+    """
+
+    columns = utl.to_columns(swapi_data, keys["planet"])
+    if wookiee_data:
+        columns = {**columns, **utl.to_columns(wookiee_data)}
+    return utl.convert_columns(columns, keys["planet"], ENTITY_TYPES["planet"], none_values, use_numpy)
+
+
 def create_species(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
     """Returns a new "thinned" dictionary representation of a species based on the passed in
     < swapi_data > dictionary. If an optional < wookiee_data > dictionary is provided by the caller,
-    the < swapi_data > dictionary is updated with the < wookiee_data > key-value pairs prior to creating
-    the new dictionary representation of the droid.
+    the two are layered in a read-only < utl.RecordView > (< wookiee_data > values take precedence)
+    prior to creating the new dictionary representation of the species. Neither dictionary is copied
+    or mutated; < swapi_data > may itself be a < utl.RecordView >.
 
     The new dictionary is constructed by mapping a subset of the < swapi_data > dictionary's
     key-value pairs to the new dictionary based on the provided < keys > dictionary. The
@@ -428,7 +719,7 @@ def create_species(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES)
 
     Parameters:
         keys (dict): Old key to new key mappings
-        swapi_data (dict): source data
+        swapi_data (dict|utl.RecordView): source data
         wookiee_data (dict): additional data to be combined with < swapi_data >
         none_values (tuple): strings to convert to None
 
@@ -438,7 +729,7 @@ def create_species(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES)
 
     species_dict = {} 
     if wookiee_data:
-       swapi_data.update(wookiee_data)
+       swapi_data = utl.RecordView(wookiee_data, swapi_data)
     for key, value in keys["species"].items():
        if key in ["url", "language"] and key in swapi_data: 
            species_dict[value] = swapi_data[key]
@@ -457,8 +748,9 @@ def create_species(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES)
 def create_starship(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES):
     """Returns a new "thinned" dictionary representation of a starship based on the passed in
     < swapi_data > dictionary. If an optional < wookiee_data > dictionary is provided by the caller,
-    the < swapi_data > dictionary is updated with the < wookiee_data > key-value pairs prior to
-    creating the new dictionary representation of the droid.
+    the two are layered in a read-only < utl.RecordView > (< wookiee_data > values take precedence)
+    prior to creating the new dictionary representation of the starship. Neither dictionary is
+    copied or mutated; < swapi_data > may itself be a < utl.RecordView >.
 
     The new dictionary is constructed by mapping a subset of the < swapi_data > dictionary's
     key-value pairs to the new dictionary based on the provided < keys > dictionary. The
@@ -500,7 +792,7 @@ def create_starship(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES
 
     Parameters:
         keys (dict): Old key to new key mappings
-        swapi_data (dict): source data
+        swapi_data (dict|utl.RecordView): source data
         wookiee_data (dict): additional data to be combined with < swapi_data >
         none_values (tuple): strings to convert to None
 
@@ -509,7 +801,7 @@ def create_starship(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES
     """
     starship_dict = {} 
     if wookiee_data:
-       swapi_data.update(wookiee_data)
+       swapi_data = utl.RecordView(wookiee_data, swapi_data)
 
     for key, value in keys["starship"].items():
         if key in ["url", "consumables"] and key in swapi_data: 
@@ -526,18 +818,42 @@ def create_starship(keys, swapi_data, wookiee_data=None, none_values=NONE_VALUES
 
 
 
+def fetch_swapi_resource(url, params=None, timeout=10):
+    """Called by the leader of an < inflight > call. Checks the local < cache > again before
+    delegating to the function < refresh_swapi_resource > the task of retrieving the resource
+    from the remote API: a caller that missed the cache just before a previous leader
+    finished refreshing the same resource is served the refreshed resource instead of
+    fetching it a second time.
+
+    Parameters:
+        url (str): a uniform resource locator that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+
+    Returns:
+        dict|list: requested resource as stored in the < cache >
+    """
+
+    key = utl.create_cache_key(url, params)
+    if key in cache and not is_swapi_resource_expired(url, params):
+        with revalidating_lock:
+            revalidating.discard(key)
+        return cache[key]
+    return refresh_swapi_resource(url, params, timeout)
+
+
 def get_homeworld(keys, swapi_url, planets=None, planet_key="name", none_values=NONE_VALUES):
     """Retrieves a SWAPI representation of a planet using the provided < swapi_url >.
-    If an optional < planets > list is provided by the caller the function
-    < utl.get_nested_dict() > is called to retrieve a second dictionary representation
-    of the planet. Both the SWAPI and Wookieepedia dictionaries along with the < keys >
+    If an optional < planets > list (or a < utl.DictIndex > built on < planet_key >) is
+    provided by the caller the function < utl.get_nested_dict() > is called to retrieve a second
+    dictionary representation of the planet. Both the SWAPI and Wookieepedia dictionaries along with the < keys >
     and < none_values > are then passed to the function < create_planet() > in order to
     return an enhanced dictionary representation of the planet to the caller.
 
     Parameters:
         keys (dict): Old key to new key mappings
         swapi_url (str): SWAPI uniform resource locator
-        planets (list): supplemental planet data
+        planets (list|utl.DictIndex): supplemental planet data
         planet_key (str): key name used in supplemental planet data search
         none_values (tuple): strings to convert to None
 
@@ -556,16 +872,16 @@ def get_homeworld(keys, swapi_url, planets=None, planet_key="name", none_values=
 
 def get_species(keys, swapi_url, species=None, species_key="name", none_values=NONE_VALUES):
     """Retrieves a SWAPI representation of a species using the provided < swapi_url >.
-    If an optional < species > list is provided by the caller the function
-    < utl.get_nested_dict() > is called to retrieve a second dictionary representation
-    of the species. Both the SWAPI and Wookieepedia dictionaries along with the < keys >
+    If an optional < species > list (or a < utl.DictIndex > built on < species_key >) is
+    provided by the caller the function < utl.get_nested_dict() > is called to retrieve a second
+    dictionary representation of the species. Both the SWAPI and Wookieepedia dictionaries along with the < keys >
     and < none_values > are then passed to the function < create_species() > in order to
     return an enhanced dictionary representation of the species to the caller.
 
     Parameters:
         keys (dict): Old key to new key mappings
         swapi_url (str): SWAPI uniform resource locator
-        species (list): supplemental species data
+        species (list|utl.DictIndex): supplemental species data
         species_key (str): key name used in supplemental species data search
         none_values (tuple): strings to convert to None
 
@@ -590,13 +906,26 @@ def get_most_viewed_episode(episodes): #ps4_solution
     the task of determining if the episode includes viewership "episode_us_viewers_mm"
     numeric data.
 
+    If a < utl.RecordBatch > (see < convert_episode_columns() >) whose viewership column is a
+    NumPy masked array is passed in, the maximum and ties are computed on the array and only
+    the matching rows are materialized.
+
     Parameters:
-        episodes (list): nested episode dictionaries
+        episodes (list|utl.RecordBatch): nested episode dictionaries
 
     Returns:
         list: episode(s) with the highest recorded viewership.
     """
 
+    if isinstance(episodes, utl.RecordBatch) and episodes.columns:
+        viewers = episodes.columns.get('episode_us_viewers_mm')
+        if utl.np is not None and isinstance(viewers, utl.np.ma.MaskedArray):
+            values = viewers.filled(0) # masked (None) values have no viewer data
+            has_data = (values != 0) & ~utl.np.isnan(values)
+            if not has_data.any() or values[has_data].max() < 0:
+                return []
+            return [episodes[index] for index in utl.np.flatnonzero(has_data & (values == values[has_data].max()))]
+
     max_viewership = 0
     most_viewed_episodes = [] 
 
@@ -639,6 +968,28 @@ def get_news_desks(articles, none_values):
     return news_desks
 
 
+def get_swapi_category(url):
+    """Returns the SWAPI category (e.g., "people", "planets", "species", "starships") of the
+    resource identified by the passed in < url >. The category is the first path segment that
+    follows the "api" segment.
+
+    Example:
+       url = https://swapi.py4e.com/api/planets/1/
+       returns 'planets'
+
+    Parameters:
+        url (str): SWAPI uniform resource locator
+
+    Returns:
+        str|None: SWAPI category; None if the < url > does not include a category
+    """
+
+    segments = [segment for segment in urlparse(url).path.split('/') if segment]
+    if 'api' in segments and segments.index('api') + 1 < len(segments):
+        return segments[segments.index('api') + 1].lower()
+    return None
+
+
 def get_swapi_resource(url, params=None, timeout=10):
     """Retrieves a deep copy of a SWAPI resource from either the local < cache >
     dictionary or from a remote API if no local copy exists. Delegates to the function
@@ -646,13 +997,28 @@ def get_swapi_resource(url, params=None, timeout=10):
     resource. If the desired resource is not located in the cache, delegates to the
     function < get_resource > the task of retrieving the resource from SWAPI.
     A deep copy of the resource retrieved remotely is then added to the local < cache > by
-    mapping it to a new < cache[key] >. The mutated cache is written to the file
-    system before a deep copy of the resource is returned to the caller.
+    mapping it to a new < cache[key] >. Delegates to the function < utl.write_cache_entry >
+    the task of appending the new entry to the cache journal before the resource is returned
+    to the caller.
 
     WARN: Deep copying is required to guard against possible mutatation of the cached
     objects when dictionaries representing SWAPI entities (e.g., films, people, planets,
     species, starships, and vehicles) are modified by other processes.
 
+    If < CACHE_READ_ONLY > is True no deep copies are made. Resources are frozen once by
+    < utl.freeze > when added to the cache and the same read-only object is returned on every
+    cache hit. Callers must not attempt to mutate the returned resource.
+
+    Cached resources expire once they are older than the time-to-live assigned to their SWAPI
+    category in < CACHE_TTL >. Delegates to the function < is_swapi_resource_expired > the task
+    of checking the entry's age. An expired resource is revalidated by the function
+    < refresh_swapi_resource >. If < CACHE_STALE_WHILE_REVALIDATE > is True the expired
+    resource is returned immediately while the refresh runs in a background thread.
+
+    Remote fetches are coalesced by < inflight >. If several threads miss on the same < key >
+    at the same time only the first one calls < fetch_swapi_resource >; the others wait for
+    and share its result.
+
     Parameters:
         url (str): a uniform resource locator that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
@@ -663,14 +1029,123 @@ def get_swapi_resource(url, params=None, timeout=10):
       """
 
     key = utl.create_cache_key(url, params)
-    if key in cache.keys():
-        return copy.deepcopy(cache[key]) # recursive copy of objects
+    if key in cache.keys() and not is_swapi_resource_expired(url, params):
+        resource = cache[key]
+    elif key in cache.keys() and CACHE_STALE_WHILE_REVALIDATE:
+        with revalidating_lock:
+            if key not in revalidating:
+                revalidating.add(key)
+                threading.Thread(
+                    target=inflight.do,
+                    args=(key, fetch_swapi_resource, url, params, timeout),
+                    daemon=True
+                    ).start()
+        resource = cache[key]
     else:
-        resource = utl.get_resource(url, params, timeout)
-        cache[key] = copy.deepcopy(resource) # recursive copy of objects
-        utl.write_json(CACHE_FILEPATH, cache) # persist mutated cache
+        resource = inflight.do(key, fetch_swapi_resource, url, params, timeout) # single flight
+
+    if CACHE_READ_ONLY:
+        return resource # shared read-only object
+    return copy.deepcopy(resource) # recursive copy of objects
+
+
+def get_swapi_resources(resources, timeout=10, concurrency=SWAPI_CONCURRENCY):
+    """Synchronous wrapper around < get_swapi_resources_async > that lets callers retrieve many
+    SWAPI resources at once without adopting asyncio. Runs the coroutine in a new event loop
+    and blocks until every resource has been retrieved.
+
+    WARN: Must not be called from a running event loop. Coroutines should await
+    < get_swapi_resources_async > directly.
+
+    Parameters:
+        resources (list): URL strings and/or (< url >, < params >) tuples
+        timeout (int): timeout value in seconds
+        concurrency (int): maximum number of remote requests in flight at once
+
+    Returns:
+        list: requested resources in the order in which they were requested
+    """
+
+    return asyncio.run(get_swapi_resources_async(resources, timeout, concurrency))
+
+
+async def get_swapi_resources_async(resources, timeout=10, concurrency=SWAPI_CONCURRENCY):
+    """Retrieves many SWAPI resources concurrently. Each of the passed in < resources > is
+    either a URL string or a (< url >, < params >) tuple. The local < cache > is consulted
+    first; resources that are missing or expired (see < is_swapi_resource_expired >) are
+    fetched from the remote API with at most < concurrency > requests in flight at once.
+
+    Remote requests are sent through the shared session in worker threads by the function
+    < utl.get_conditional_resource >. Requests for the same resource are coalesced by
+    < inflight >, both within the batch and with threads calling < get_swapi_resource >.
+    The fetched resources and their metadata are written to the cache once, in a single call
+    to < utl.write_cache_entries >, after all requests have completed. Expired resources that
+    cannot be refreshed because the remote API is unavailable are served from the cache.
+
+    Parameters:
+        resources (list): URL strings and/or (< url >, < params >) tuples
+        timeout (int): timeout value in seconds
+        concurrency (int): maximum number of remote requests in flight at once
+
+    Returns:
+        list: requested resources in the order in which they were requested
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+    fetched = {} # key -> (resource, meta, modified)
+
+    async def fetch(url, params, key):
+        if key in fetched:
+            return fetched[key][0] # fetched by an earlier flight in this batch
+        if key in cache and not is_swapi_resource_expired(url, params):
+            return cache[key] # refreshed by a flight that completed after the caller missed
+        meta_key = utl.create_cache_meta_key(key)
+        meta = (cache.get(meta_key) or {}) if key in cache else {}
+        async with semaphore:
+            try:
+                resource, validators = await asyncio.to_thread(
+                    utl.get_conditional_resource,
+                    url, params, timeout, meta.get('etag'), meta.get('last_modified')
+                    )
+            except utl.REMOTE_ERRORS:
+                if key in cache:
+                    return cache[key] # upstream unavailable; fall back to cached resource
+                raise
+        modified = resource is not None
+        if not modified:
+            resource = cache[key] # not modified
+        elif CACHE_READ_ONLY:
+            resource = utl.freeze(resource)
+        meta = {'fetched_at': time.time(), **validators}
+        if not (is_swapi_meta_needed(url, validators) or meta_key in cache):
+            meta = None # nothing to revalidate
+        fetched[key] = (resource, meta, modified)
         return resource
 
+    async def get(resource):
+        url, params = (resource, None) if isinstance(resource, str) else resource
+        key = utl.create_cache_key(url, params)
+        if key in fetched:
+            resource = fetched[key][0]
+        elif key in cache and not is_swapi_resource_expired(url, params):
+            resource = cache[key]
+        else:
+            resource = await inflight.do_async(key, fetch, url, params, key) # single flight
+        if CACHE_READ_ONLY:
+            return resource # shared read-only object
+        return copy.deepcopy(resource) # recursive copy of objects
+
+    try:
+        return await asyncio.gather(*[get(resource) for resource in resources])
+    finally:
+        entries = {}
+        for key, (resource, meta, modified) in fetched.items():
+            if modified:
+                entries[key] = resource
+            if meta:
+                entries[utl.create_cache_meta_key(key)] = meta
+        utl.write_cache_entries(CACHE_FILEPATH, cache, entries) # single cache write
+
 
 def group_articles_by_news_desk(news_desks, articles): #week 14 + ps 11 solution
     """Returns a dictionary of "news desk" key-value pairs that group the passed in
@@ -752,8 +1227,170 @@ def has_viewer_data(episode): #week_11 solution
         return False
 
 
+def is_swapi_meta_needed(url, validators):
+    """Checks whether the fetch metadata of the SWAPI resource identified by the passed in
+    < url > is worth storing in the < cache >: it is needed only if the resource's category has
+    a time-to-live in < CACHE_TTL > or if the response carried an "ETag" or "Last-Modified"
+    validator that can be sent with a later conditional request.
+
+    Parameters:
+        url (str): a uniform resource locator that specifies the resource.
+        validators (dict): 'etag' and 'last_modified' response header values
+
+    Returns:
+        bool: True if the metadata should be stored; otherwise False
+    """
+
+    if CACHE_TTL.get(get_swapi_category(url)) is not None:
+        return True
+    return bool(validators.get('etag') or validators.get('last_modified'))
+
+
+def is_swapi_resource_expired(url, params=None):
+    """Checks whether the cached SWAPI resource identified by the passed in < url > and
+    < params > is older than the time-to-live (in seconds) assigned to its SWAPI category in
+    < CACHE_TTL >. Categories mapped to < None > (or missing from < CACHE_TTL >) never expire.
+    A cached resource without a recorded fetch timestamp is considered expired if its category
+    has a time-to-live.
+
+    Parameters:
+        url (str): a uniform resource locator that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+
+    Returns:
+        bool: True if the cached resource has expired; otherwise False
+    """
+
+    ttl = CACHE_TTL.get(get_swapi_category(url))
+    if ttl is None:
+        return False
+    meta = cache.get(utl.create_cache_meta_key(utl.create_cache_key(url, params)))
+    if not meta or meta.get('fetched_at') is None:
+        return True
+    return time.time() - meta['fetched_at'] > ttl
+
+
+def iter_swapi_resources(url, params=None, timeout=10):
+    """Generator that yields, one at a time, every entity returned by a SWAPI list or search
+    endpoint (e.g., < SWAPI_PEOPLE > with params {"search": "skywalker"}) across all pages of
+    the response. Each page's envelope is retrieved by < get_swapi_resource > and is therefore
+    cached under its own key (e.g., "https://swapi.py4e.com/api/people/?page=2").
+
+    The page referenced by an envelope's "next" link is requested in a background thread while
+    the entities of the current page are being consumed. Only the current and next pages are
+    held in memory, so an entire catalog can be streamed in constant memory.
+
+    Parameters:
+        url (str): SWAPI list or search endpoint
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+
+    Returns:
+        generator: yields entity dictionaries in the order returned by SWAPI
+    """
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = executor.submit(get_swapi_resource, url, params, timeout)
+        while page:
+            envelope = page.result()
+            next_url = envelope.get('next')
+            page = executor.submit(get_swapi_resource, next_url, None, timeout) if next_url else None
+            yield from envelope.get('results', [])
+
+
+def join_swapi_resources(url, wookiee_data, key="name", how="left", params=None, timeout=10):
+    """Joins every entity returned by a SWAPI list or search endpoint with the supplementary
+    Wookieepedia records (e.g., the rows of "data-wookieepedia_planets.csv") in a single hash
+    join pass on the normalized < key > value (see < utl.create_join_key() >). Delegates to
+    < iter_swapi_resources > the task of streaming the SWAPI catalog and to < utl.HashJoin >
+    the task of joining it, so only the Wookieepedia records are held in memory.
+
+    The returned join yields (< swapi_data >, < wookiee_data >) pairs that can be passed
+    straight to a builder or compiled converter:
+
+        join = join_swapi_resources(SWAPI_PLANETS, wookiee_planets)
+        convert = create_converter(KEYS, "planet")
+        planets = [convert(swapi_data, wookiee_data) for swapi_data, wookiee_data in join]
+        missing = join.unmatched_right() # Wookieepedia planets unknown to SWAPI
+
+    Parameters:
+        url (str): SWAPI list or search endpoint
+        wookiee_data (iterable): supplementary Wookieepedia records
+        key (str|function): key name (or function returning the key value) shared by both sides
+        how (str): "left" (every SWAPI entity) or "inner" (matched entities only)
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+
+    Returns:
+        utl.HashJoin: iterable join
+    """
+
+    return utl.HashJoin(iter_swapi_resources(url, params, timeout), wookiee_data, key, how=how)
+
+
+def refresh_swapi_resource(url, params=None, timeout=10):
+    """Retrieves a SWAPI resource from the remote API and records it in the local < cache >
+    along with its fetch timestamp and validators. If the resource is already cached, the
+    "ETag" and "Last-Modified" validators recorded when it was last fetched are sent with the
+    request; a 304 (Not Modified) response only renews the fetch timestamp and the cached
+    resource is reused without downloading it again. Delegates to the function
+    < utl.get_conditional_resource > the task of performing the conditional request.
+
+    Metadata is stored in the < cache > under the key minted by < utl.create_cache_meta_key >
+    and is structured as follows:
+
+    {'fetched_at': < float >, 'etag': < str|None >, 'last_modified': < str|None >}
+
+    Metadata is only written if it is needed (see < is_swapi_meta_needed >) or if the resource
+    already has metadata that must be renewed.
+
+    If the remote API is unavailable (e.g., retries are exhausted or the host's circuit breaker
+    is open) and the resource is already cached, the cached resource is returned unchanged.
+
+    WARN: The returned resource is the object held in the < cache >, not a copy. Callers other
+    than < get_swapi_resource > must not mutate it.
+
+    Parameters:
+        url (str): a uniform resource locator that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+
+    Returns:
+        dict|list: requested resource as stored in the < cache >
+    """
+
+    key = utl.create_cache_key(url, params)
+    meta_key = utl.create_cache_meta_key(key)
+    try:
+        meta = (cache.get(meta_key) or {}) if key in cache else {}
+        try:
+            resource, validators = utl.get_conditional_resource(
+                url, params, timeout, meta.get('etag'), meta.get('last_modified')
+                )
+        except utl.REMOTE_ERRORS:
+            if key in cache:
+                return cache[key] # upstream unavailable; fall back to cached resource
+            raise
+        if resource is None:
+            resource = cache[key] # not modified
+        else:
+            if CACHE_READ_ONLY:
+                resource = utl.freeze(resource)
+            utl.write_cache_entry(CACHE_FILEPATH, cache, key, resource) # journal entry
+        if is_swapi_meta_needed(url, validators) or meta_key in cache:
+            meta = {'fetched_at': time.time(), **validators}
+            utl.write_cache_entry(CACHE_FILEPATH, cache, meta_key, meta)
+    finally:
+        with revalidating_lock:
+            revalidating.discard(key)
+    return resource
+
+
 def main():
-    """Entry point for program.
+    """Entry point for program. Delegates to the function < run_challenges > the task of
+    working through the challenges. Their JSON outputs are buffered by a < utl.OutputWriter >
+    and written together (atomically, skipping unchanged files) once the challenges return or
+    raise.
 
     Parameters:
         None
@@ -762,70 +1399,21 @@ def main():
         None
     """
 
-    keys = {
-        "droid": {
-            "url": "url",
-            "name": "name",
-            "model": "model",
-            "manufacturer": "manufacturer",
-            "create_year": "create_date",
-            "height": "height_cm",
-            "mass": "mass_kg",
-            "equipment": "equipment",
-            "instructions": "instructions"
-            },
-        "person": {
-            "url": "url",
-            "name": "name",
-            "birth_year": "birth_date",
-            "height": "height_cm",
-            "mass": "mass_kg",
-            "homeworld": "homeworld",
-            "species": "species",
-            "force_sensitive": "force_sensitive"
-            },
-        "planet": {
-            "url": "url",
-            "name": "name",
-            "region": "region",
-            "sector": "sector",
-            "suns": "suns",
-            "moons": "moons",
-            "orbital_period": "orbital_period_days",
-            "diameter": "diameter_km",
-            "gravity": "gravity_std",
-            "climate": "climate",
-            "terrain": "terrain",
-            "population": "population"
-        },
-        "species": {
-            "url": "url",
-            "name": "name",
-            "classification": "classification",
-            "designation": "designation",
-            "average_lifespan": "average_lifespan_yrs",
-            "average_height": "average_height_cm",
-            "language": "language"
-        },
-        "starship": {
-            "url": "url",
-            "name": "name",
-            "model": "model",
-            "starship_class": "starship_class",
-            "manufacturer": "manufacturer",
-            "length": "length_m",
-            "hyperdrive_rating": "hyperdrive_rating",
-            "MGLT": "max_megalight_hr",
-            "max_atmosphering_speed": "max_atmosphering_speed_kph",
-            "crew": "crew_size",
-            "crew_members": "crew_members",
-            "passengers": "max_passengers",
-            "passengers_on_board": "passengers_on_board",
-            "cargo_capacity": "cargo_capacity_kg",
-            "consumables": "consumables",
-            "armament": "armament"
-        }
-    }
+    with utl.OutputWriter() as output:
+        run_challenges(output)
+
+
+def run_challenges(output):
+    """Works through the assignment challenges.
+
+    Parameters:
+        output (utl.OutputWriter): buffers the JSON files written by the challenges
+
+    Returns:
+        None
+    """
+
+    keys = KEYS
 
     # 10.1 CHALLENGE 01
 
@@ -871,7 +1459,7 @@ def main():
     # 10.3.2
     # TODO Call function; assign return value; write to file
     clone_wars_episodes = convert_episode_values(clone_wars_episodes,NONE_VALUES)
-    utl.write_json("episodes_converted.json", clone_wars_episodes)
+    output.write_json("episodes_converted.json", clone_wars_episodes)
 
 
     # 10.4 Challenge 04
@@ -896,16 +1484,17 @@ def main():
         }
 
     # TODO write to file
-    utl.write_json("stu-clone_wars-director_episode_counts.json",director_episode_counts)
+    output.write_json("stu-clone_wars-director_episode_counts.json",director_episode_counts)
 
 
     # 10.6 CHALLENGE 06
 
     # 10.6.2
     # TODO Call functions; assign return values; write to file
-    articles = utl.read_json("./data-nyt_star_wars_articles.json")
+    # Only the NYT_ARTICLE_PATHS projections are held; the news desk groupings need every article
+    articles = list(utl.iter_json_array("./data-nyt_star_wars_articles.json", NYT_ARTICLE_PATHS))
     news_desks = get_news_desks(articles, NONE_VALUES)
-    utl.write_json("stu-nyt_news_desks.json",news_desks)
+    output.write_json("stu-nyt_news_desks.json",news_desks)
 
 
     # 10.7 CHALLENGE 07
@@ -913,7 +1502,7 @@ def main():
     # 10.7.2
     # TODO Call function; assign return value; write to file
     news_desk_articles = group_articles_by_news_desk(news_desks,articles)
-    utl.write_json("stu-nyt_news_desk_articles.json",news_desk_articles)
+    output.write_json("stu-nyt_news_desk_articles.json",news_desk_articles)
 
 
     # 10.8 CHALLENGE 08
@@ -928,7 +1517,7 @@ def main():
             mean_word_count = calculate_articles_mean_word_count(value)
             mean_word_counts[key] = mean_word_count
 
-    utl.write_json("stu-nyt_news_desk_mean_word_counts.json",mean_word_counts)
+    output.write_json("stu-nyt_news_desk_mean_word_counts.json",mean_word_counts)
 
 
     # 10.9 CHALLENGE 09
@@ -936,11 +1525,12 @@ def main():
     # 10.9.2
     # TODO Read file; call functions; write to files
     wookiee_planets = utl.read_csv_to_dicts("data-wookieepedia_planets.csv")
-    wookiee_dagobah = utl.get_nested_dict(wookiee_planets,'name','dagobah')
-    utl.write_json("wookiee_dagobah.json",wookiee_dagobah)
+    wookiee_planets_index = utl.DictIndex(wookiee_planets, 'name')
+    wookiee_dagobah = utl.get_nested_dict(wookiee_planets_index,'name','dagobah')
+    output.write_json("wookiee_dagobah.json",wookiee_dagobah)
 
-    wookiee_haruun_kal = utl.get_nested_dict(wookiee_planets,'system',"AI'Har system")
-    utl.write_json("wookiee_haruun_kal.json",wookiee_haruun_kal)
+    wookiee_haruun_kal = utl.get_nested_dict(utl.DictIndex(wookiee_planets, 'system'),'system',"AI'Har system")
+    output.write_json("wookiee_haruun_kal.json",wookiee_haruun_kal)
     # 10.10 CHALLENGE 10
 
     # 10.10.2
@@ -953,11 +1543,11 @@ def main():
     # TODO Call functions; write to files
     swapi_tatooine = get_swapi_resource(SWAPI_PLANETS,{"search":"tatooine"})
     tatooine = create_planet(keys,swapi_tatooine)
-    utl.write_json('stu-tatooine-v1p0.json',tatooine)
+    output.write_json('stu-tatooine-v1p0.json',tatooine)
 
-    wookiee_tatooine = utl.get_nested_dict(wookiee_planets,"name",swapi_tatooine['name'])
+    wookiee_tatooine = utl.get_nested_dict(wookiee_planets_index,"name",swapi_tatooine['name'])
     tatooine = create_planet(keys, swapi_tatooine, wookiee_tatooine)
-    utl.write_json('fxt-tatooine-v1p1.json',tatooine)
+    output.write_json('fxt-tatooine-v1p1.json',tatooine)
 
 
     # 10.11 CHALLENGE 11
@@ -973,7 +1563,7 @@ def main():
     wookiee_droids = utl.read_json('data-wookieepedia_droids.json')
     wookiee_r2_d2 = utl.get_nested_dict(wookiee_droids, 'name', swapi_r2_d2['name']) 
     r2_d2 = create_droid(keys, swapi_r2_d2, wookiee_r2_d2)
-    utl.write_json('stu-r2_d2.json', r2_d2) 
+    output.write_json('stu-r2_d2.json', r2_d2) 
 
 
 
@@ -983,7 +1573,7 @@ def main():
     # TODO Call functions; write to file
     swapi_human_species = get_swapi_resource(SWAPI_SPECIES, {"search", "human"})
     human_species = create_species(keys, swapi_human_species) 
-    utl.write_json('human_species.json', human_species)
+    output.write_json('human_species.json', human_species)
 
 
     # 10.13 Challenge 13
@@ -991,8 +1581,8 @@ def main():
     # 10.13.2
     # TODO Call functions; write to file
     swapi_anakin = get_swapi_resource(SWAPI_PEOPLE, {"search": "Anakin Skywalker"}) 
-    swapi_anakin_homeworld = get_homeworld(keys, swapi_anakin['homeworld'], wookiee_planets) 
-    utl.write_json('stu-anakin_homeworld.json', swapi_anakin_homeworld)
+    swapi_anakin_homeworld = get_homeworld(keys, swapi_anakin['homeworld'], wookiee_planets_index) 
+    output.write_json('stu-anakin_homeworld.json', swapi_anakin_homeworld)
 
 
     # 10.14 Challenge 14
@@ -1000,22 +1590,22 @@ def main():
     # 10.14.2
     # TODO Call function; write to file
     swapi_anakin_species = get_species(keys, swapi_anakin['species'][0]) 
-    utl.write_json('stu-anakin_species.json', swapi_anakin_species)
+    output.write_json('stu-anakin_species.json', swapi_anakin_species)
 
 
     # 10.15 CHALLENGE 15
 
     # 10.15.2
     # TODO Read file; call functions; write to files
-    wookiee_people = utl.read_json('data-wookieepedia_people.json')
+    wookiee_people = utl.DictIndex(utl.read_json('data-wookieepedia_people.json'), 'name')
     wookiee_anakin = utl.get_nested_dict(wookiee_people, 'name', 'Anakin SkyWalker') 
-    anakin = create_person(keys, swapi_anakin, wookiee_anakin, wookiee_planets) 
-    utl.write_json('stu-anakin_skywalker.json', anakin)
+    anakin = create_person(keys, swapi_anakin, wookiee_anakin, wookiee_planets_index) 
+    output.write_json('stu-anakin_skywalker.json', anakin)
 
     swapi_obi_wan = get_swapi_resource(SWAPI_PEOPLE, {"search": "obi-wan kenobi"}) 
     wookiee_obi_wan = utl.get_nested_dict(wookiee_people, 'name', 'Obi-Wan Kenobi') 
-    obi_wan = create_person(keys, swapi_obi_wan, wookiee_obi_wan, wookiee_planets) 
-    utl.write_json('stu-obi_wan_kenobi.json', obi_wan)
+    obi_wan = create_person(keys, swapi_obi_wan, wookiee_obi_wan, wookiee_planets_index) 
+    output.write_json('stu-obi_wan_kenobi.json', obi_wan)
 
 
     # 10.16 CHALLENGE 16
@@ -1025,7 +1615,7 @@ def main():
     wookiee_starships = utl.read_csv_to_dicts('data-wookieepedia_starships.csv') 
     wookiee_twilight = utl.get_nested_dict(wookiee_starships, 'name', 'Twilight') 
     twilight = create_starship(keys, SWAPI_STARSHIPS, wookiee_twilight, NONE_VALUES) 
-    utl.Write_json('stu-twilight.json', twilight)
+    output.write_json('stu-twilight.json', twilight)
 
 
     # 10.17 CHALLENGE 17
@@ -1034,13 +1624,13 @@ def main():
     # TODO Call functions; write to files
     swapi_padme = get_swapi_resource(SWAPI_PEOPLE, {"search": "padme amidala"}) 
     wookiee_padme = utl.get_nested_dict(wookiee_people, 'name', 'PadmAo Amidala')
-    padme = create_person(keys, swapi_padme, wookiee_padme, wookiee_planets) 
-    utl.write_json('stu-padme_amidala.json', padme)
+    padme = create_person(keys, swapi_padme, wookiee_padme, wookiee_planets_index) 
+    output.write_json('stu-padme_amidala.json', padme)
 
     swapi_c_3po = get_swapi_resource(SWAPI_ENDPOINT[0], {"search": "C-3PO"}, ", ") 
     wookiee_c_3po = utl.get_nested_dict(wookiee_droids, 'name', swapi_c_3po['name']) 
     c_3po = create_droid(keys, swapi_c_3po, wookiee_c_3po)
-    utl.write_json('stu-c_3po.json', c_3po)
+    output.write_json('stu-c_3po.json', c_3po)
 
 
     # 10.17.2.5-6
@@ -1063,14 +1653,15 @@ def main():
 
     # 10.19.1
     # TODO List comprehension; sort with lambda; write to file
-    planets = [create_planet(keys, planet, wookiee_planets) for planet in wookiee_planets] 
+    planets = create_planets(keys, wookiee_planets).to_dicts()
     planets.sort(key=lambda x: x['name'], reverse=True)
-    utl.write_json('stu-planets_sorted_name.json', planets)
+    output.write_json('stu-planets_sorted_name.json', planets)
 
 
     # 10.19.2.1
     # TODO Call function
-    naboo = utl.get_nested_dict(planets, 'diameter_km', 12120)
+    planets_diameter_km_index = utl.RangeIndex(planets, 'diameter_km')
+    naboo = utl.get_nested_dict(planets_diameter_km_index, 'diameter_km', 12120)
 
     # 10.19.2.3
     # TODO Add instructions
@@ -1081,14 +1672,14 @@ def main():
 
     planets_diameter_km = sorted(planets, key=lambda planet: (planet['diameter_km'] if planet['diameter_km'] is not None else float('-inf'), planet['name']))
 
-    utl.write_json('stu-planets_sorted_diameter.json'. planets_diameter_km)
+    output.write_json('stu-planets_sorted_diameter.json', planets_diameter_km)
 
     # 10.20 CHALLENGE 20
 
     # 10.20.1
     # TODO Add instruction; write to file
     r2_d2['instructions'].append('Release the docking clamp')
-    utl.write_json('stu-twilight_departs.json', twilight)
+    output.write_json('stu-twilight_departs.json', twilight)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,463 @@
+"""Local stand-in for the SWAPI (https://swapi.py4e.com/api) people, planets, species, and
+starships routes. Intended for offline load testing of < get_swapi_resource >, the bulk
+fetchers, and the cache.
+
+Usage:
+    python3 swapi_standin.py --port 8506 --synthetic 5000 --latency 0.05 --error-rate 0.01
+    SWAPI_ENDPOINT=http://127.0.0.1:8506/api python3 last_assignment.py
+
+The catalog is seeded from a read-only load of the production cache (< CACHE_FILEPATH >),
+which is never modified. last_assignment.py caches the stand-in's responses in its own file
+(see < last_assignment.CACHE_FILEPATH >) whenever SWAPI_ENDPOINT is set.
+"""
+
+import argparse
+import five_oh_six as utl
+import glob
+import hashlib
+import random
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+
+# Constants
+CACHE_FILEPATH = './CACHE.json' # read-only source of SWAPI records
+CATEGORIES = ('people', 'planets', 'species', 'starships')
+FIXTURES_PATTERN = './fixtures/fxt-*.json'
+PAGE_SIZE = 10
+SEARCH_KEYS = {'people': ('name',), 'planets': ('name',), 'species': ('name',), 'starships': ('name', 'model')}
+WOOKIEEPEDIA_SOURCES = (
+    ('people', './data-wookieepedia_people.json'),
+    ('people', './data-wookieepedia_droids.json'),
+    ('planets', './data-wookieepedia_planets.csv'),
+    ('starships', './data-wookieepedia_starships.csv')
+    )
+
+# Thinned (new) key -> SWAPI (old) key
+SWAPI_KEYS = {
+    'birth_date': 'birth_year',
+    'create_date': 'create_year',
+    'height_cm': 'height',
+    'mass_kg': 'mass',
+    'orbital_period_days': 'orbital_period',
+    'diameter_km': 'diameter',
+    'gravity_std': 'gravity',
+    'average_lifespan_yrs': 'average_lifespan',
+    'average_height_cm': 'average_height',
+    'length_m': 'length',
+    'max_megalight_hr': 'MGLT',
+    'max_atmosphering_speed_kph': 'max_atmosphering_speed',
+    'crew_size': 'crew',
+    'max_passengers': 'passengers',
+    'cargo_capacity_kg': 'cargo_capacity'
+    }
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves SWAPI routes from the catalog attached to the server. Supports the "search" and
+    "page" querystring fields, ETag/If-None-Match revalidation, and the artificial latency
+    and error rate configured on the server.
+    """
+
+    protocol_version = 'HTTP/1.1' # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        time.sleep(server.latency + random.uniform(0, server.jitter))
+        if random.random() < server.error_rate:
+            return self.send_json(503, {'detail': 'Service unavailable (injected error)'})
+
+        parts = urlsplit(self.path)
+        segments = [segment for segment in parts.path.split('/') if segment]
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        if segments == ['api']:
+            return self.send_json(200, {category: f"{server.base_url}/{category}/" for category in CATEGORIES})
+        if len(segments) < 2 or segments[0] != 'api' or segments[1] not in CATEGORIES:
+            return self.send_json(404, {'detail': 'Not found'})
+
+        records = server.catalog[segments[1]]
+        if len(segments) == 3 and segments[2].isdigit():
+            index = int(segments[2]) - 1
+            if 0 <= index < len(records):
+                return self.send_json(200, records[index])
+            return self.send_json(404, {'detail': 'Not found'})
+        if len(segments) == 2:
+            return self.send_json(200, paginate(server, segments[1], records, query))
+        return self.send_json(404, {'detail': 'Not found'})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status, data):
+        """Encodes < data > as JSON and sends it with the passed in < status >. Responds with
+        304 (Not Modified) and no body if the request's "If-None-Match" header matches the
+        body's ETag.
+
+        Parameters:
+            status (int): HTTP status code
+            data (dict): response body
+
+        Returns:
+            None
+        """
+
+        body = utl.json_codec.dumps(data, compact=True).encode('utf-8')
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if status == 200:
+            self.send_header('ETag', etag)
+        if status == 503:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def add_fixture(catalog, names, links, entity):
+    """Converts a thinned fixture < entity > (e.g., the output of < create_person >) back into a
+    SWAPI-style record and adds it to the < catalog >. Renamed keys are restored using
+    < SWAPI_KEYS > and converted values are turned back into SWAPI strings. Nested homeworld
+    and species dictionaries are added as records in their own right and replaced by a link;
+    missing references are assigned later by < create_catalog >.
+
+    Parameters:
+        catalog (dict): category -> list of records
+        names (dict): category -> set of lowercase names already in the catalog
+        links (list): pending (record, key, category, name) references
+        entity (dict): thinned fixture entity
+
+    Returns:
+        None
+    """
+
+    if 'starship_class' in entity:
+        category = 'starships'
+    elif 'classification' in entity:
+        category = 'species'
+    elif 'diameter_km' in entity or 'diameter' in entity:
+        category = 'planets'
+    elif 'birth_date' in entity or 'create_date' in entity:
+        category = 'people'
+    else:
+        return
+
+    record = {}
+    for key, value in entity.items():
+        if key in ('homeworld', 'species'):
+            if isinstance(value, dict) and value.get('name'):
+                add_fixture(catalog, names, links, value)
+                links.append((record, key, 'planets' if key == 'homeworld' else 'species', value['name']))
+        else:
+            record[SWAPI_KEYS.get(key, key)] = to_swapi_value(key, value)
+    add_record(catalog, names, category, record)
+
+
+def add_record(catalog, names, category, record):
+    """Adds a SWAPI-style < record > to the < catalog > unless a record with the same name
+    (case insensitive) already exists in the < category >. The first source to provide a
+    record wins.
+
+    Parameters:
+        catalog (dict): category -> list of records
+        names (dict): category -> set of lowercase names already in the catalog
+        category (str): SWAPI category
+        record (dict): SWAPI-style record
+
+    Returns:
+        dict|None: the added record; None if a record with the same name exists
+    """
+
+    name = str(record.get('name') or '').lower()
+    if not name or name in names[category]:
+        return None
+    names[category].add(name)
+    catalog[category].append(record)
+    return record
+
+
+def create_catalog(base_url, synthetic=0, seed=506):
+    """Returns the records served by the stand-in, organized by SWAPI category. Records are
+    seeded, in order, from the SWAPI resources found in < CACHE_FILEPATH > (read with
+    < utl.read_cache() >, so the cache is never modified), the thinned entities in the
+    fixtures, and the Wookieepedia data files. < synthetic > generated records are then
+    appended to each category.
+
+    Every record is assigned a local "url" under < base_url > (i.e., its position in the
+    category). People without a homeworld or species reference are assigned one at random so
+    that every person can be hydrated by < create_person >.
+
+    Parameters:
+        base_url (str): base URL of the stand-in (e.g., 'http://127.0.0.1:8506/api')
+        synthetic (int): number of generated records per category
+        seed (int): random seed used for generated values
+
+    Returns:
+        dict: category -> list of SWAPI-style records
+    """
+
+    rng = random.Random(seed)
+    catalog = {category: [] for category in CATEGORIES}
+    names = {category: set() for category in CATEGORIES}
+    links = [] # (record, key, category, name) references resolved once urls are assigned
+
+    for key, resource in utl.read_cache(CACHE_FILEPATH).items():
+        if key.startswith(utl.CACHE_META_PREFIX) or not isinstance(resource, dict):
+            continue
+        for record in resource.get('results', [resource]):
+            segments = urlsplit(str(record.get('url', ''))).path.strip('/').split('/')
+            if len(segments) >= 2 and segments[-2] in CATEGORIES:
+                add_record(catalog, names, segments[-2], dict(record))
+
+    for filepath in sorted(glob.glob(FIXTURES_PATTERN)):
+        data = utl.read_json(filepath)
+        for entity in data if isinstance(data, list) else [data]:
+            if isinstance(entity, dict):
+                add_fixture(catalog, names, links, entity)
+
+    for category, filepath in WOOKIEEPEDIA_SOURCES:
+        if filepath.endswith('.csv'):
+            records = utl.read_csv_to_dicts(filepath)
+        else:
+            records = utl.read_json(filepath)
+        for record in records:
+            add_record(catalog, names, category, dict(record))
+
+    for category in CATEGORIES:
+        for i in range(synthetic):
+            add_record(catalog, names, category, create_synthetic_record(category, i, rng))
+
+    for category, records in catalog.items():
+        for i, record in enumerate(records, 1):
+            record['url'] = f"{base_url}/{category}/{i}/"
+
+    urls = {
+        (category, str(record['name']).lower()): record['url']
+        for category, records in catalog.items() for record in records
+        }
+    for record, key, category, name in links:
+        url = urls[(category, name.lower())]
+        record[key] = [url] if key == 'species' else url
+
+    for record in catalog['people']:
+        if not str(record.get('homeworld', '')).startswith(base_url) and catalog['planets']:
+            record['homeworld'] = rng.choice(catalog['planets'])['url']
+        species = record.get('species')
+        if not (species and str(species[0]).startswith(base_url)) and catalog['species']:
+            record['species'] = [rng.choice(catalog['species'])['url']]
+    return catalog
+
+
+def create_server(host='127.0.0.1', port=8506, synthetic=0, latency=0.0, jitter=0.0, error_rate=0.0,
+                  page_size=PAGE_SIZE, seed=506, verbose=False):
+    """Creates (but does not start) a threaded HTTP server that serves the stand-in catalog.
+    Pass port 0 to bind an unused port. Call < serve_forever() > on the returned server, e.g.,
+    in a daemon thread, to start serving requests.
+
+    Parameters:
+        host (str): interface to bind
+        port (int): port to bind
+        synthetic (int): number of generated records per category
+        latency (float): seconds added to every response
+        jitter (float): maximum random seconds added on top of < latency >
+        error_rate (float): probability (0.0 - 1.0) that a request fails with a 503 response
+        page_size (int): number of results per page of a list or search response
+        seed (int): random seed used for generated values
+        verbose (bool): if True each request is logged to stderr
+
+    Returns:
+        ThreadingHTTPServer: the server; its SWAPI endpoint is available as < base_url >
+    """
+
+    server = ThreadingHTTPServer((host, port), StandInHandler)
+    server.daemon_threads = True
+    server.base_url = f"http://{host}:{server.server_port}/api"
+    server.catalog = create_catalog(server.base_url, synthetic, seed)
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.page_size = page_size
+    server.verbose = verbose
+    return server
+
+
+def create_synthetic_record(category, index, rng):
+    """Returns a generated SWAPI-style record for the passed in < category >. Values are
+    formatted as SWAPI formats them (i.e., strings, including occasional "unknown" values).
+
+    Parameters:
+        category (str): SWAPI category
+        index (int): sequence number used to mint a unique name
+        rng (random.Random): source of random values
+
+    Returns:
+        dict: SWAPI-style record
+    """
+
+    def number(low, high, unknown=0.1):
+        return 'unknown' if rng.random() < unknown else str(rng.randint(low, high))
+
+    if category == 'people':
+        return {
+            'name': f"Synthetic Person {index:06d}",
+            'height': number(60, 250),
+            'mass': number(20, 200),
+            'birth_year': f"{rng.randint(0, 900)}{rng.choice(('BBY', 'ABY'))}",
+            'gender': rng.choice(('male', 'female', 'n/a')),
+            'films': [],
+            'vehicles': [],
+            'starships': []
+            }
+    if category == 'planets':
+        return {
+            'name': f"Synthetic Planet {index:06d}",
+            'rotation_period': number(10, 40),
+            'orbital_period': number(100, 5000),
+            'diameter': number(1000, 200000),
+            'climate': ', '.join(rng.sample(('arid', 'temperate', 'tropical', 'frozen', 'murky'), 2)),
+            'gravity': f"{rng.choice((0.5, 0.85, 1, 1.5))} standard",
+            'terrain': ', '.join(rng.sample(('desert', 'forests', 'mountains', 'oceans', 'swamp'), 2)),
+            'surface_water': number(0, 100),
+            'population': number(1000, 10 ** 12),
+            'residents': [],
+            'films': []
+            }
+    if category == 'species':
+        return {
+            'name': f"Synthetic Species {index:06d}",
+            'classification': rng.choice(('mammal', 'reptile', 'amphibian', 'artificial')),
+            'designation': rng.choice(('sentient', 'reptilian')),
+            'average_height': number(50, 300),
+            'average_lifespan': number(20, 1000),
+            'language': f"Synthetic {index:06d}ese",
+            'people': [],
+            'films': []
+            }
+    return {
+        'name': f"Synthetic Starship {index:06d}",
+        'model': f"SX-{index:06d}",
+        'manufacturer': 'Synthetic Shipyards',
+        'length': number(10, 2000),
+        'max_atmosphering_speed': number(500, 1500),
+        'crew': number(1, 50),
+        'passengers': number(0, 600),
+        'cargo_capacity': number(10, 10 ** 6),
+        'consumables': f"{rng.randint(1, 12)} months",
+        'hyperdrive_rating': f"{rng.choice((0.5, 1.0, 2.0, 4.0))}",
+        'MGLT': number(10, 120),
+        'starship_class': rng.choice(('Starfighter', 'Light freighter', 'Corvette')),
+        'pilots': [],
+        'films': []
+        }
+
+
+def paginate(server, category, records, query):
+    """Returns a SWAPI list "envelope" for the requested page of < records > that match the
+    "search" querystring field (case insensitive substring match against < SEARCH_KEYS >).
+
+    Parameters:
+        server (ThreadingHTTPServer): stand-in server
+        category (str): SWAPI category
+        records (list): category records
+        query (dict): querystring fields and values
+
+    Returns:
+        dict: envelope structured as {'count': ..., 'next': ..., 'previous': ..., 'results': [...]}
+    """
+
+    search = query.get('search', '').lower()
+    if search:
+        records = [
+            record for record in records
+            if any(search in str(record.get(key, '')).lower() for key in SEARCH_KEYS[category])
+            ]
+
+    page = int(query['page']) if query.get('page', '').isdigit() else 1
+    start = (page - 1) * server.page_size
+
+    def link(page):
+        params = {'page': page, **({'search': query['search']} if search else {})}
+        return f"{server.base_url}/{category}/?{urlencode(params)}"
+
+    return {
+        'count': len(records),
+        'next': link(page + 1) if start + server.page_size < len(records) else None,
+        'previous': link(page - 1) if page > 1 else None,
+        'results': records[start:start + server.page_size]
+        }
+
+
+def to_swapi_value(key, value):
+    """Converts a thinned fixture value back into a SWAPI-style string. None becomes "unknown",
+    year/era dictionaries become strings such as "41BBY", lists are joined with ", ", and
+    numbers are converted to strings ("standard" is appended to gravity values).
+
+    Parameters:
+        key (str): thinned key name
+        value (obj): thinned value
+
+    Returns:
+        str|any: SWAPI-style value
+    """
+
+    if value is None:
+        return 'unknown'
+    if isinstance(value, dict) and 'year' in value and 'era' in value:
+        return f"{value['year']}{value['era']}"
+    if isinstance(value, list):
+        return ', '.join(str(item) for item in value)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return f"{value} standard" if key == 'gravity_std' else str(value)
+    return value
+
+
+def main():
+    """Entry point for program.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(description='Local SWAPI stand-in server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8506)
+    parser.add_argument('--synthetic', type=int, default=0, help='generated records per category')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='max random seconds added to latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='probability of a 503 response')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    parser.add_argument('--seed', type=int, default=506)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    server = create_server(
+        args.host, args.port, args.synthetic, args.latency, args.jitter, args.error_rate,
+        args.page_size, args.seed, args.verbose
+        )
+    counts = ', '.join(f"{category}={len(records)}" for category, records in server.catalog.items())
+    print(f"Serving SWAPI stand-in at {server.base_url}/ ({counts})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
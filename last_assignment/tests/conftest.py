@@ -0,0 +1,60 @@
+import json
+import os
+import sys
+
+import pytest
+import requests
+
+
+# Constants
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(PACKAGE_DIR, 'fixtures')
+
+sys.path.insert(0, PACKAGE_DIR) # five_oh_six and last_assignment are imported as scripts
+
+
+@pytest.fixture
+def package_dir(monkeypatch):
+    """Runs the test from the package directory (the data files are read by relative path)."""
+
+    monkeypatch.chdir(PACKAGE_DIR)
+    return PACKAGE_DIR
+
+
+@pytest.fixture
+def la(package_dir, tmp_path, monkeypatch):
+    """The last_assignment module with an empty in-memory cache persisted under < tmp_path >."""
+
+    import last_assignment as la
+
+    monkeypatch.setattr(la, 'cache', {})
+    monkeypatch.setattr(la, 'CACHE_FILEPATH', str(tmp_path / 'CACHE.json'))
+    return la
+
+
+class FakeSession:
+    """Stands in for requests.Session. Each call to get() consumes the next of the passed in
+    < outcomes > (a status code or an exception instance, which is raised). Once the outcomes
+    are used up every call returns the < default > status code (if None, an IndexError is
+    raised). Responses carry the passed in < headers > and a JSON body naming the requested
+    url and params.
+    """
+
+    def __init__(self, *outcomes, default=None, headers=None):
+        self.outcomes = list(outcomes)
+        self.default = default
+        self.headers = headers or {}
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes or self.default is None else self.default
+        if isinstance(outcome, BaseException):
+            raise outcome
+        response = requests.Response()
+        response.status_code = outcome
+        response.headers.update(self.headers)
+        response.encoding = 'utf-8'
+        response.url = url
+        response._content = json.dumps({'url': url, 'params': params or {}}).encode('utf-8')
+        return response
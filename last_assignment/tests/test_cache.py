@@ -0,0 +1,150 @@
+import os
+
+import pytest
+
+import five_oh_six as utl
+
+
+def journal(filepath):
+    return f"{filepath}{utl.CACHE_JOURNAL_SUFFIX}"
+
+
+def cache_key(number):
+    return utl.create_cache_key(f"https://swapi.py4e.com/api/people/{number}/")
+
+
+# Journaled JSON cache
+
+def test_journal_entries_are_replayed_over_snapshot(tmp_path):
+    filepath = str(tmp_path / 'CACHE.json')
+    utl.write_json(filepath, {cache_key(1): {'name': 'Luke'}, cache_key(2): {'name': 'C-3PO'}})
+    cache = utl.create_cache(filepath)
+    utl.write_cache_entry(filepath, cache, cache_key(2), {'name': 'C-3PO', 'version': 2})
+    utl.write_cache_entry(filepath, cache, cache_key(3), {'name': 'R2-D2'})
+
+    assert utl.read_json(filepath) == {cache_key(1): {'name': 'Luke'}, cache_key(2): {'name': 'C-3PO'}}
+    assert utl.create_cache(filepath) == cache
+    assert utl.create_cache(filepath)[cache_key(2)]['version'] == 2
+
+
+def test_incomplete_journal_record_is_truncated(tmp_path):
+    filepath = str(tmp_path / 'CACHE.json')
+    utl.append_cache_entry(filepath, cache_key(1), {'name': 'Luke'})
+    size = os.path.getsize(journal(filepath))
+    with open(journal(filepath), 'a', encoding='utf-8') as file_obj:
+        file_obj.write('{"key": "https://swapi.py4e.com/api/people/2/", "val') # crash mid-write
+
+    assert utl.replay_cache_journal(filepath) == {cache_key(1): {'name': 'Luke'}}
+    assert os.path.getsize(journal(filepath)) == size
+    utl.append_cache_entry(filepath, cache_key(2), {'name': 'C-3PO'})
+    assert list(utl.replay_cache_journal(filepath)) == [cache_key(1), cache_key(2)]
+
+
+def test_journal_is_compacted_into_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(utl, 'CACHE_JOURNAL_MIN_BYTES', 256)
+    filepath = str(tmp_path / 'CACHE.json')
+    cache = utl.create_cache(filepath)
+    for number in range(10):
+        utl.write_cache_entry(filepath, cache, cache_key(number), {'name': 'x' * 40})
+
+    snapshot = utl.read_json(filepath)
+    assert len(snapshot) > 1 # compacted at least once
+    assert os.path.getsize(journal(filepath)) <= max(os.path.getsize(filepath), 256)
+    assert utl.create_cache(filepath) == cache
+    assert sorted(os.listdir(tmp_path)) == ['CACHE.json', 'CACHE.json.journal']
+
+
+# SQLite cache
+
+@pytest.fixture
+def sqlite_filepath(tmp_path):
+    return str(tmp_path / 'CACHE.db')
+
+
+def test_sqlite_cache_persists_entries(sqlite_filepath):
+    cache = utl.create_cache(sqlite_filepath)
+    assert isinstance(cache, utl.SQLiteCache)
+    utl.write_cache_entry(sqlite_filepath, cache, cache_key(1), {'name': 'Luke', 'films': ['A New Hope']})
+    cache[cache_key(2)] = {'name': 'C-3PO'}
+    cache[cache_key(2)] = {'name': 'C-3PO', 'version': 2}
+    cache.close()
+
+    cache = utl.create_cache(sqlite_filepath)
+    assert len(cache) == 2
+    assert cache_key(1) in cache and cache_key(3) not in cache
+    assert cache[cache_key(2)] == {'name': 'C-3PO', 'version': 2}
+    assert sorted(cache) == sorted([cache_key(1), cache_key(2)])
+    del cache[cache_key(1)]
+    with pytest.raises(KeyError):
+        cache[cache_key(1)]
+    with pytest.raises(KeyError):
+        del cache[cache_key(1)]
+    assert not os.path.exists(journal(sqlite_filepath)) # SQLite caches keep no journal
+    cache.close()
+
+
+def test_sqlite_cache_is_shared_between_connections(sqlite_filepath):
+    writer, reader = utl.SQLiteCache(sqlite_filepath), utl.SQLiteCache(sqlite_filepath)
+    writer[cache_key(1)] = {'name': 'Luke'}
+    assert reader[cache_key(1)] == {'name': 'Luke'}
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_cache_returns_frozen_entries(sqlite_filepath):
+    cache = utl.create_cache(sqlite_filepath, frozen=True)
+    cache[cache_key(1)] = {'name': 'Luke', 'films': ['A New Hope']}
+    with pytest.raises(TypeError):
+        cache[cache_key(1)]['films'].append('Return of the Jedi')
+    cache.close()
+
+
+# LRU tier
+
+def test_lru_evicts_least_recently_used_entries(tmp_path):
+    cache = utl.create_cache(str(tmp_path / 'CACHE.db'), max_entries=2)
+    for number in range(1, 4):
+        cache[cache_key(number)] = {'number': number}
+    cache[cache_key(2)] # most recently used
+    cache[cache_key(4)] = {'number': 4}
+
+    assert cache.stats()['entries'] == 2
+    assert cache.stats()['evictions'] == 2
+    assert cache[cache_key(1)] == {'number': 1} # evicted entries are read from the backend
+    assert cache.stats()['misses'] == 1
+    assert len(cache) == 4
+    cache.backend.close()
+
+
+def test_lru_bounds_bytes(tmp_path):
+    cache = utl.create_cache(str(tmp_path / 'CACHE.db'), max_bytes=100)
+    for number in range(10):
+        cache[cache_key(number)] = {'name': 'x' * 40}
+    assert cache.stats()['bytes'] <= 100
+    assert all(cache[cache_key(number)] == {'name': 'x' * 40} for number in range(10))
+    cache.backend.close()
+
+
+@pytest.mark.parametrize('limits', [{'max_entries': 10}, {'max_bytes': 1024}])
+def test_lru_limits_are_rejected_for_json_cache(tmp_path, limits):
+    with pytest.raises(ValueError):
+        utl.create_cache(str(tmp_path / 'CACHE.json'), **limits)
+
+
+# Read-only loads
+
+def test_read_cache_does_not_modify_the_cache(tmp_path, sqlite_filepath):
+    filepath = str(tmp_path / 'CACHE.json')
+    utl.append_cache_entry(filepath, cache_key(1), {'name': 'Luke'})
+    with open(journal(filepath), 'a', encoding='utf-8') as file_obj:
+        file_obj.write('{"key": "partial')
+    size = os.path.getsize(journal(filepath))
+    assert utl.read_cache(filepath) == {cache_key(1): {'name': 'Luke'}}
+    assert os.path.getsize(journal(filepath)) == size
+
+    cache = utl.create_cache(sqlite_filepath)
+    cache[cache_key(1)] = {'name': 'Luke'}
+    cache.close()
+    assert utl.read_cache(sqlite_filepath) == {cache_key(1): {'name': 'Luke'}}
+    assert utl.read_cache(str(tmp_path / 'missing.db')) == {}
+    assert not os.path.exists(tmp_path / 'missing.db')
@@ -0,0 +1,61 @@
+import pytest
+
+import five_oh_six as utl
+
+from conftest import FakeSession
+
+
+URL = 'https://swapi.test/api/people/1/'
+HEADERS = {'ETag': '"v1"', 'X-Ignored': 'yes'}
+
+
+@pytest.fixture
+def cassette_filepath(tmp_path):
+    utl.configure_resilience()
+    yield tmp_path / 'cassette.ndjson'
+    utl.configure_cassette()
+
+
+def test_recorded_exchanges_are_replayed_without_network_io(cassette_filepath):
+    session = FakeSession(default=200, headers=HEADERS)
+    utl.configure_cassette(cassette_filepath, 'record')
+    recorded = utl.send_request(URL, {'format': 'json'}, session=session)
+
+    utl.configure_cassette(cassette_filepath, 'replay')
+    replayed = utl.send_request(URL, {'format': 'json'}, session=session)
+
+    assert session.calls == 1
+    assert replayed.status_code == recorded.status_code
+    assert replayed.json() == recorded.json()
+    assert replayed.headers['etag'] == '"v1"'
+    assert 'X-Ignored' not in replayed.headers
+
+
+def test_replay_miss_raises(cassette_filepath):
+    utl.configure_cassette(cassette_filepath, 'record')
+    utl.send_request(URL, session=FakeSession(default=200, headers=HEADERS))
+
+    utl.configure_cassette(cassette_filepath, 'replay')
+    with pytest.raises(utl.CassetteMissError, match='people/2'):
+        utl.send_request('https://swapi.test/api/people/2/')
+    with pytest.raises(LookupError):
+        utl.send_request(URL, {'page': 2})
+
+
+def test_conditional_request_falls_back_to_unconditional_exchange(cassette_filepath):
+    utl.configure_cassette(cassette_filepath, 'record')
+    utl.send_request(URL, session=FakeSession(default=200, headers=HEADERS))
+
+    utl.configure_cassette(cassette_filepath, 'replay')
+    response = utl.send_request(URL, headers={'If-None-Match': '"v0"'})
+    assert response.json()['url'] == URL
+
+
+def test_replay_requires_an_existing_cassette(cassette_filepath):
+    with pytest.raises(FileNotFoundError):
+        utl.configure_cassette(cassette_filepath, 'replay')
+
+
+def test_invalid_mode_is_rejected(cassette_filepath):
+    with pytest.raises(ValueError):
+        utl.configure_cassette(cassette_filepath, 'rewind')
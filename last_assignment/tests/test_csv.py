@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+import five_oh_six as utl
+
+from conftest import PACKAGE_DIR
+
+
+DATA_FILEPATHS = [
+    os.path.join(PACKAGE_DIR, filename)
+    for filename in ('data-clone_wars_episodes.csv', 'data-wookieepedia_planets.csv', 'data-wookieepedia_starships.csv')
+]
+EPISODES_FILEPATH = DATA_FILEPATHS[0]
+COLUMNS = ['episode_us_viewers_mm', 'episode_title']
+
+
+def write(tmp_path, content):
+    filepath = tmp_path / 'rows.csv'
+    filepath.write_text(content, encoding='utf-8', newline='')
+    return filepath
+
+
+@pytest.mark.parametrize('filepath', DATA_FILEPATHS)
+def test_rows_match_read_csv_to_dicts(filepath):
+    rows = list(utl.iter_csv_to_dicts(filepath))
+    assert rows == utl.read_csv_to_dicts(filepath)
+    assert [list(row) for row in rows] == [list(row) for row in utl.read_csv_to_dicts(filepath)]
+
+
+def test_projected_rows():
+    rows = list(utl.iter_csv_to_dicts(EPISODES_FILEPATH, columns=COLUMNS))
+    assert rows == [{name: row[name] for name in COLUMNS} for row in utl.read_csv_to_dicts(EPISODES_FILEPATH)]
+    assert list(rows[0]) == COLUMNS
+
+
+def test_converted_rows():
+    converters = {'episode_us_viewers_mm': utl.to_float, 'series_season_num': utl.to_int}
+    rows = list(utl.iter_csv_to_dicts(EPISODES_FILEPATH, converters=converters))
+    expected = [
+        {name: converters[name](value) if name in converters else value for name, value in row.items()}
+        for row in utl.read_csv_to_dicts(EPISODES_FILEPATH)
+    ]
+    assert rows == expected
+    projected = list(utl.iter_csv_to_dicts(EPISODES_FILEPATH, columns=COLUMNS, converters=converters))
+    assert projected == [{name: row[name] for name in COLUMNS} for row in expected]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1000])
+def test_chunked_rows(chunk_size):
+    chunks = list(utl.iter_csv_to_dicts(EPISODES_FILEPATH, columns=COLUMNS, chunk_size=chunk_size))
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= chunk_size
+    assert [row for chunk in chunks for row in chunk] == list(utl.iter_csv_to_dicts(EPISODES_FILEPATH, columns=COLUMNS))
+
+
+@pytest.mark.parametrize('content', [
+    'a,b,c\n1,2,3\n\n4,5\n6\n', # blank and short rows
+    'a,b,c\n1,2,3,4,5\n6,7,8\n', # extra fields
+    'a,b,a\n1,2,3\n4\n', # duplicate header
+    'a,b\n',
+    ''
+])
+def test_edge_rows_match_dict_reader(tmp_path, content):
+    filepath = write(tmp_path, content)
+    rows = list(utl.iter_csv_to_dicts(filepath))
+    assert rows == utl.read_csv_to_dicts(filepath)
+    assert [list(row) for row in rows] == [list(row) for row in utl.read_csv_to_dicts(filepath)]
+
+
+def test_short_rows_are_not_converted(tmp_path):
+    filepath = write(tmp_path, 'a,b\n1,2\n3\n')
+    assert list(utl.iter_csv_to_dicts(filepath, converters={'b': int})) == [{'a': '1', 'b': 2}, {'a': '3', 'b': None}]
+
+
+def test_projected_rows_omit_extra_fields(tmp_path):
+    filepath = write(tmp_path, 'a,b\n1,2,3\n')
+    assert list(utl.iter_csv_to_dicts(filepath, columns=['b'])) == [{'b': '2'}]
+
+
+def test_unknown_column_raises(tmp_path):
+    with pytest.raises(ValueError):
+        list(utl.iter_csv_to_dicts(write(tmp_path, 'a,b\n1,2\n'), columns=['c']))
@@ -0,0 +1,78 @@
+import json
+import os
+
+import pytest
+
+import five_oh_six as utl
+
+from conftest import PACKAGE_DIR, FIXTURES_DIR
+
+
+EPISODES_FILEPATH = os.path.join(PACKAGE_DIR, 'data-clone_wars_episodes.csv')
+
+BACKENDS = [
+    pytest.param(False, id='lists'),
+    pytest.param(True, id='numpy', marks=pytest.mark.skipif(utl.np is None, reason='NumPy is not installed'))
+]
+
+
+def convert_rows(la):
+    return la.convert_episode_values(utl.read_csv_to_dicts(EPISODES_FILEPATH), la.NONE_VALUES)
+
+
+@pytest.mark.parametrize('use_numpy', BACKENDS)
+def test_columns_match_rows_and_fixture(la, use_numpy):
+    batch = la.convert_episode_columns(utl.read_csv_to_columns(EPISODES_FILEPATH), use_numpy=use_numpy)
+    with open(os.path.join(FIXTURES_DIR, 'fxt-clone_wars-episodes_converted.json'), 'r', encoding='utf-8') as file_obj:
+        fixture = json.load(file_obj)
+
+    assert batch.to_dicts() == convert_rows(la)
+    assert batch.to_dicts() == fixture
+    if use_numpy:
+        assert isinstance(batch.column('episode_us_viewers_mm'), utl.np.ma.MaskedArray)
+
+
+@pytest.mark.parametrize('use_numpy', BACKENDS)
+def test_most_viewed_episode_matches_rows(la, use_numpy):
+    batch = la.convert_episode_columns(utl.read_csv_to_columns(EPISODES_FILEPATH), use_numpy=use_numpy)
+
+    most_viewed = la.get_most_viewed_episode(batch)
+    assert most_viewed == la.get_most_viewed_episode(convert_rows(la))
+    assert len(most_viewed) >= 1
+
+
+@pytest.mark.parametrize('use_numpy', BACKENDS)
+def test_most_viewed_episode_ties(la, use_numpy):
+    columns = {'episode_title': ['A', 'B', 'C', 'D'], 'episode_us_viewers_mm': ['1.5', '3.25', 'unknown', '3.25']}
+    batch = la.convert_episode_columns(columns, use_numpy=use_numpy)
+
+    assert [episode['episode_title'] for episode in la.get_most_viewed_episode(batch)] == ['B', 'D']
+
+
+@pytest.mark.parametrize('use_numpy', BACKENDS)
+def test_all_none_viewership_returns_empty_list(la, use_numpy):
+    columns = {'episode_title': ['A', 'B'], 'episode_us_viewers_mm': ['unknown', '']}
+    batch = la.convert_episode_columns(columns, use_numpy=use_numpy)
+
+    if use_numpy:
+        assert isinstance(batch.column('episode_us_viewers_mm'), utl.np.ma.MaskedArray)
+    assert la.get_most_viewed_episode(batch) == []
+    assert la.get_most_viewed_episode(batch.to_dicts()) == []
+
+
+@pytest.mark.parametrize('use_numpy', BACKENDS)
+def test_episode_types_match_row_conversions(la, use_numpy):
+    """EPISODE_TYPES (hoisted to module level) converts each column as the per-key branches of
+    convert_episode_values() do. Placeholder writers are the documented exception."""
+
+    values = ['12', '1,200', '3.5', 'unknown', '', 'N/A', 'Dave Filoni, Henry Gilroy']
+    columns = {key: list(values) for key in [*la.EPISODE_TYPES, 'episode_title']}
+    rows = la.convert_episode_values([{key: value for key in columns} for value in values], la.NONE_VALUES)
+    batch = la.convert_episode_columns(columns, use_numpy=use_numpy).to_dicts()
+
+    for key in columns:
+        expected = [row[key] for row in rows]
+        if key == 'episode_writers':
+            expected = [None if utl.to_none(value, la.NONE_VALUES) is None else row[key] for value, row in zip(values, rows)]
+        assert [row[key] for row in batch] == expected
+    assert [row['episode_writers'] for row in rows][3:6] == [['unknown'], [''], ['N/A']]
@@ -0,0 +1,49 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+import five_oh_six as utl
+
+
+RESOURCE = {'name': 'Tatooine', 'climate': ['arid'], 'terrain': {'surface': ['desert', 'canyons']}}
+
+
+def test_freeze_is_recursive_and_equal():
+    frozen = utl.freeze(RESOURCE)
+
+    assert frozen == RESOURCE
+    assert isinstance(frozen, utl.FrozenDict)
+    assert isinstance(frozen['climate'], utl.FrozenList)
+    assert isinstance(frozen['terrain']['surface'], utl.FrozenList)
+    assert utl.freeze(frozen) is frozen
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda resource: resource.update(name='Hoth'),
+    lambda resource: resource.__setitem__('name', 'Hoth'),
+    lambda resource: resource.pop('name'),
+    lambda resource: resource['climate'].append('temperate'),
+    lambda resource: resource['terrain']['surface'].sort()
+])
+def test_frozen_resources_are_read_only(mutate):
+    frozen = utl.freeze(RESOURCE)
+    with pytest.raises(TypeError):
+        mutate(frozen)
+    assert frozen == RESOURCE
+
+
+def test_copies_are_free_and_serializable():
+    frozen = utl.freeze(RESOURCE)
+
+    assert copy.copy(frozen) is frozen
+    assert copy.deepcopy(frozen) is frozen
+    assert json.loads(json.dumps(frozen)) == RESOURCE
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+def test_dict_copy_is_mutable():
+    thawed = dict(utl.freeze(RESOURCE))
+    thawed['name'] = 'Hoth'
+    assert thawed['name'] == 'Hoth'
@@ -0,0 +1,91 @@
+import pytest
+
+import five_oh_six as utl
+
+
+PLANETS = [
+    {'name': 'Tatooine', 'region': 'Outer Rim', 'sector': 'Arkanis', 'diameter_km': 10465},
+    {'name': 'Naboo', 'region': 'Mid Rim', 'sector': 'Chommell', 'diameter_km': 12120},
+    {'name': 'Dagobah', 'region': 'Outer Rim', 'sector': 'Sluis', 'diameter_km': 8900},
+    {'name': 'Geonosis', 'region': 'Outer Rim', 'sector': 'Arkanis', 'diameter_km': 11370},
+    {'name': 'tatooine', 'region': 'Duplicate', 'sector': None, 'diameter_km': None}
+]
+
+
+@pytest.fixture
+def planets():
+    return utl.IndexedList(dict(planet) for planet in PLANETS)
+
+
+def test_dict_index_matches_get_nested_dict(planets):
+    index = utl.DictIndex(planets, 'name')
+    for name in ('TATOOINE', 'naboo', 'Hoth'):
+        assert index.get(name) is utl.get_nested_dict(planets, 'name', name)
+        assert utl.get_nested_dict(index, 'name', name) is utl.get_nested_dict(planets, 'name', name)
+    assert index.get('tatooine')['region'] == 'Outer Rim' # first match wins
+
+
+def test_composite_index(planets):
+    index = utl.CompositeIndex(planets, ('region', 'sector'))
+    assert [planet['name'] for planet in index.find('outer rim', 'ARKANIS')] == ['Tatooine', 'Geonosis']
+    assert index.get('Mid Rim', 'Chommell')['name'] == 'Naboo'
+    assert index.get('Mid Rim', 'Arkanis') is None
+
+
+def test_range_index(planets):
+    index = utl.RangeIndex(planets, 'diameter_km')
+    assert index.get(12120)['name'] == 'Naboo'
+    assert index.get(12121) is None
+    assert [planet['name'] for planet in index.range(9000, 11500)] == ['Tatooine', 'Geonosis']
+    assert index.nearest(10000)['name'] == 'Tatooine'
+    assert len(index.values) == 4 # None is not indexed
+
+
+def test_get_nested_dict_compares_non_string_values(planets):
+    assert utl.get_nested_dict(planets, 'diameter_km', 12120)['name'] == 'Naboo'
+    assert utl.get_nested_dict(planets, 'diameter_km', '8900')['name'] == 'Dagobah'
+    assert utl.get_nested_dict(planets, 'sector', 'None') is None
+    assert utl.get_nested_dict(planets, 'diameter_km', 1) is None
+
+
+def test_get_nested_dict_uses_range_index_for_numbers(planets):
+    index = utl.RangeIndex(planets, 'diameter_km')
+    for diameter in (12120, 8900, 1):
+        assert utl.get_nested_dict(index, 'diameter_km', diameter) is utl.get_nested_dict(planets, 'diameter_km', diameter)
+    assert utl.get_nested_dict(index, 'diameter_km', '10465')['name'] == 'Tatooine' # scanned
+
+
+def test_naboo_lookup_on_converted_planets(la):
+    planets = la.create_planets(la.KEYS, la.utl.read_csv_to_dicts('data-wookieepedia_planets.csv')).to_dicts()
+    naboo = utl.get_nested_dict(utl.RangeIndex(planets, 'diameter_km'), 'diameter_km', 12120)
+    assert naboo is utl.get_nested_dict(planets, 'diameter_km', 12120)
+    assert (naboo['name'], naboo['region'], naboo['sector']) == ('Naboo', 'Mid Rim Territories', 'Chommell sector')
+
+
+@pytest.mark.parametrize('index_type, args', [
+    (utl.DictIndex, ('name',)),
+    (utl.CompositeIndex, (('region', 'sector'),)),
+    (utl.RangeIndex, ('diameter_km',))
+])
+def test_appending_through_an_index_of_an_indexed_list_adds_once(planets, index_type, args):
+    index = planets.add_index(index_type, *args)
+    hoth = {'name': 'Hoth', 'region': 'Outer Rim', 'sector': 'Anoat', 'diameter_km': 7200}
+    index.append(hoth)
+    planets.append({'name': 'Bespin', 'region': 'Outer Rim', 'sector': 'Anoat', 'diameter_km': 118000})
+
+    assert len(planets) == 7
+    if index_type is utl.RangeIndex:
+        assert index.find(7200) == [hoth]
+        assert len(index.values) == 6
+    elif index_type is utl.CompositeIndex:
+        assert [planet['name'] for planet in index.find('Outer Rim', 'Anoat')] == ['Hoth', 'Bespin']
+    else:
+        assert index.get('hoth') is hoth
+
+
+def test_appending_to_a_standalone_index_indexes_the_item():
+    planets = [dict(planet) for planet in PLANETS]
+    index = utl.RangeIndex(planets, 'diameter_km')
+    index.append({'name': 'Hoth', 'diameter_km': 7200})
+    assert len(planets) == 6
+    assert index.nearest(7000)['name'] == 'Hoth'
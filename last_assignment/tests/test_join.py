@@ -0,0 +1,46 @@
+import pytest
+
+import five_oh_six as utl
+
+
+SWAPI = [{'name': 'Tatooine'}, {'name': ' dagobah '}, {'name': 'Kamino'}, {'name': None}]
+WOOKIEE = [
+    {'name': 'TATOOINE', 'source': 1},
+    {'name': 'Dagobah', 'source': 2},
+    {'name': 'tatooine', 'source': 3},
+    {'name': 'Hoth', 'source': 4}
+]
+
+
+def test_left_join_keeps_every_left_record():
+    join = utl.HashJoin(iter(SWAPI), WOOKIEE, 'name')
+    pairs = list(join)
+
+    assert [left for left, right in pairs] == SWAPI
+    assert [right and right['source'] for left, right in pairs] == [1, 2, None, None]
+    assert join.unmatched_right() == [WOOKIEE[3]]
+    assert join.stats() == {
+        'left': 4, 'right': 4, 'matched': 2, 'unmatched_left': 2, 'unmatched_right': 1, 'duplicates': 1
+        }
+
+
+def test_inner_join_collects_unmatched_left_records():
+    join = utl.HashJoin(SWAPI, WOOKIEE, 'name', how='inner')
+
+    assert [(left['name'], right['source']) for left, right in join] == [('Tatooine', 1), (' dagobah ', 2)]
+    assert join.unmatched_left == SWAPI[2:]
+
+
+def test_first_right_record_wins_like_get_nested_dict():
+    [(left, right)] = utl.HashJoin([{'name': 'tatooine'}], WOOKIEE, 'name')
+    assert right is utl.get_nested_dict(WOOKIEE, 'name', 'Tatooine')
+
+
+def test_key_functions():
+    join = utl.HashJoin([{'id': 'hoth'}], WOOKIEE, lambda record: record['name'], left_key='id')
+    assert [right['source'] for left, right in join] == [4]
+
+
+def test_invalid_join_type_is_rejected():
+    with pytest.raises(ValueError):
+        utl.HashJoin(SWAPI, WOOKIEE, 'name', how='outer')
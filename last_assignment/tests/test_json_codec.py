@@ -0,0 +1,82 @@
+import glob
+import json
+import math
+
+import pytest
+
+import five_oh_six as utl
+
+from conftest import FIXTURES_DIR, PACKAGE_DIR
+
+
+CODECS = [
+    pytest.param('json'),
+    pytest.param('orjson', marks=pytest.mark.skipif(utl.orjson is None, reason='orjson not installed'))
+]
+
+EDGE_VALUES = [
+    [123456789012345678901234567890, -18446744073709551616, 9223372036854775807],
+    {'wide': 10 ** 30, 'id': '1234567890123456789012'},
+    {1: 'int key', 'nested': [True, False, None, 0.1, 1e16, -0.0]},
+    ['é', '☃', '"quoted"', '\\']
+]
+
+
+@pytest.fixture(params=CODECS)
+def codec(request):
+    codec = utl.json_codec
+    yield utl.configure_json_codec(request.param)
+    utl.json_codec = codec
+
+
+def test_fixtures_round_trip(codec, tmp_path):
+    filepath = tmp_path / 'fixture.json'
+    for fixture in sorted(glob.glob(f"{FIXTURES_DIR}/*.json")):
+        with open(fixture, encoding='utf-8') as file_obj:
+            text = file_obj.read()
+        data = json.loads(text)
+        assert utl.read_json(fixture) == data
+        utl.write_json(filepath, data)
+        assert filepath.read_text(encoding='utf-8') == text # indent=2 output is byte-identical
+        utl.write_json(filepath, data, compact=True)
+        assert utl.read_json(filepath) == data
+
+
+def test_articles_round_trip(codec, tmp_path):
+    filepath = tmp_path / 'articles.json'
+    articles = utl.read_json(f"{PACKAGE_DIR}/data-nyt_star_wars_articles.json")
+    utl.write_json(filepath, articles, compact=True)
+    assert json.loads(filepath.read_text(encoding='utf-8')) == articles
+
+
+@pytest.mark.parametrize('value', EDGE_VALUES)
+def test_edge_values_match_stdlib(codec, value):
+    expected = json.loads(json.dumps(value))
+    assert codec.loads(codec.dumps(value)) == expected
+    assert codec.loads(codec.dumps(value, compact=True).encode('utf-8')) == expected
+    assert codec.loads(json.dumps(value)) == expected
+
+
+def test_wide_integers_are_not_decoded_as_floats(codec):
+    value = codec.loads('[123456789012345678901234567890]')
+    assert value == [123456789012345678901234567890]
+    assert type(value[0]) is int
+
+
+@pytest.mark.parametrize('indent', [None, 2])
+def test_non_finite_floats_match_stdlib(codec, indent):
+    value = {'nan': math.nan, 'inf': [math.inf, -math.inf], 'none': None}
+    assert codec.dumps(value, indent=indent) == json.dumps(value, ensure_ascii=False, indent=indent)
+    assert codec.dumps(value, compact=True) == json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    decoded = codec.loads('{"nan": NaN, "inf": Infinity}')
+    assert math.isnan(decoded['nan']) and decoded['inf'] == math.inf
+
+
+def test_frozen_resources_are_encoded(codec):
+    value = utl.freeze({'films': ['A New Hope'], 'height': 1.72})
+    assert json.loads(codec.dumps(value, compact=True)) == {'films': ['A New Hope'], 'height': 1.72}
+
+
+def test_configure_json_codec_rejects_unknown_codec():
+    with pytest.raises(ValueError):
+        utl.configure_json_codec('simplejson')
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+import five_oh_six as utl
+
+from conftest import PACKAGE_DIR
+
+
+DOCUMENTS = [
+    '[]',
+    ' [ ] ',
+    '[true,false,null,-1.5e3]',
+    '[1.5, 2]',
+    '[ {"a": "x\\u00e9,y", "b": [1, 2.25e-3]} , "s\\"t" ,0 ]',
+    '["\\ud83d\\ude00", {"nested": {"c": [[], {}]}}]'
+]
+
+INVALID_DOCUMENTS = ['[1 2]', '[1,]', '[1x, 2]', '[tru]', '[{"a": x}, 1]', '["a]', '[1.5.5]', '[01]', '{}']
+
+
+def write(tmp_path, content):
+    filepath = tmp_path / 'array.json'
+    filepath.write_text(content, encoding='utf-8')
+    return filepath
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_every_buffer_size_matches_json_load(tmp_path, document):
+    filepath = write(tmp_path, document)
+    for buffer_size in range(1, len(document) + 2):
+        assert list(utl.iter_json_array(filepath, buffer_size=buffer_size)) == json.loads(document)
+
+
+def test_number_split_at_default_buffer_boundary(tmp_path):
+    filepath = write(tmp_path, '[' + ' ' * (utl.JSON_BUFFER_SIZE - 3) + '1.5, 2]')
+    assert list(utl.iter_json_array(filepath)) == [1.5, 2]
+
+
+@pytest.mark.parametrize('document', INVALID_DOCUMENTS)
+@pytest.mark.parametrize('buffer_size', [1, 2, 3, 64])
+def test_invalid_documents_raise(tmp_path, document, buffer_size):
+    filepath = write(tmp_path, document)
+    with pytest.raises(ValueError):
+        list(utl.iter_json_array(filepath, buffer_size=buffer_size))
+
+
+def test_invalid_token_raises_without_reading_whole_file(tmp_path, monkeypatch):
+    filepath = write(tmp_path, '[{"a": x}, ' + '1, ' * 100000 + '1]')
+    reads = []
+    open_file = open
+
+    def tracking_open(*args, **kwargs):
+        file_obj = open_file(*args, **kwargs)
+        read = file_obj.read
+        file_obj.read = lambda size=-1: reads.append(size) or read(size)
+        return file_obj
+
+    monkeypatch.setattr('builtins.open', tracking_open)
+    with pytest.raises(ValueError):
+        list(utl.iter_json_array(filepath, buffer_size=1024))
+    assert reads and sum(reads) < 4096
+
+
+def test_articles_projection_matches_read_json():
+    filepath = f"{PACKAGE_DIR}/data-nyt_star_wars_articles.json"
+    paths = ['headline.main', 'byline.original', 'word_count']
+    expected = [utl.project_paths(article, paths) for article in utl.read_json(filepath)]
+    assert list(utl.iter_json_array(filepath, paths, buffer_size=512)) == expected
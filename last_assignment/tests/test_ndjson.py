@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+import five_oh_six as utl
+
+
+RECORDS = [
+    {'name': 'Tatooine', 'diameter_km': 10465},
+    {'name': 'Dagobah', 'climate': ['murky']},
+    {'name': 'Ahch-To', 'note': 'Unknown Regions, é'},
+    [],
+    {'name': 'Hoth', 'moons': 3, 'empty': ''},
+    'Jakku'
+]
+
+
+@pytest.fixture
+def ndjson_filepath(tmp_path):
+    filepath = tmp_path / 'records.ndjson'
+    assert utl.write_ndjson(filepath, iter(RECORDS)) == len(RECORDS)
+    return filepath
+
+
+def test_records_round_trip(ndjson_filepath):
+    assert list(utl.iter_ndjson(ndjson_filepath)) == RECORDS
+
+
+def test_append_adds_records(ndjson_filepath):
+    utl.write_ndjson(ndjson_filepath, [{'name': 'Naboo'}], append=True)
+    assert list(utl.iter_ndjson(ndjson_filepath)) == RECORDS + [{'name': 'Naboo'}]
+
+
+@pytest.mark.parametrize('parts', [1, 2, 3, 5, 64])
+def test_split_ranges_yield_every_record_once(ndjson_filepath, parts):
+    ranges = utl.split_ndjson(ndjson_filepath, parts)
+    assert len(ranges) == parts
+    assert [record for start, end in ranges for record in utl.iter_ndjson(ndjson_filepath, start=start, end=end)] == RECORDS
+
+
+def test_every_split_point_yields_every_record_once(ndjson_filepath):
+    size = ndjson_filepath.stat().st_size
+    for offset in range(size + 1):
+        head = list(utl.iter_ndjson(ndjson_filepath, end=offset))
+        tail = list(utl.iter_ndjson(ndjson_filepath, start=offset))
+        assert head + tail == RECORDS, offset
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    filepath = tmp_path / 'records.ndjson'
+    filepath.write_bytes(b'{"a": 1}\n\n   \n{"b": 2}\n')
+    assert list(utl.iter_ndjson(filepath)) == [{'a': 1}, {'b': 2}]
+
+
+def test_incomplete_final_line_is_ignored(ndjson_filepath):
+    with open(ndjson_filepath, 'ab') as file_obj:
+        file_obj.write(json.dumps({'name': 'Mustafar'}).encode('utf-8')[:-3])
+    assert list(utl.iter_ndjson(ndjson_filepath)) == RECORDS
+
+
+def test_corrupt_line_raises(tmp_path):
+    filepath = tmp_path / 'records.ndjson'
+    filepath.write_bytes(b'{"a": 1}\n{"b": \n{"c": 3}\n')
+    with pytest.raises(ValueError):
+        list(utl.iter_ndjson(filepath))
@@ -0,0 +1,77 @@
+import json
+import os
+import stat
+
+import pytest
+
+import five_oh_six as utl
+
+
+def test_write_json_skips_unchanged_content(tmp_path):
+    filepath = tmp_path / 'stu-r2_d2.json'
+    assert utl.write_json(filepath, {'name': 'R2-D2'}) is True
+    os.utime(filepath, (0, 0))
+    assert utl.write_json(filepath, {'name': 'R2-D2'}) is False
+    assert filepath.stat().st_mtime == 0
+    assert utl.write_json(filepath, {'name': 'R2-D3'}) is True
+    assert json.loads(filepath.read_text(encoding='utf-8')) == {'name': 'R2-D3'}
+
+
+def test_write_preserves_permissions(tmp_path):
+    filepath = tmp_path / 'out.json'
+    utl.write_json(filepath, [1])
+    os.chmod(filepath, 0o640)
+    utl.write_json(filepath, [2])
+    assert stat.S_IMODE(filepath.stat().st_mode) == 0o640
+
+
+def test_failed_write_leaves_previous_file_and_no_temp_file(tmp_path, monkeypatch):
+    filepath = tmp_path / 'CACHE.json'
+    utl.write_json(filepath, {'a': 1}, compact=True)
+
+    def replace(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(utl.os, 'replace', replace)
+    with pytest.raises(OSError):
+        utl.compact_cache(str(filepath), {'a': 1, 'b': 2})
+    assert utl.read_json(filepath) == {'a': 1}
+    assert os.listdir(tmp_path) == ['CACHE.json']
+
+
+def test_output_writer_snapshots_data_and_flushes_concurrently(tmp_path):
+    writer = utl.OutputWriter(max_workers=4)
+    tatooine = {'name': 'Tatooine', 'version': 0}
+    writer.write_json(tmp_path / 'v1p0.json', tatooine)
+    tatooine['version'] = 1
+    writer.write_json(tmp_path / 'v1p1.json', tatooine)
+    for number in range(20):
+        writer.write_json(tmp_path / f"stu-{number}.json", {'number': number})
+    writer.write_json(tmp_path / 'stu-0.json', {'number': 'last wins'})
+    assert not list(tmp_path.iterdir()) # nothing written before flush()
+
+    results = writer.flush()
+    assert len(results) == 22 and all(results.values())
+    assert len(writer) == 0
+    assert utl.read_json(tmp_path / 'v1p0.json')['version'] == 0
+    assert utl.read_json(tmp_path / 'v1p1.json')['version'] == 1
+    assert utl.read_json(tmp_path / 'stu-0.json') == {'number': 'last wins'}
+
+    writer.write_json(tmp_path / 'stu-1.json', {'number': 1})
+    assert writer.flush() == {tmp_path / 'stu-1.json': False}
+
+
+def test_output_writer_flushes_when_an_error_is_raised(tmp_path):
+    with pytest.raises(KeyError):
+        with utl.OutputWriter() as writer:
+            writer.write_json(tmp_path / 'done.json', {'done': True})
+            raise KeyError('name')
+    assert utl.read_json(tmp_path / 'done.json') == {'done': True}
+
+
+def test_output_writer_keeps_original_error_if_flush_fails(tmp_path):
+    with pytest.raises(KeyError) as info:
+        with utl.OutputWriter() as writer:
+            writer.write_json(tmp_path / 'missing' / 'out.json', {})
+            raise KeyError('name')
+    assert any('could not be written' in note for note in info.value.__notes__)
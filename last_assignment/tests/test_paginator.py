@@ -0,0 +1,69 @@
+import pytest
+
+import five_oh_six as utl
+
+
+URL = 'https://swapi.py4e.com/api/people/'
+PARAMS = {'search': 'sky'}
+PAGE_URLS = [f"{URL}?search=sky&page={page}" for page in (2, 3)]
+PAGES = [
+    {'count': 5, 'next': PAGE_URLS[0], 'results': [{'name': 'Luke Skywalker'}, {'name': 'Anakin Skywalker'}]},
+    {'count': 5, 'next': PAGE_URLS[1], 'results': [{'name': 'Shmi Skywalker'}, {'name': 'Leia Skywalker'}]},
+    {'count': 5, 'next': None, 'results': [{'name': 'Ben Skywalker'}]}
+]
+
+
+def stub_pages(monkeypatch, error=None):
+    """Serves < PAGES > in place of the remote API. Requests for the second page raise < error >
+    if one is provided. Returns the list of requested (url, params) pairs."""
+
+    calls = []
+    envelopes = {(URL, 'sky'): PAGES[0], (PAGE_URLS[0], None): PAGES[1], (PAGE_URLS[1], None): PAGES[2]}
+
+    def get_conditional_resource(url, params=None, timeout=10, etag=None, last_modified=None):
+        calls.append((url, params))
+        if error and url == PAGE_URLS[0]:
+            raise error
+        return envelopes[(url, (params or {}).get('search'))], {'etag': None, 'last_modified': None}
+
+    monkeypatch.setattr(utl, 'get_conditional_resource', get_conditional_resource)
+    return calls
+
+
+def test_entities_are_yielded_in_order_across_pages(la, monkeypatch):
+    calls = stub_pages(monkeypatch)
+
+    names = [person['name'] for person in la.iter_swapi_resources(URL, PARAMS)]
+
+    assert names == [person['name'] for page in PAGES for person in page['results']]
+    assert calls == [(URL, PARAMS), (PAGE_URLS[0], None), (PAGE_URLS[1], None)]
+
+
+def test_pages_are_cached(la, monkeypatch):
+    stub_pages(monkeypatch)
+    list(la.iter_swapi_resources(URL, PARAMS))
+
+    calls = stub_pages(monkeypatch)
+    assert len(list(la.iter_swapi_resources(URL, PARAMS))) == 5
+    assert calls == []
+
+
+def test_prefetch_error_reaches_the_caller(la, monkeypatch):
+    stub_pages(monkeypatch, error=utl.requests.ConnectionError('page 2 is down'))
+    resources = la.iter_swapi_resources(URL, PARAMS)
+
+    assert [next(resources)['name'], next(resources)['name']] == ['Luke Skywalker', 'Anakin Skywalker']
+    with pytest.raises(utl.requests.ConnectionError, match='page 2 is down'):
+        next(resources)
+
+
+def test_closing_early_stops_requesting_pages(la, monkeypatch):
+    calls = stub_pages(monkeypatch)
+    resources = la.iter_swapi_resources(URL, PARAMS)
+
+    assert next(resources)['name'] == 'Luke Skywalker'
+    resources.close()
+
+    assert calls == [(URL, PARAMS), (PAGE_URLS[0], None)] # only the prefetched page
+    with pytest.raises(StopIteration):
+        next(resources)
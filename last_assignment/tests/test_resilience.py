@@ -0,0 +1,97 @@
+import pytest
+import requests
+
+import five_oh_six as utl
+
+from conftest import FakeSession
+
+
+URL = 'https://swapi.test/api/people/1/'
+
+
+@pytest.fixture(autouse=True)
+def resilience(monkeypatch):
+    monkeypatch.setattr(utl, 'cassette', None)
+    utl.configure_resilience(utl.RetryPolicy(max_attempts=3, backoff=0))
+    yield
+    utl.configure_resilience()
+
+
+def test_transient_errors_are_retried():
+    session = FakeSession(requests.ConnectionError(), 503, 200)
+    assert utl.send_request(URL, session=session).status_code == 200
+    assert session.calls == 3
+    assert utl.get_resilience_stats()['retry'] == {'attempts': 3, 'retries': 2, 'give_ups': 0}
+
+
+def test_final_failure_is_raised():
+    session = FakeSession(503, 503, 503)
+    with pytest.raises(requests.HTTPError):
+        utl.send_request(URL, session=session)
+    assert utl.get_resilience_stats()['retry']['give_ups'] == 1
+
+
+@pytest.mark.parametrize('exception', [
+    requests.exceptions.MissingSchema(), requests.exceptions.InvalidURL(), requests.exceptions.InvalidHeader()
+])
+def test_permanent_errors_are_not_retried_or_counted(exception):
+    session = FakeSession(exception)
+    with pytest.raises(type(exception)):
+        utl.send_request(URL, session=session)
+    assert session.calls == 1
+    assert utl.get_circuit_breaker('swapi.test').stats()['failures'] == 0
+
+
+def test_client_errors_are_returned():
+    assert utl.send_request(URL, session=FakeSession(404)).status_code == 404
+
+
+def test_breaker_opens_half_opens_and_closes(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(utl.time, 'monotonic', lambda: now[0])
+    utl.configure_resilience(utl.RetryPolicy(max_attempts=1), failure_threshold=2, reset_timeout=30)
+    breaker = utl.get_circuit_breaker('swapi.test')
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            utl.send_request(URL, session=FakeSession(500))
+    assert breaker.state == 'open'
+    with pytest.raises(utl.CircuitOpenError):
+        utl.send_request(URL, session=FakeSession(200))
+
+    now[0] += 30
+    with pytest.raises(requests.HTTPError):
+        utl.send_request(URL, session=FakeSession(500)) # failed trial
+    assert breaker.state == 'open'
+
+    now[0] += 30
+    assert utl.send_request(URL, session=FakeSession(200)).status_code == 200
+    assert breaker.stats() == {'state': 'closed', 'successes': 1, 'failures': 3, 'rejections': 1, 'trips': 2}
+
+
+def test_trial_ending_in_unexpected_error_does_not_block_breaker(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(utl.time, 'monotonic', lambda: now[0])
+    utl.configure_resilience(utl.RetryPolicy(max_attempts=1), failure_threshold=1, reset_timeout=30)
+    with pytest.raises(requests.HTTPError):
+        utl.send_request(URL, session=FakeSession(500))
+
+    now[0] += 30
+    with pytest.raises(KeyError):
+        utl.send_request(URL, session=FakeSession(KeyError('boom')))
+    assert utl.send_request(URL, session=FakeSession(200)).status_code == 200
+
+
+def test_rate_limits_are_applied_per_host():
+    utl.configure_resilience(rate_limits={'swapi.test': (100, 5)})
+    assert utl.get_rate_limiter('swapi.test').capacity == 5
+    assert utl.get_rate_limiter('example.test') is None
+
+
+@pytest.mark.parametrize('rate, capacity', [(0, None), (-1, None), (float('nan'), None), (10, 0), (10, 0.5)])
+def test_invalid_rate_limits_are_rejected(rate, capacity):
+    with pytest.raises(ValueError):
+        utl.TokenBucket(rate, capacity)
+    with pytest.raises(ValueError):
+        utl.configure_resilience(rate_limits={'swapi.test': (rate, capacity)})
+        utl.get_rate_limiter('swapi.test')
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+import five_oh_six as utl
+
+
+NONE_VALUES = ('', 'n/a', 'none', 'unknown')
+
+# Expected values are those returned by the original try/except implementations.
+FLOAT_CASES = [
+    ('5,000,000', 5000000.0), ('5,000,000.9999', 5000000.9999), (' 42 ', 42.0), ('-3.5', -3.5),
+    ('+7', 7.0), ('.5', 0.5), ('1e3', 1000.0), ('1,2', 12.0), ('１２', 12.0), ('inf', math.inf),
+    ('unknown', 'unknown'), ('N/A', 'N/A'), ('', ''), ('0x10', '0x10'), ('12abc', '12abc'),
+    ('1 standard', '1 standard'), ('19BBY', '19BBY'), (None, None), (True, True), (3, 3), (2.9, 2.9)
+]
+
+INT_CASES = [
+    ('5,000,000', 5000000), ('5,000,000.9999', 5000000), (' 42 ', 42), ('-3.5', -3), ('+7', 7),
+    ('.5', 0), ('1e3', 1000), ('1,2', 12), ('１２', 12), ('nan', 'nan'), ('inf', 'inf'),
+    ('unknown', 'unknown'), ('', ''), ('12abc', '12abc'), (None, None), (True, 1), (3, 3),
+    (2.9, 2), (math.inf, math.inf)
+]
+
+
+def assert_same(actual, expected):
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+@pytest.mark.parametrize('value, expected', FLOAT_CASES)
+def test_to_float(value, expected):
+    assert_same(utl.to_float(value), expected)
+
+
+def test_to_float_nan():
+    assert math.isnan(utl.to_float('nan'))
+
+
+@pytest.mark.parametrize('value, expected', INT_CASES)
+def test_to_int(value, expected):
+    assert_same(utl.to_int(value), expected)
+
+
+@pytest.mark.parametrize('value, delimiter, expected', [
+    (' a, b ', ', ', ['a', 'b']), ('a  b', None, ['a', 'b']), (None, ', ', None), (3, ', ', 3)
+])
+def test_to_list(value, delimiter, expected):
+    assert_same(utl.to_list(value, delimiter), expected)
+
+
+@pytest.mark.parametrize('value, expected', [
+    (' N/A ', None), ('UNKNOWN', None), ('', None), ('Tatooine', 'Tatooine'), (0, 0), (None, None)
+])
+def test_to_none(value, expected):
+    assert_same(utl.to_none(value, NONE_VALUES), expected)
+
+
+def test_to_none_accepts_changing_none_values():
+    assert utl.to_none('none', NONE_VALUES) is None
+    assert utl.to_none('none', ('n/a',)) == 'none'
+    assert utl.to_none('x', ['x']) is None
@@ -0,0 +1,40 @@
+import threading
+
+import five_oh_six as utl
+
+
+def test_concurrent_first_use_shares_one_session(monkeypatch):
+    monkeypatch.setattr(utl, 'session', None)
+    created = []
+    create_session = utl.create_session
+    never_set = threading.Event()
+
+    def slow_create_session(*args, **kwargs):
+        created.append(1)
+        never_set.wait(0.05) # widen the race window
+        return create_session(*args, **kwargs)
+
+    monkeypatch.setattr(utl, 'create_session', slow_create_session)
+    sessions = []
+    start = threading.Barrier(8)
+
+    def worker():
+        start.wait()
+        sessions.append(utl.get_session())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert len({id(session) for session in sessions}) == 1
+    sessions[0].close()
+
+
+def test_create_session_mounts_host_pools():
+    session = utl.create_session(pool_maxsize=4, host_pool_sizes={'swapi.py4e.com': 20})
+    assert session.get_adapter('https://swapi.py4e.com/api/').poolmanager.connection_pool_kw['maxsize'] == 20
+    assert session.get_adapter('https://example.com/').poolmanager.connection_pool_kw['maxsize'] == 4
+    session.close()
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+import requests
+
+import five_oh_six as utl
+
+from conftest import PACKAGE_DIR
+
+
+@pytest.fixture
+def cache_filepath(package_dir, tmp_path, monkeypatch):
+    """A copy of the production cache whose journal ends with a damaged record."""
+
+    import swapi_standin
+
+    filepath = str(tmp_path / 'CACHE.json')
+    utl.write_json(filepath, utl.read_json(os.path.join(PACKAGE_DIR, 'CACHE.json')))
+    utl.append_cache_entry(filepath, utl.create_cache_key('https://swapi.py4e.com/api/people/1/'), {
+        'name': 'Luke Skywalker', 'url': 'https://swapi.py4e.com/api/people/1/'
+        })
+    with open(f"{filepath}{utl.CACHE_JOURNAL_SUFFIX}", 'a', encoding='utf-8') as file_obj:
+        file_obj.write('{"key": "partial') # crash mid-write
+    monkeypatch.setattr(swapi_standin, 'CACHE_FILEPATH', filepath)
+    return filepath
+
+
+@pytest.fixture
+def server(cache_filepath):
+    import swapi_standin
+
+    server = swapi_standin.create_server(port=0, page_size=3)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def read_files(filepath):
+    contents = []
+    for path in (filepath, f"{filepath}{utl.CACHE_JOURNAL_SUFFIX}"):
+        with open(path, 'rb') as file_obj:
+            contents.append(file_obj.read())
+    return contents
+
+
+def test_catalog_load_does_not_modify_the_cache(cache_filepath):
+    import swapi_standin
+
+    before = read_files(cache_filepath)
+    catalog = swapi_standin.create_catalog('http://standin.test/api')
+
+    assert read_files(cache_filepath) == before
+    assert 'Luke Skywalker' in [record['name'] for record in catalog['people']] # journaled record
+
+
+def test_search(server):
+    envelope = requests.get(f"{server.base_url}/people/", params={'search': 'skywalker'}, timeout=5).json()
+
+    assert envelope['count'] >= 2
+    assert all('skywalker' in person['name'].lower() for person in envelope['results'])
+    assert requests.get(envelope['results'][0]['url'], timeout=5).json() == envelope['results'][0]
+
+
+def test_pagination(server, la):
+    planets = list(la.iter_swapi_resources(f"{server.base_url}/planets/"))
+
+    assert len(planets) == len(server.catalog['planets']) > 3
+    assert [planet['url'] for planet in planets] == [planet['url'] for planet in server.catalog['planets']]
+
+
+def test_standin_endpoint_uses_its_own_cache(tmp_path):
+    environ = {**os.environ, 'SWAPI_ENDPOINT': 'http://127.0.0.1:8506/api', 'PYTHONPATH': PACKAGE_DIR}
+    environ.pop('SWAPI_CACHE', None)
+    result = subprocess.run(
+        [sys.executable, '-c', 'import last_assignment; print(last_assignment.CACHE_FILEPATH)'],
+        cwd=tmp_path, env=environ, capture_output=True, text=True, check=True
+        )
+
+    assert result.stdout.strip() == './CACHE-standin.json'
+    assert os.listdir(tmp_path) == []
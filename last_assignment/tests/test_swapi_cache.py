@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+
+import five_oh_six as utl
+
+
+URL = 'https://swapi.py4e.com/api/people/1/'
+RESOURCE = {'name': 'Luke Skywalker', 'url': URL}
+
+
+def stub_remote(monkeypatch, etag=None, last_modified=None, resource=RESOURCE):
+    calls = []
+
+    def get_conditional_resource(url, params=None, timeout=10, etag_sent=None, last_modified_sent=None):
+        calls.append((url, etag_sent, last_modified_sent))
+        return resource, {'etag': etag or etag_sent, 'last_modified': last_modified or last_modified_sent}
+
+    monkeypatch.setattr(utl, 'get_conditional_resource', get_conditional_resource)
+    return calls
+
+
+def wait_for_waiters(flight, key, count, timeout=5):
+    """Blocks until < count > callers are waiting on the in-flight call keyed by < key >."""
+
+    deadline = time.monotonic() + timeout
+    while flight.waiters(key) < count:
+        assert time.monotonic() < deadline, f"{flight.waiters(key)} of {count} callers joined the flight"
+        time.sleep(0.001)
+
+
+def test_meta_is_not_stored_without_ttl_or_validators(la, monkeypatch):
+    stub_remote(monkeypatch)
+    assert la.refresh_swapi_resource(URL) == RESOURCE
+    assert list(la.cache) == [utl.create_cache_key(URL)]
+
+
+def test_meta_is_stored_with_validators(la, monkeypatch):
+    stub_remote(monkeypatch, etag='"v1"')
+    la.refresh_swapi_resource(URL)
+    meta = la.cache[utl.create_cache_meta_key(utl.create_cache_key(URL))]
+    assert meta['etag'] == '"v1"'
+
+    calls = stub_remote(monkeypatch, resource=None) # 304 Not Modified
+    assert la.refresh_swapi_resource(URL) == RESOURCE
+    assert calls == [(URL, '"v1"', None)]
+
+
+def test_meta_is_stored_with_ttl(la, monkeypatch):
+    monkeypatch.setitem(la.CACHE_TTL, 'people', 60)
+    stub_remote(monkeypatch)
+    la.refresh_swapi_resource(URL)
+    assert utl.create_cache_meta_key(utl.create_cache_key(URL)) in la.cache
+    assert not la.is_swapi_resource_expired(URL)
+
+
+def test_bulk_fetch_skips_unneeded_meta(la, monkeypatch):
+    stub_remote(monkeypatch)
+    assert la.get_swapi_resources([URL, (URL, None)]) == [RESOURCE, RESOURCE]
+    assert list(la.cache) == [utl.create_cache_key(URL)]
+    assert utl.create_cache(la.CACHE_FILEPATH) == la.cache # journal replayed
+
+
+def test_concurrent_misses_are_coalesced(la, monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def get_conditional_resource(url, params=None, timeout=10, etag=None, last_modified=None):
+        calls.append(url)
+        release.wait(5)
+        return RESOURCE, {'etag': None, 'last_modified': None}
+
+    monkeypatch.setattr(utl, 'get_conditional_resource', get_conditional_resource)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(la.get_swapi_resource(URL))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    wait_for_waiters(la.inflight, utl.create_cache_key(URL), 7) # every follower joined the flight
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [URL]
+    assert results == [RESOURCE] * 8
+
+
+def test_leader_rechecks_cache_inside_flight(la, monkeypatch):
+    calls = stub_remote(monkeypatch)
+    key = utl.create_cache_key(URL)
+    la.cache[key] = RESOURCE # refreshed by a previous leader after this caller missed
+    assert la.inflight.do(key, la.fetch_swapi_resource, URL) == RESOURCE
+    assert calls == []
+
+
+def test_single_flight_shares_exceptions():
+    flight = utl.SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError('upstream')
+
+    def call():
+        try:
+            flight.do('key', fail)
+        except ValueError as error:
+            errors.append(error)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    wait_for_waiters(flight, 'key', 3)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(errors) == 4 and len({id(error) for error in errors}) == 1
+    assert flight.waiters('key') == 0
+
+
+async def release_when_waiting(flight, key, count, release):
+    """Sets < release > once < count > coroutines are waiting on the in-flight call keyed by < key >."""
+
+    while flight.waiters(key) < count:
+        await asyncio.sleep(0)
+    release.set()
+
+
+def test_async_calls_are_coalesced():
+    flight = utl.SingleFlight()
+    calls = []
+
+    async def main():
+        release = asyncio.Event()
+
+        async def fetch(value):
+            calls.append(value)
+            await release.wait()
+            return {'value': value}
+
+        *results, _ = await asyncio.gather(
+            *(flight.do_async('key', fetch, value) for value in range(4)),
+            release_when_waiting(flight, 'key', 3, release)
+            )
+        return results
+
+    results = asyncio.run(main())
+
+    assert calls == [0]
+    assert results == [{'value': 0}] * 4 and len({id(result) for result in results}) == 1
+    assert flight.shared == 3 and flight.waiters('key') == 0
+
+
+def test_async_calls_share_exceptions():
+    flight = utl.SingleFlight()
+
+    async def main():
+        release = asyncio.Event()
+
+        async def fail():
+            await release.wait()
+            raise ValueError('upstream')
+
+        *errors, _ = await asyncio.gather(
+            *(flight.do_async('key', fail) for _ in range(4)),
+            release_when_waiting(flight, 'key', 3, release),
+            return_exceptions=True
+            )
+        return errors
+
+    errors = asyncio.run(main())
+
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert len({id(error) for error in errors}) == 1